@@ -4,22 +4,28 @@ __version__ = "1.8.8"
 
 __all__ = [
     "ESPN",
+    "AsyncESPN",
+    "AsyncFotMob",
+    "AsyncSofascore",
+    "AsyncUnderstat",
     "ClubElo",
     "FBref",
     "FotMob",
     "MatchHistory",
+    "ScrapeJob",
     "SoFIFA",
     "Sofascore",
     "Understat",
     "WhoScored",
 ]
 
+from ._jobs import ScrapeJob
 from .clubelo import ClubElo
-from .espn import ESPN
+from .espn import ESPN, AsyncESPN
 from .fbref import FBref
-from .fotmob import FotMob
+from .fotmob import AsyncFotMob, FotMob
 from .match_history import MatchHistory
-from .sofascore import Sofascore
+from .sofascore import AsyncSofascore, Sofascore
 from .sofifa import SoFIFA
-from .understat import Understat
+from .understat import AsyncUnderstat, Understat
 from .whoscored import WhoScored
@@ -0,0 +1,299 @@
+"""Command line interface to manage the local cache of soccerdata."""
+
+import argparse
+import sys
+import time
+from collections.abc import Sequence
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from ._cache import (
+    COMPRESSION_METHODS,
+    get_cache_backend,
+    import_archive,
+    read_archive_manifest,
+    recompress,
+)
+from ._common import CACHE_INTERNAL_DIRS
+from ._config import DATA_DIR, logger
+
+# Files in the data directory that are not cached downloads
+INTERNAL_FILES = ("cache.sqlite", "cache.sqlite-wal", "cache.sqlite-shm")
+INTERNAL_DIRS = (".ratelimit", *CACHE_INTERNAL_DIRS)
+
+READERS = (
+    "ClubElo",
+    "ESPN",
+    "FBref",
+    "FotMob",
+    "MatchHistory",
+    "SoFIFA",
+    "Sofascore",
+    "Understat",
+    "WhoScored",
+)
+
+# The read_* method that downloads the match pages of each reader, with the
+# arguments to use when warming the cache
+WARMERS: dict[str, tuple[str, dict[str, Any]]] = {
+    "ESPN": ("read_matchsheet", {}),
+    "FBref": ("read_player_match_stats", {}),
+    "FotMob": ("read_team_match_stats", {}),
+    "Understat": ("read_shot_events", {}),
+    "WhoScored": ("read_events", {"output_fmt": None, "on_error": "skip"}),
+}
+
+# Time after kick-off after which a match is assumed to be finished
+MATCH_DURATION = timedelta(hours=2)
+
+
+def _cached_files(root: Path) -> list[Path]:
+    return sorted(
+        path
+        for path in root.rglob("*")
+        if path.is_file()
+        and path.name not in INTERNAL_FILES
+        and path.suffix != ".tmp"
+        and not any(part in INTERNAL_DIRS for part in path.relative_to(root).parts)
+    )
+
+
+def compress_cache(args: argparse.Namespace) -> int:
+    """Recompress all cached files in place."""
+    size_before, size_after = 0, 0
+    for root in args.paths or [DATA_DIR]:
+        files = _cached_files(root)
+        logger.info("Recompressing %d files in %s with '%s'", len(files), root, args.method)
+        for path in files:
+            before, after = recompress(path, args.method)
+            size_before += before
+            size_after += after
+    logger.info("The cache now takes %d bytes (was %d bytes)", size_after, size_before)
+    return 0
+
+
+def export_cache(args: argparse.Namespace) -> int:
+    """Pack the cached data of a reader into an archive."""
+    import soccerdata
+
+    selection = {"leagues": args.leagues, "seasons": args.seasons}
+    reader = getattr(soccerdata, args.reader)(
+        **{key: value for key, value in selection.items() if value is not None}
+    )
+    reader.export_cache(args.archive, compression=args.method)
+    return 0
+
+
+def import_cache(args: argparse.Namespace) -> int:
+    """Unpack an archive into the cache."""
+    manifest = read_archive_manifest(args.archive)
+    root = args.data_dir or DATA_DIR / manifest["directory"]
+    count = import_archive(args.archive, root, get_cache_backend())
+    logger.info("Imported %d cached %s files into %s", count, manifest["reader"], root)
+    return 0
+
+
+def kickoff_times(schedule: pd.DataFrame) -> pd.Series:
+    """Return the kick-off time of each game in a schedule.
+
+    Parameters
+    ----------
+    schedule : pd.DataFrame
+        The schedule returned by a reader, with a 'date' column and an
+        optional 'time' column. Dates without a time zone are assumed to be
+        in UTC.
+
+    Returns
+    -------
+    pd.Series
+        The kick-off time of each game in UTC.
+    """
+    dates = pd.to_datetime(schedule["date"], utc=True)
+    if "time" in schedule:
+        # FBref has the kick-off time in a separate column, in the local time
+        # of the venue, which is assumed to be UTC. Games without a kick-off
+        # time are assumed to kick off at the end of the day.
+        times = pd.to_timedelta(
+            schedule["time"].astype(str).str.extract(r"(\d{1,2}:\d{2})", expand=False) + ":00",
+            errors="coerce",
+        )
+        dates = dates.dt.normalize() + times.fillna(timedelta(days=1))
+    return dates
+
+
+def recent_games(schedule: pd.DataFrame, hours: float, now: Optional[pd.Timestamp] = None) -> list:
+    """Return the ids of the games that finished in the last `hours` hours.
+
+    Parameters
+    ----------
+    schedule : pd.DataFrame
+        The schedule returned by a reader, with a 'date' and 'game_id' column.
+        See :func:`kickoff_times` for how the kick-off time is determined.
+    hours : float
+        Only games that finished less than this number of hours ago are
+        returned.
+    now : pd.Timestamp, optional
+        The current time. Defaults to the system time.
+
+    Returns
+    -------
+    list
+        The game ids.
+    """
+    now = pd.Timestamp.now(tz="UTC") if now is None else now
+    ends = kickoff_times(schedule) + MATCH_DURATION
+    mask = (ends <= now) & (ends > now - timedelta(hours=hours)) & schedule["game_id"].notna()
+    return schedule.loc[mask, "game_id"].tolist()
+
+
+def _warm(name: str, reader: Any, hours: float) -> None:
+    method, kwargs = WARMERS[name]
+    game_ids = recent_games(reader.read_schedule(), hours)
+    if not game_ids:
+        logger.info("%s: no games finished in the last %s hours", name, hours)
+        return
+    logger.info("%s: prefetching %d games", name, len(game_ids))
+    getattr(reader, method)(match_id=game_ids, **kwargs)
+
+
+def warm_cache(args: argparse.Namespace) -> int:
+    """Prefetch the data of recently finished games."""
+    import soccerdata
+
+    readers = {
+        name: getattr(soccerdata, name)(leagues=args.leagues, seasons=args.seasons)
+        for name in args.readers
+    }
+    while True:
+        for name, reader in readers.items():
+            try:
+                _warm(name, reader, args.hours)
+            except Exception:  # noqa: BLE001 - keep warming the other readers
+                logger.exception("Failed to warm the cache of %s", name)
+        if args.interval is None:
+            return 0
+        logger.info("Warming the cache again in %d seconds", args.interval)
+        time.sleep(args.interval)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command line interface.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        The command line arguments. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        The exit code.
+    """
+    parser = argparse.ArgumentParser(prog="soccerdata", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_compress = subparsers.add_parser(
+        "compress-cache",
+        help="Recompress the cached data in place.",
+        description=(
+            "Recompress the cached data in place. Do not compress WhoScored "
+            "event data that is read with socceraction's OptaLoader."
+        ),
+    )
+    parser_compress.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help=f"Directories with cached data (default: {DATA_DIR}).",
+    )
+    parser_compress.add_argument(
+        "--method",
+        choices=COMPRESSION_METHODS,
+        default="gzip",
+        help="Compression method, use 'none' to decompress (default: %(default)s).",
+    )
+    parser_compress.set_defaults(func=compress_cache)
+
+    parser_export = subparsers.add_parser(
+        "export-cache",
+        help="Pack the cached data of a reader into an archive.",
+        description=(
+            "Pack the cached data of the selected leagues and seasons into a "
+            "single archive, which can be unpacked on another machine with "
+            "import-cache."
+        ),
+    )
+    parser_export.add_argument(
+        "reader", choices=READERS, help="The reader to export the cache of."
+    )
+    parser_export.add_argument("archive", type=Path, help="Path of the archive to create.")
+    parser_export.add_argument("--leagues", nargs="+", help="Leagues to export (default: all).")
+    parser_export.add_argument(
+        "--seasons", nargs="+", help="Seasons to export (default: the most recent seasons)."
+    )
+    parser_export.add_argument(
+        "--method",
+        choices=COMPRESSION_METHODS,
+        default="gzip",
+        help="Compression method of the archive (default: %(default)s).",
+    )
+    parser_export.set_defaults(func=export_cache)
+
+    parser_import = subparsers.add_parser(
+        "import-cache",
+        help="Unpack an archive created by export-cache into the cache.",
+        description=(
+            "Unpack an archive created by export-cache into the cache. The "
+            "files keep their original time of download. Files that are "
+            "already cached and are at least as recent are kept."
+        ),
+    )
+    parser_import.add_argument("archive", type=Path, help="Path of the archive.")
+    parser_import.add_argument(
+        "--data-dir",
+        type=Path,
+        help=f"Directory to unpack the files in (default: the reader's directory in {DATA_DIR}).",
+    )
+    parser_import.set_defaults(func=import_cache)
+
+    parser_warm = subparsers.add_parser(
+        "warm",
+        help="Prefetch the data of recently finished games.",
+        description=(
+            "Read the schedule of each reader and download the match pages of "
+            "the games that finished recently, such that subsequent reads are "
+            "served from the cache. The rate limits of the readers are respected."
+        ),
+    )
+    parser_warm.add_argument(
+        "readers",
+        nargs="+",
+        choices=sorted(WARMERS),
+        help="The readers to warm the cache of.",
+    )
+    parser_warm.add_argument("--leagues", nargs="+", help="Leagues to warm (default: all).")
+    parser_warm.add_argument(
+        "--seasons", nargs="+", help="Seasons to warm (default: the most recent seasons)."
+    )
+    parser_warm.add_argument(
+        "--hours",
+        type=float,
+        default=24,
+        help="Prefetch games that finished in the last HOURS hours (default: %(default)s).",
+    )
+    parser_warm.add_argument(
+        "--interval",
+        type=int,
+        help="Keep running and warm the cache again every INTERVAL seconds.",
+    )
+    parser_warm.set_defaults(func=warm_cache)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
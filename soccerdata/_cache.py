@@ -0,0 +1,717 @@
+"""Backends that keep track of the locally cached data."""
+
+import gzip
+import hashlib
+import io
+import json
+import mmap
+import os
+import pickle
+import sqlite3
+import tarfile
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Callable, NamedTuple, Optional, TypeVar
+
+from ._config import CACHE_BACKEND, DATA_DIR, logger
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+COMPRESSION_METHODS = ("none", "gzip", "zstd")
+ARCHIVE_MANIFEST = "manifest.json"
+
+T = TypeVar("T")
+
+
+class CacheEntry(NamedTuple):
+    """Metadata of a cached download."""
+
+    url: Optional[str]
+    path: Path
+    fetched_at: datetime
+    etag: Optional[str]
+    last_modified: Optional[str]
+    size: int
+
+
+class CacheBackend(ABC):
+    """Base class for cache backends.
+
+    The downloaded data itself is always stored in the file that a reader
+    passes to :meth:`BaseReader.get`, such that other tools can keep reading
+    these files. A cache backend keeps track of which files are available
+    and when they were downloaded.
+    """
+
+    @abstractmethod
+    def lookup(self, filepath: Path) -> Optional[CacheEntry]:
+        """Return the metadata of the data cached at `filepath`.
+
+        Parameters
+        ----------
+        filepath : Path
+            Path where the data is cached.
+
+        Returns
+        -------
+        CacheEntry or None
+            None if no data is cached at `filepath`.
+        """
+
+    @abstractmethod
+    def record(
+        self,
+        url: str,
+        filepath: Path,
+        size: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Register that the data at `url` was downloaded to `filepath`.
+
+        Parameters
+        ----------
+        url : str
+            URL of the downloaded data.
+        filepath : Path
+            Path where the data is cached.
+        size : int
+            Size of the uncompressed data in bytes.
+        etag : str, optional
+            The ETag header of the response.
+        last_modified : str, optional
+            The Last-Modified header of the response.
+        """
+
+    @abstractmethod
+    def touch(self, filepath: Path) -> None:
+        """Mark the data cached at `filepath` as fetched just now.
+
+        This is used when the server confirms that the cached data is still
+        up-to-date.
+
+        Parameters
+        ----------
+        filepath : Path
+            Path where the data is cached.
+        """
+
+    @abstractmethod
+    def remove(self, filepath: Path) -> None:
+        """Forget the data cached at `filepath`.
+
+        Parameters
+        ----------
+        filepath : Path
+            Path where the data is cached.
+        """
+
+    @abstractmethod
+    def restore(self, entry: CacheEntry) -> None:
+        """Register data that was copied into the cache from elsewhere.
+
+        Unlike :meth:`record`, the original time of download is kept, such
+        that the data does not look fresher than it is.
+
+        Parameters
+        ----------
+        entry : CacheEntry
+            Metadata of the data cached at ``entry.path``.
+        """
+
+
+class FileCache(CacheBackend):
+    """Cache backend that uses the file system as the index.
+
+    Each lookup results in a ``stat`` call on the cached file, and the
+    modification time of the file is used as the time of download. Response
+    validators are not stored, hence stale data is always downloaded again.
+    """
+
+    def lookup(self, filepath: Path) -> Optional[CacheEntry]:
+        """Return the metadata of the data cached at `filepath`."""
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return None
+        return CacheEntry(
+            url=None,
+            path=filepath,
+            fetched_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            etag=None,
+            last_modified=None,
+            size=stat.st_size,
+        )
+
+    def record(
+        self,
+        url: str,
+        filepath: Path,
+        size: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Register that the data at `url` was downloaded to `filepath`."""
+
+    def touch(self, filepath: Path) -> None:
+        """Mark the data cached at `filepath` as fetched just now."""
+        os.utime(filepath)
+
+    def remove(self, filepath: Path) -> None:
+        """Forget the data cached at `filepath`."""
+
+    def restore(self, entry: CacheEntry) -> None:
+        """Register data that was copied into the cache from elsewhere."""
+        timestamp = entry.fetched_at.timestamp()
+        os.utime(entry.path, (timestamp, timestamp))
+
+
+class SQLiteCache(CacheBackend):
+    """Cache backend that keeps an index of the cached files in SQLite.
+
+    A freshness check is a single indexed lookup and does not touch the
+    cached file itself. The ETag and Last-Modified headers of each response
+    are stored, such that stale data can be revalidated with a conditional
+    request. Files that were cached before the index existed are
+    added to the index the first time they are looked up.
+
+    Parameters
+    ----------
+    db_path : Path
+        Path of the SQLite database.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._local = threading.local()
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Return the database connection of the current thread."""
+        if not hasattr(self._local, "conn"):
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "path TEXT PRIMARY KEY, url TEXT, fetched_at REAL NOT NULL, "
+                "etag TEXT, last_modified TEXT, size INTEGER NOT NULL)"
+            )
+            self._local.conn = conn
+        return self._local.conn
+
+    def lookup(self, filepath: Path) -> Optional[CacheEntry]:
+        """Return the metadata of the data cached at `filepath`."""
+        row = self._conn.execute(
+            "SELECT url, fetched_at, etag, last_modified, size FROM entries WHERE path = ?",
+            (str(filepath),),
+        ).fetchone()
+        if row is not None:
+            url, fetched_at, etag, last_modified, size = row
+            return CacheEntry(
+                url=url,
+                path=filepath,
+                fetched_at=datetime.fromtimestamp(fetched_at, tz=timezone.utc),
+                etag=etag,
+                last_modified=last_modified,
+                size=size,
+            )
+        # Fall back to files that were cached without an index
+        entry = FileCache().lookup(filepath)
+        if entry is not None:
+            self._insert(entry)
+        return entry
+
+    def record(
+        self,
+        url: str,
+        filepath: Path,
+        size: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Register that the data at `url` was downloaded to `filepath`."""
+        self._insert(
+            CacheEntry(
+                url=url,
+                path=filepath,
+                fetched_at=datetime.now(tz=timezone.utc),
+                etag=etag,
+                last_modified=last_modified,
+                size=size,
+            )
+        )
+
+    def touch(self, filepath: Path) -> None:
+        """Mark the data cached at `filepath` as fetched just now."""
+        self._conn.execute(
+            "UPDATE entries SET fetched_at = ? WHERE path = ?",
+            (datetime.now(tz=timezone.utc).timestamp(), str(filepath)),
+        )
+
+    def remove(self, filepath: Path) -> None:
+        """Forget the data cached at `filepath`."""
+        self._conn.execute("DELETE FROM entries WHERE path = ?", (str(filepath),))
+
+    def restore(self, entry: CacheEntry) -> None:
+        """Register data that was copied into the cache from elsewhere."""
+        self._insert(entry)
+
+    def _insert(self, entry: CacheEntry) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (path, url, fetched_at, etag, last_modified, size) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                str(entry.path),
+                entry.url,
+                entry.fetched_at.timestamp(),
+                entry.etag,
+                entry.last_modified,
+                entry.size,
+            ),
+        )
+
+
+class ParseMemo:
+    """Stores the parsed contents of cached data, keyed by a hash of the data.
+
+    Parsing the same table or JSON document again returns the stored
+    result, even if it is part of a page that changed in the meantime. The
+    results are stored as pickle files in subdirectories of `directory`.
+
+    Parameters
+    ----------
+    directory : Path
+        Directory where the parsed data is stored.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def get(self, namespace: str, content: bytes, parse: Callable[[bytes], T]) -> T:
+        """Return the parsed `content`, parsing it if it was not parsed before.
+
+        Parameters
+        ----------
+        namespace : str
+            Identifies the parse function. Change it whenever the output of
+            the parse function changes.
+        content : bytes
+            The data to parse.
+        parse : callable
+            Function that parses `content`.
+
+        Returns
+        -------
+        The output of ``parse(content)``.
+        """
+        from . import __version__
+
+        key = hashlib.sha1(f"{__version__}/{namespace}".encode() + b"\0" + content).hexdigest()
+        filepath = self.directory / key[:2] / f"{key}.pkl"
+        try:
+            with filepath.open(mode="rb") as fh:
+                return pickle.load(fh)
+        except FileNotFoundError:
+            pass
+        except (EOFError, pickle.UnpicklingError):
+            logger.warning("Ignoring corrupt parsed data in %s", filepath)
+        result = parse(content)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=filepath.parent, suffix=".tmp", delete=False) as tmp:
+            pickle.dump(result, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        Path(tmp.name).replace(filepath)
+        return result
+
+
+_backends: dict[str, CacheBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_cache_backend(name: str = CACHE_BACKEND) -> CacheBackend:
+    """Return the cache backend with the given name.
+
+    Parameters
+    ----------
+    name : str
+        Either 'file' or 'sqlite'. The SQLite index is stored in
+        ``DATA_DIR/cache.sqlite``.
+
+    Raises
+    ------
+    ValueError
+        If the backend does not exist.
+
+    Returns
+    -------
+    CacheBackend
+    """
+    with _backends_lock:
+        if name not in _backends:
+            if name == "file":
+                _backends[name] = FileCache()
+            elif name == "sqlite":
+                _backends[name] = SQLiteCache(DATA_DIR / "cache.sqlite")
+            else:
+                raise ValueError(f"Invalid cache backend: '{name}'. Use 'file' or 'sqlite'.")
+            logger.debug("Using the '%s' cache backend", name)
+        return _backends[name]
+
+
+def _import_zstandard():  # type: ignore
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "The zstandard package is required to use zstd compression. "
+            "Please install it with `pip install zstandard`."
+        )
+    return zstandard
+
+
+def compress(payload: bytes, method: str = "none") -> bytes:
+    """Compress data before it is written to the cache.
+
+    Parameters
+    ----------
+    payload : bytes
+        The data to compress.
+    method : str
+        One of 'none', 'gzip' or 'zstd'.
+
+    Raises
+    ------
+    ValueError
+        If the compression method does not exist.
+    ImportError
+        If the method is 'zstd' but the zstandard package is not installed.
+
+    Returns
+    -------
+    bytes
+    """
+    if method == "none":
+        return payload
+    if method == "gzip":
+        return gzip.compress(payload, compresslevel=6, mtime=0)
+    if method == "zstd":
+        return _import_zstandard().ZstdCompressor().compress(payload)
+    raise ValueError(
+        f"Invalid compression method: '{method}'. Use one of {', '.join(COMPRESSION_METHODS)}."
+    )
+
+
+class MappedFile(io.RawIOBase):
+    """Read-only file-like object backed by a memory-mapped file.
+
+    The pages of the file are shared with all other processes that map the
+    same file, hence large payloads are not copied into the memory of each
+    process that reads them. Use :meth:`getbuffer` to access the data
+    without copying it.
+
+    Parameters
+    ----------
+    fh : file object
+        The file to map. It can be closed after the object is created.
+    """
+
+    def __init__(self, fh: IO[bytes]):
+        self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        chunk = self._view[self._pos : self._pos + len(buffer)]
+        buffer[: len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+    def readall(self) -> bytes:
+        data = self._view[self._pos :].tobytes()
+        self._pos = len(self._view)
+        return data
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def getbuffer(self) -> memoryview:
+        """Return a read-only view of the data without copying it."""
+        return self._view[:]
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+            try:
+                self._mmap.close()
+            except BufferError:
+                # A view returned by getbuffer is still in use. The map is
+                # closed when it is garbage collected.
+                pass
+        super().close()
+
+
+def open_cached(filepath: Path, use_mmap: bool = False) -> IO[bytes]:
+    """Open a cached file for reading and decompress it if needed.
+
+    The compression method is detected from the first bytes of the file,
+    such that compressed and uncompressed files can be mixed in a cache.
+    Gzip files are decompressed while they are read. Zstd files are
+    decompressed at once, since callers may need to seek in the data.
+
+    Parameters
+    ----------
+    filepath : Path
+        Path of the cached file.
+    use_mmap : bool
+        If True, uncompressed files are memory-mapped. See
+        :class:`MappedFile`. Compressed and empty files are read as usual.
+
+    Returns
+    -------
+    io.BufferedIOBase
+        File-like object with the uncompressed data.
+    """
+    fh = filepath.open(mode="rb")
+    magic = fh.read(4)
+    fh.seek(0)
+    if magic.startswith(GZIP_MAGIC):
+        # GzipFile does not close a file object that is passed to it
+        fh.close()
+        return gzip.open(filepath, mode="rb")  # type: ignore
+    if magic == ZSTD_MAGIC:
+        with fh:
+            reader = _import_zstandard().ZstdDecompressor().stream_reader(fh)
+            return io.BytesIO(reader.read())
+    if use_mmap and magic:
+        with fh:
+            return MappedFile(fh)  # type: ignore
+    return fh
+
+
+def recompress(filepath: Path, method: str) -> tuple[int, int]:
+    """Rewrite a cached file with another compression method.
+
+    The file is replaced atomically and keeps its modification time, such
+    that its age in the cache is not affected.
+
+    Parameters
+    ----------
+    filepath : Path
+        Path of the cached file.
+    method : str
+        One of 'none', 'gzip' or 'zstd'.
+
+    Returns
+    -------
+    tuple of int
+        The size of the file before and after recompression.
+    """
+    stat = filepath.stat()
+    with open_cached(filepath) as fh:
+        payload = compress(fh.read(), method)
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    with tmp_path.open(mode="wb") as fh:
+        fh.write(payload)
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    tmp_path.replace(filepath)
+    return stat.st_size, len(payload)
+
+
+@contextmanager
+def _open_archive(archive: Path, mode: str, method: str = "none") -> Iterator[tarfile.TarFile]:
+    """Open a tar archive as a stream, (de)compressing it if needed."""
+    with archive.open(mode=f"{mode}b") as fh:
+        if mode == "r":
+            magic = fh.read(4)
+            fh.seek(0)
+            method = "gzip" if magic.startswith(GZIP_MAGIC) else method
+            method = "zstd" if magic == ZSTD_MAGIC else method
+        if method == "zstd":
+            zstandard = _import_zstandard()
+            stream = (
+                zstandard.ZstdDecompressor().stream_reader(fh)
+                if mode == "r"
+                else zstandard.ZstdCompressor().stream_writer(fh)
+            )
+            with stream, tarfile.open(fileobj=stream, mode=f"{mode}|") as tar:  # type: ignore
+                yield tar
+        elif method in ("gzip", "none"):
+            suffix = "gz" if method == "gzip" else ""
+            with tarfile.open(fileobj=fh, mode=f"{mode}|{suffix}") as tar:  # type: ignore
+                yield tar
+        else:
+            raise ValueError(
+                f"Invalid compression method: '{method}'. "
+                f"Use one of {', '.join(COMPRESSION_METHODS)}."
+            )
+
+
+def export_archive(
+    archive: Path,
+    root: Path,
+    files: list[Path],
+    cache: CacheBackend,
+    method: str = "gzip",
+    metadata: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """Pack cached files into a single tar archive.
+
+    The archive starts with a manifest that lists the metadata of each
+    file, such as the URL and the time of download. Cached files are
+    added as they are stored, hence compressed files are not decompressed.
+
+    Parameters
+    ----------
+    archive : Path
+        Path of the archive to create.
+    root : Path
+        Directory relative to which the files are stored in the archive.
+    files : list of Path
+        The cached files to pack. All files should be in `root`.
+    cache : CacheBackend
+        The cache backend that keeps track of the files.
+    method : str
+        Compression method of the archive. One of 'none', 'gzip' or 'zstd'.
+    metadata : dict, optional
+        Additional data to store in the manifest.
+
+    Returns
+    -------
+    dict
+        The manifest.
+    """
+    records: list[dict[str, Any]] = []
+    for path in files:
+        entry = cache.lookup(path) or FileCache().lookup(path)
+        if entry is None:
+            continue
+        records.append(
+            {
+                "path": path.relative_to(root).as_posix(),
+                "url": entry.url,
+                "fetched_at": entry.fetched_at.timestamp(),
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "size": entry.size,
+            }
+        )
+    manifest = {**(metadata or {}), "files": records}
+    payload = json.dumps(manifest).encode("utf-8")
+
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = archive.with_name(archive.name + ".tmp")
+    with _open_archive(tmp_path, "w", method) as tar:
+        info = tarfile.TarInfo(ARCHIVE_MANIFEST)
+        info.size = len(payload)
+        tar.addfile(info, io.BytesIO(payload))
+        for record in records:
+            tar.add(root / record["path"], arcname=record["path"], recursive=False)
+    tmp_path.replace(archive)
+    return manifest
+
+
+def read_archive_manifest(archive: Path) -> dict[str, Any]:
+    """Return the manifest of an archive created by :func:`export_archive`.
+
+    Parameters
+    ----------
+    archive : Path
+        Path of the archive.
+
+    Raises
+    ------
+    ValueError
+        If the archive has no manifest.
+
+    Returns
+    -------
+    dict
+    """
+    with _open_archive(archive, "r") as tar:
+        member = tar.next()
+        if member is None or member.name != ARCHIVE_MANIFEST:
+            raise ValueError(f"{archive} is not a soccerdata cache archive.")
+        return json.load(tar.extractfile(member))  # type: ignore
+
+
+def import_archive(archive: Path, root: Path, cache: CacheBackend) -> int:
+    """Unpack an archive created by :func:`export_archive` into the cache.
+
+    The files keep their original time of download, such that they expire
+    as if they were downloaded on this machine. Files that are already
+    cached and are at least as recent as the copy in the archive are kept.
+
+    Parameters
+    ----------
+    archive : Path
+        Path of the archive.
+    root : Path
+        Directory in which the files are unpacked.
+    cache : CacheBackend
+        The cache backend that keeps track of the files.
+
+    Raises
+    ------
+    ValueError
+        If the archive has no manifest or contains a path outside `root`.
+
+    Returns
+    -------
+    int
+        The number of files that were unpacked.
+    """
+    count = 0
+    with _open_archive(archive, "r") as tar:
+        member = tar.next()
+        if member is None or member.name != ARCHIVE_MANIFEST:
+            raise ValueError(f"{archive} is not a soccerdata cache archive.")
+        manifest = json.load(tar.extractfile(member))  # type: ignore
+        records = {record["path"]: record for record in manifest["files"]}
+        for member in tar:
+            record = records.get(member.name)
+            if not member.isfile() or record is None:
+                continue
+            filepath = root / member.name
+            if not filepath.resolve().is_relative_to(root.resolve()):
+                raise ValueError(f"Refusing to unpack {member.name} outside of {root}.")
+            fetched_at = datetime.fromtimestamp(record["fetched_at"], tz=timezone.utc)
+            current = cache.lookup(filepath)
+            if current is not None and current.fetched_at >= fetched_at:
+                continue
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = filepath.with_name(filepath.name + ".tmp")
+            with tmp_path.open(mode="wb") as fh:
+                fh.write(tar.extractfile(member).read())  # type: ignore
+            tmp_path.replace(filepath)
+            cache.restore(
+                CacheEntry(
+                    url=record["url"],
+                    path=filepath,
+                    fetched_at=fetched_at,
+                    etag=record["etag"],
+                    last_modified=record["last_modified"],
+                    size=record["size"],
+                )
+            )
+            count += 1
+    return count
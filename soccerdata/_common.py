@@ -1,16 +1,30 @@
+import asyncio
+import functools
+import hashlib
+import inspect
 import io
+import itertools
 import json
+import pickle
 import pprint
 import random
 import re
+import tempfile
+import threading
 import time
 import warnings
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Awaitable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
 from pathlib import Path
-from typing import IO, Callable, Optional, Union
+from typing import IO, Any, Callable, ClassVar, Optional, TypeVar, Union
+from urllib.parse import urlsplit
 
 import numpy as np
 import pandas as pd
@@ -20,7 +34,40 @@ from dateutil.relativedelta import relativedelta
 from lxml.etree import _Element
 from selenium.common.exceptions import JavascriptException, WebDriverException
 
-from ._config import DATA_DIR, LEAGUE_DICT, MAXAGE, TEAMNAME_REPLACEMENTS, logger
+from ._cache import (
+    CacheBackend,
+    ParseMemo,
+    compress,
+    export_archive,
+    get_cache_backend,
+    import_archive,
+    open_cached,
+    read_archive_manifest,
+)
+from ._config import (
+    CACHE_COMPRESSION,
+    DATA_DIR,
+    INCREMENTAL_LOOKBACK,
+    LEAGUE_DICT,
+    MAXAGE,
+    MMAP_CACHE,
+    PARSE_CACHE,
+    RESULT_CACHE,
+    SHARED_RATELIMIT,
+    TEAMNAME_ALTERNATIVES,
+    TEAMNAME_REPLACEMENTS,
+    logger,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 class SeasonCode(Enum):
@@ -192,6 +239,366 @@ class SeasonCode(Enum):
         raise ValueError(f"Unrecognized season code: '{season}'")
 
 
+class RateLimiter:
+    """Spaces out the requests that are sent to a single host.
+
+    The limiter hands out one token per request. A new token becomes
+    available ``interval`` seconds after the previous one was handed out,
+    irrespective of how long the request itself took. Hence, a slow response
+    counts towards the delay before the next request.
+
+    Use :meth:`for_host` to obtain the limiter of a host, such that all
+    reader instances in a process share the same budget. If a ``lock_file``
+    is given, the time at which the next token becomes available is stored
+    in that file, which allows multiple processes to share a budget.
+
+    Parameters
+    ----------
+    lock_file : Path, optional
+        File used to coordinate with other processes.
+    """
+
+    _limiters: ClassVar[dict[str, "RateLimiter"]] = {}
+    _limiters_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, lock_file: Optional[Path] = None):
+        if lock_file is not None and fcntl is None:
+            logger.warning(
+                "Sharing rate limits between processes is not supported on this platform."
+            )
+            lock_file = None
+        self.lock_file = lock_file
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    @classmethod
+    def for_host(cls, host: str) -> "RateLimiter":
+        """Return the rate limiter of a host.
+
+        Parameters
+        ----------
+        host : str
+            The network location of the host (e.g., 'fbref.com').
+
+        Returns
+        -------
+        RateLimiter
+        """
+        with cls._limiters_lock:
+            if host not in cls._limiters:
+                lock_file = None
+                if SHARED_RATELIMIT:
+                    lock_dir = DATA_DIR / ".ratelimit"
+                    lock_dir.mkdir(parents=True, exist_ok=True)
+                    lock_file = lock_dir / "{}.lock".format(re.sub(r"[^\w.-]", "_", host))
+                cls._limiters[host] = cls(lock_file)
+            return cls._limiters[host]
+
+    def wait(self, interval: float) -> None:
+        """Block until a new request is allowed.
+
+        Parameters
+        ----------
+        interval : float
+            The minimal number of seconds between the start of this request
+            and the start of the next one.
+        """
+        with self._lock:
+            now = time.time()
+            if self.lock_file is not None:
+                with self.lock_file.open(mode="a+") as fh:
+                    fcntl.flock(fh, fcntl.LOCK_EX)
+                    try:
+                        fh.seek(0)
+                        content = fh.read().strip()
+                        next_slot = float(content) if content else 0.0
+                        slot = max(now, next_slot)
+                        fh.seek(0)
+                        fh.truncate()
+                        fh.write(repr(slot + interval))
+                        fh.flush()
+                    finally:
+                        fcntl.flock(fh, fcntl.LOCK_UN)
+            else:
+                slot = max(now, self._next_slot)
+                self._next_slot = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CircuitBreaker:
+    """Pauses all requests to a host that repeatedly blocks them.
+
+    After ``threshold`` consecutive blocked requests, the breaker opens and
+    all readers in the process wait before they send a new request to the
+    host. The pause doubles each time the breaker opens again without a
+    successful request in between, up to ``max_pause`` seconds. A
+    ``Retry-After`` delay that is sent by the host pauses all requests as
+    well. A successful request resets the breaker.
+
+    Use :meth:`for_host` to obtain the breaker of a host.
+
+    Parameters
+    ----------
+    host : str
+        The network location of the host.
+    threshold : int
+        The number of consecutive blocked requests that opens the breaker.
+    pause : float
+        The number of seconds to pause when the breaker opens for the first
+        time.
+    max_pause : float
+        The maximum number of seconds to pause.
+    """
+
+    _breakers: ClassVar[dict[str, "CircuitBreaker"]] = {}
+    _breakers_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self, host: str, threshold: int = 3, pause: float = 60.0, max_pause: float = 900.0
+    ):
+        self.host = host
+        self.threshold = threshold
+        self.pause = pause
+        self.max_pause = max_pause
+        self._lock = threading.Lock()
+        self._blocks = 0
+        self._trips = 0
+        self._closed_at = 0.0
+
+    @classmethod
+    def for_host(cls, host: str) -> "CircuitBreaker":
+        """Return the circuit breaker of a host.
+
+        Parameters
+        ----------
+        host : str
+            The network location of the host (e.g., 'fbref.com').
+
+        Returns
+        -------
+        CircuitBreaker
+        """
+        with cls._breakers_lock:
+            if host not in cls._breakers:
+                cls._breakers[host] = cls(host)
+            return cls._breakers[host]
+
+    def wait(self) -> None:
+        """Block while the breaker is open."""
+        with self._lock:
+            remaining = self._closed_at - time.time()
+        if remaining > 0:
+            logger.info("Waiting %.0f seconds before sending requests to %s", remaining, self.host)
+            time.sleep(remaining)
+
+    def record_block(self, retry_after: Optional[float] = None) -> None:
+        """Register that the host blocked or throttled a request.
+
+        Parameters
+        ----------
+        retry_after : float, optional
+            The number of seconds after which the host accepts new requests.
+        """
+        with self._lock:
+            now = time.time()
+            if retry_after is not None:
+                self._closed_at = max(self._closed_at, now + min(retry_after, self.max_pause))
+            self._blocks += 1
+            if self._blocks < self.threshold:
+                return
+            pause = min(self.pause * 2**self._trips, self.max_pause)
+            self._blocks = 0
+            self._trips += 1
+            self._closed_at = max(self._closed_at, now + pause)
+        logger.warning(
+            "%s blocked %d requests in a row. Pausing all requests to it for %.0f seconds.",
+            self.host,
+            self.threshold,
+            pause,
+        )
+
+    def record_success(self) -> None:
+        """Register that the host accepted a request."""
+        with self._lock:
+            self._blocks = 0
+            self._trips = 0
+
+
+def _is_block_page(response: Any) -> bool:
+    """Return whether a response is a page of a bot protection service."""
+    return response.headers.get("cf-mitigated") == "challenge" or any(
+        marker in response.content for marker in BLOCK_MARKERS
+    )
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Return the delay before retrying a request, with exponential backoff.
+
+    The delay is drawn uniformly between zero and ``base * 2**attempt``
+    seconds, such that the retries of concurrent requests are spread out.
+
+    Parameters
+    ----------
+    attempt : int
+        The number of failed attempts so far, minus one.
+    base : float
+        The maximum delay after the first failed attempt.
+    cap : float
+        The maximum delay.
+
+    Returns
+    -------
+    float
+        The delay in seconds.
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse the value of a ``Retry-After`` header.
+
+    Parameters
+    ----------
+    value : str, optional
+        A number of seconds or an HTTP date.
+
+    Returns
+    -------
+    float or None
+        The number of seconds to wait, or None if the value is missing or
+        invalid.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+T = TypeVar("T")
+
+OUTPUT_FORMATS = ("pandas", "arrow", "polars")
+
+# The read_* methods that other read_* methods depend on. Their results are
+# kept in memory by each reader. See BaseReader._call_with_memo.
+MEMOIZED_METHODS = ("read_leagues", "read_seasons", "read_season_stages", "read_schedule")
+
+# Directories in the data directory of a reader that do not contain downloads
+CACHE_INTERNAL_DIRS = ("results", "parsed", "jobs")
+# Matches the season ids that are used in the names of cached files
+SEASON_TOKEN = re.compile(r"\d{4}")
+
+# URL patterns of images, fonts, stylesheets and ad and analytics scripts. The
+# data of the pages that are scraped does not depend on them.
+BLOCKED_RESOURCES = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.css",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*amazon-adsystem.com*",
+    "*adnxs.com*",
+    "*criteo.com*",
+    "*taboola.com*",
+    "*outbrain.com*",
+)
+
+# Markers of the pages that are served instead of the data when a bot
+# protection service blocks a request
+BLOCK_MARKERS = (b"Incapsula incident ID", b"_cf_chl_opt")
+# HTTP status codes of requests that may succeed when they are retried
+RETRY_STATUS_CODES = (403, 429, 500, 502, 503, 504)
+
+# Identifies the outermost read_* call that is running in a thread
+_read_scopes = itertools.count()
+
+
+def _as_timedelta(max_age: Optional[Union[int, timedelta]]) -> Optional[timedelta]:
+    """Convert a max. age in days to a timedelta.
+
+    Raises
+    ------
+    TypeError
+        If max_age is not an integer or timedelta object.
+    """
+    if max_age is None or isinstance(max_age, timedelta):
+        return max_age
+    if isinstance(max_age, int):
+        return timedelta(days=max_age)
+    raise TypeError("'max_age' must be of type int or datetime.timedelta")
+
+
+class _Dependencies:
+    """The cached files that the result of a ``read_*`` method depends on."""
+
+    def __init__(self) -> None:
+        # path -> (time of download, size, max. age in seconds)
+        self.files: dict[str, tuple[float, int, Optional[float]]] = {}
+        # True if some data is downloaded again on each call
+        self.volatile = False
+
+
+def _cache_result(method: Callable[..., T]) -> Callable[..., Any]:
+    """Store the DataFrames returned by a ``read_*`` method.
+
+    The wrapped method gets an additional ``output`` keyword argument that
+    selects the type of the returned table. See :func:`convert_output`.
+
+    See :meth:`BaseReader._call_with_result_cache` and
+    :meth:`BaseReader._call_with_memo`.
+    """
+    signature = inspect.signature(method)
+    memoize = method.__name__ in MEMOIZED_METHODS
+
+    @functools.wraps(method)
+    def wrapper(self: "BaseReader", *args: Any, output: str = "pandas", **kwargs: Any) -> Any:
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Invalid output format: '{output}'. Use one of {', '.join(OUTPUT_FORMATS)}."
+            )
+        result_cache = self.result_cache and not self.no_cache and not self.no_store
+        with self._read_scope():
+            if not memoize and not result_cache:
+                result = method(self, *args, **kwargs)
+            else:
+                bound = signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                arguments = {k: v for k, v in bound.arguments.items() if k != "self"}
+                if memoize:
+                    result = self._call_with_memo(method, arguments, result_cache, *args, **kwargs)
+                else:
+                    result = self._call_with_result_cache(method, arguments, *args, **kwargs)
+        return convert_output(result, output)
+
+    wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+        parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter(
+                "output", inspect.Parameter.KEYWORD_ONLY, default="pandas", annotation=str
+            ),
+        ]
+    )
+    return wrapper
+
+
 class BaseReader(ABC):
     """Base class for data readers.
 
@@ -217,6 +624,17 @@ class BaseReader(ABC):
         Path to directory where data will be cached.
     """
 
+    # Limits the number of simultaneous downloads per host. The semaphores are
+    # shared by all reader instances in the process with the same limit.
+    _host_slots: ClassVar[dict[tuple[str, int], threading.BoundedSemaphore]] = {}
+    _host_slots_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, attr in list(vars(cls).items()):
+            if name.startswith("read_") and inspect.isfunction(attr):
+                setattr(cls, name, _cache_result(attr))
+
     def __init__(
         self,
         leagues: Optional[Union[str, list[str]]] = None,
@@ -241,8 +659,23 @@ class BaseReader(ABC):
         self.no_cache = no_cache
         self.no_store = no_store
         self.data_dir = data_dir
-        self.rate_limit = 0
-        self.max_delay = 0
+        self.rate_limit: float = 0
+        self.max_delay: float = 0
+        self.max_concurrency = 1
+        self.cache: CacheBackend = get_cache_backend()
+        self.cache_compression = CACHE_COMPRESSION
+        self.incremental_lookback: Optional[timedelta] = (
+            timedelta(days=INCREMENTAL_LOOKBACK) if INCREMENTAL_LOOKBACK is not None else None
+        )
+        self.result_cache = RESULT_CACHE
+        self.mmap_cache = MMAP_CACHE
+        self.parse_cache = PARSE_CACHE
+        self._dependencies: list[_Dependencies] = []
+        self._dependencies_lock = threading.Lock()
+        # (method, leagues, seasons, arguments) -> (result, files, scope)
+        self._memo: dict[tuple[str, str], tuple[Any, dict, Optional[int]]] = {}
+        self._memo_lock = threading.Lock()
+        self._read_calls = threading.local()
         if self.no_store:
             logger.info("Caching is disabled")
         else:
@@ -287,13 +720,201 @@ class BaseReader(ABC):
             File-like object of downloaded data.
         """
         is_cached = self._is_cached(filepath, max_age)
-        if no_cache or self.no_cache or not is_cached:
-            logger.debug("Scraping %s", url)
-            return self._download_and_save(url, filepath, var)
-        logger.debug("Retrieving %s from cache", url)
-        if filepath is None:
-            raise ValueError("No filepath provided for cached data.")
-        return filepath.open(mode="rb")
+        if not no_cache and not self.no_cache and is_cached and filepath is not None:
+            logger.debug("Retrieving %s from cache", url)
+            try:
+                reader = open_cached(filepath, self.mmap_cache)
+            except FileNotFoundError:
+                # The file was removed, but the cache index was not updated
+                self.cache.remove(filepath)
+            else:
+                self._track_dependency(filepath, max_age)
+                return reader
+        logger.debug("Scraping %s", url)
+        with self._host_slot(url):
+            reader = self._download_and_save(url, filepath, var)
+        # Data that is refreshed on each call cannot be used in the result cache
+        self._track_dependency(None if no_cache else filepath, max_age)
+        return reader
+
+    def get_many(
+        self,
+        requests: Iterable[tuple[str, Optional[Path]]],
+        max_age: Optional[Union[int, timedelta]] = MAXAGE,
+        no_cache: bool = False,
+        var: Optional[Union[str, Iterable[str]]] = None,
+    ) -> Iterator[IO[bytes]]:
+        """Load data from multiple URLs concurrently.
+
+        Each ``(url, filepath)`` pair is handled as in :meth:`get`, but up to
+        ``max_concurrency`` pairs are processed in parallel by a pool of
+        worker threads. The number of simultaneous downloads from a single
+        host is capped at ``max_concurrency`` across all reader instances with
+        the same ``max_concurrency`` and all downloads share the host's
+        :class:`RateLimiter`.
+
+        Parameters
+        ----------
+        requests : iterable of (str, Path) tuples
+            The URLs to download and the paths where they should be cached.
+        max_age : int for age in days, or timedelta object
+            The max. age of locally cached file before re-download.
+        no_cache : bool
+            If True, will not use cached data. Overrides the class property.
+        var : str or list of str, optional
+            Return a JavaScript variable instead of the page source.
+
+        Yields
+        ------
+        io.BufferedIOBase
+            File-like object of downloaded data, in the same order as
+            ``requests``.
+        """
+        requests = list(requests)
+        if self.max_concurrency <= 1 or len(requests) <= 1:
+            for url, filepath in requests:
+                yield self.get(url, filepath, max_age=max_age, no_cache=no_cache, var=var)
+            return
+
+        for future in self._submit_many(
+            self.get, [(url, filepath, max_age, no_cache, var) for url, filepath in requests]
+        ):
+            yield future.result()
+
+    def _submit_many(self, func: Callable[..., T], calls: list[tuple]) -> Iterator[Future[T]]:
+        """Call `func` with each tuple of arguments in `calls` in a pool of threads.
+
+        Up to ``max_concurrency`` calls run in parallel. The futures are
+        yielded in the same order as `calls`. The remaining calls are
+        cancelled when the iterator is closed.
+        """
+        # Only a bounded number of calls is scheduled ahead of the consumer,
+        # such that the number of open file handles and buffered payloads
+        # does not grow with the number of calls.
+        workers = max(1, self.max_concurrency)
+        window = 2 * workers
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pending: deque[Future] = deque()
+        try:
+            for args in calls:
+                pending.append(executor.submit(func, *args))
+                if len(pending) >= window:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def export_cache(self, path: Union[str, Path], compression: str = "gzip") -> int:
+        """Pack the cached data of the selected leagues and seasons into an archive.
+
+        The archive can be unpacked with :meth:`import_cache` on another
+        machine, such that the data does not have to be downloaded again.
+
+        Cached files whose name refers to a league or season that is not
+        selected are skipped. All other files, such as match pages, which
+        are not named after a league or season, are included.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path of the archive to create.
+        compression : str
+            One of 'none', 'gzip' or 'zstd'.
+
+        Raises
+        ------
+        ImportError
+            If the compression method is 'zstd' but the zstandard package is
+            not installed.
+
+        Returns
+        -------
+        int
+            The number of files in the archive.
+        """
+        from . import __version__
+
+        files = [
+            filepath
+            for filepath in sorted(self.data_dir.rglob("*"))
+            if filepath.is_file() and self._is_selected_cache_file(filepath)
+        ]
+        manifest = export_archive(
+            Path(path),
+            self.data_dir,
+            files,
+            self.cache,
+            method=compression,
+            metadata={
+                "version": __version__,
+                "reader": type(self).__name__,
+                "directory": self.data_dir.name,
+                "leagues": self.leagues,
+                "seasons": getattr(self, "_season_ids", None),
+            },
+        )
+        logger.info("Exported %d cached files to %s", len(manifest["files"]), path)
+        return len(manifest["files"])
+
+    def import_cache(self, path: Union[str, Path]) -> int:
+        """Unpack an archive created by :meth:`export_cache` into the cache.
+
+        The files keep their original time of download. Files that are
+        already cached and are at least as recent are kept.
+
+        Parameters
+        ----------
+        path : str or Path
+            Path of the archive.
+
+        Raises
+        ------
+        ValueError
+            If the archive was not created by a reader of the same type.
+
+        Returns
+        -------
+        int
+            The number of files that were unpacked.
+        """
+        manifest = read_archive_manifest(Path(path))
+        if manifest.get("reader") != type(self).__name__:
+            raise ValueError(
+                f"The archive contains data of {manifest.get('reader')}, "
+                f"not of {type(self).__name__}."
+            )
+        count = import_archive(Path(path), self.data_dir, self.cache)
+        logger.info("Imported %d cached files from %s", count, path)
+        return count
+
+    def _is_selected_cache_file(self, filepath: Path) -> bool:
+        """Check whether a cached file is needed for the selected leagues and seasons."""
+        parts = filepath.relative_to(self.data_dir).parts
+        if parts[0] in CACHE_INTERNAL_DIRS or filepath.suffix == ".tmp":
+            return False
+        tokens = {token for part in parts for token in Path(part).stem.split("_")}
+        other_leagues = tokens & (self._all_leagues().keys() - set(self.leagues))
+        if other_leagues:
+            return False
+        seasons = getattr(self, "_season_ids", None)
+        if seasons is not None and tokens & set(self.leagues):
+            return not any(SEASON_TOKEN.fullmatch(token) for token in tokens - set(seasons))
+        return True
+
+    def _wait_for_rate_limit(self, url: str) -> None:
+        """Wait until the rate limit of the host of `url` allows a new request."""
+        interval = self.rate_limit + random.random() * self.max_delay
+        if interval > 0:
+            RateLimiter.for_host(urlsplit(url).netloc).wait(interval)
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore that limits concurrent downloads from the host of `url`."""
+        key = (urlsplit(url).netloc, max(1, self.max_concurrency))
+        with BaseReader._host_slots_lock:
+            if key not in BaseReader._host_slots:
+                BaseReader._host_slots[key] = threading.BoundedSemaphore(key[1])
+            return BaseReader._host_slots[key]
 
     def _is_cached(
         self,
@@ -319,26 +940,246 @@ class BaseReader(ABC):
         bool
             True in case of a cache hit, otherwise False.
         """
-        # Validate inputs
-        if max_age is not None:
-            if isinstance(max_age, int):
-                _max_age = timedelta(days=max_age)
-            elif isinstance(max_age, timedelta):
-                _max_age = max_age
+        _max_age = _as_timedelta(max_age)
+        if filepath is None:
+            return False
+        entry = self.cache.lookup(filepath)
+        if entry is None:
+            return False
+        # Check if cached file is too old
+        return _max_age is None or (datetime.now(timezone.utc) - entry.fetched_at) <= _max_age
+
+    @property
+    def _parse_memo(self) -> Optional[ParseMemo]:
+        """Return the memo of parsed data, or None if it is disabled."""
+        if not self.parse_cache or self.no_store:
+            return None
+        return ParseMemo(self.data_dir / "parsed")
+
+    def _track_dependency(
+        self, filepath: Optional[Path], max_age: Optional[Union[int, timedelta]] = None
+    ) -> None:
+        """Register that the running ``read_*`` calls use the data cached at `filepath`.
+
+        Parameters
+        ----------
+        filepath : Path, optional
+            Path of the cached data. None if the data is not cached or
+            should be downloaded again on each call.
+        max_age : int for age in days, or timedelta object
+            The max. age of the cached data.
+        """
+        if not self._dependencies:
+            return
+        files = {}
+        if filepath is not None:
+            entry = self.cache.lookup(filepath)
+            if entry is not None:
+                _max_age = _as_timedelta(max_age)
+                files[str(filepath)] = (
+                    entry.fetched_at.timestamp(),
+                    entry.size,
+                    _max_age.total_seconds() if _max_age is not None else None,
+                )
+        with self._dependencies_lock:
+            for dependencies in self._dependencies:
+                dependencies.files.update(files)
+                dependencies.volatile |= len(files) == 0
+
+    def _call_with_result_cache(
+        self, method: Callable[..., T], arguments: dict[str, Any], *args: Any, **kwargs: Any
+    ) -> T:
+        """Call a ``read_*`` method and store the DataFrame that it returns.
+
+        The DataFrame is stored in ``data_dir/results`` together with a list
+        of the cached files that it was created from. It is returned by
+        subsequent calls with the same leagues, seasons and arguments as long
+        as none of these files was downloaded again. Results that depend on
+        data that is downloaded again on each call (e.g., for a running
+        season) are not stored.
+        """
+        from . import __version__
+
+        key = hashlib.sha1(
+            repr(
+                (
+                    __version__,
+                    self.leagues,
+                    getattr(self, "_season_ids", None),
+                    sorted(arguments.items()),
+                    TEAMNAME_REPLACEMENTS,
+                    LEAGUE_DICT,
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+        filepath = self.data_dir / "results" / f"{type(self).__name__}.{method.__name__}.{key}"
+        manifest_path = filepath.with_suffix(".json")
+        result_path = filepath.with_suffix(".pkl")
+
+        try:
+            with manifest_path.open(encoding="utf-8") as fh:
+                files = {k: tuple(v) for k, v in json.load(fh).items()}
+        except (OSError, ValueError):
+            # Not cached yet or unreadable; the result is computed again
+            files = None
+        if files is not None and self._is_up_to_date(files):
+            try:
+                result = pd.read_pickle(result_path)
+            except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+                pass
             else:
-                raise TypeError("'max_age' must be of type int or datetime.timedelta")
-        else:
-            _max_age = None
+                logger.debug("Retrieving %s from the result cache", method.__name__)
+                with self._dependencies_lock:
+                    for dependencies in self._dependencies:
+                        dependencies.files.update(files)
+                return result
+
+        dependencies = _Dependencies()
+        with self._dependencies_lock:
+            self._dependencies.append(dependencies)
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            with self._dependencies_lock:
+                self._dependencies.remove(dependencies)
+
+        if isinstance(result, pd.DataFrame) and dependencies.files and not dependencies.volatile:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            # Each write goes to its own temporary file, such that concurrent
+            # writers of the same key never move each other's partial files
+            with tempfile.NamedTemporaryFile(
+                dir=filepath.parent, suffix=".tmp", delete=False
+            ) as pickle_file:
+                result.to_pickle(pickle_file)
+            Path(pickle_file.name).replace(result_path)
+            with tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", dir=filepath.parent, suffix=".tmp", delete=False
+            ) as manifest_file:
+                json.dump(dependencies.files, manifest_file)
+            Path(manifest_file.name).replace(manifest_path)
+        return result
+
+    def _call_with_memo(
+        self,
+        method: Callable[..., T],
+        arguments: dict[str, Any],
+        result_cache: bool,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Call a ``read_*`` method that other ``read_*`` methods depend on.
+
+        Methods such as ``read_schedule`` are called by most other ``read_*``
+        methods. Their result is kept in memory and returned by subsequent
+        calls with the same leagues, seasons and arguments as long as none of
+        the cached files that it was created from was downloaded again or
+        expired. Results that depend on data that is downloaded again on each
+        call (e.g., for a running season) are only reused within the same
+        outermost ``read_*`` call, such that each call still sees fresh data.
+        """
+        key = (
+            method.__name__,
+            repr((self.leagues, getattr(self, "_season_ids", None), sorted(arguments.items()))),
+        )
+        scope = self._read_calls.scope
+        with self._memo_lock:
+            entry = self._memo.get(key)
+        if entry is not None:
+            result, files, entry_scope = entry
+            if entry_scope in (None, scope) and self._is_up_to_date(files):
+                logger.debug("Reusing the result of %s", method.__name__)
+                with self._dependencies_lock:
+                    for dependencies in self._dependencies:
+                        dependencies.files.update(files)
+                        dependencies.volatile |= entry_scope is not None
+                return result.copy() if isinstance(result, pd.DataFrame) else result
+
+        dependencies = _Dependencies()
+        with self._dependencies_lock:
+            self._dependencies.append(dependencies)
+        try:
+            if result_cache:
+                result = self._call_with_result_cache(method, arguments, *args, **kwargs)
+            else:
+                result = method(self, *args, **kwargs)
+        finally:
+            with self._dependencies_lock:
+                self._dependencies.remove(dependencies)
+
+        with self._memo_lock:
+            self._memo[key] = (
+                result,
+                dependencies.files,
+                scope if dependencies.volatile else None,
+            )
+        return result.copy() if isinstance(result, pd.DataFrame) else result
+
+    @contextmanager
+    def _read_scope(self) -> Iterator[None]:
+        """Keep track of the outermost ``read_*`` call in the current thread."""
+        calls = self._read_calls
+        depth = getattr(calls, "depth", 0)
+        if depth == 0:
+            calls.scope = next(_read_scopes)
+        calls.depth = depth + 1
+        try:
+            yield
+        finally:
+            calls.depth = depth
+
+    def _is_up_to_date(self, files: dict[str, tuple[float, int, Optional[float]]]) -> bool:
+        """Check whether the cached files were not downloaded again or expired."""
+        now = datetime.now(timezone.utc)
+        for path, (fetched_at, size, max_age) in files.items():
+            entry = self.cache.lookup(Path(path))
+            if entry is None or entry.fetched_at.timestamp() != fetched_at or entry.size != size:
+                return False
+            if max_age is not None and (now - entry.fetched_at).total_seconds() > max_age:
+                return False
+        return True
+
+    def _needs_refresh(self, filepath: Optional[Path], end: Optional[datetime]) -> bool:
+        """Check whether a cached page of a running season should be downloaded again.
+
+        By default, all pages of a running season are downloaded again. If
+        ``incremental_lookback`` is set, a cached page is reused if it was
+        downloaded at least ``incremental_lookback`` after the last match on
+        the page, since the results on such a page are final.
 
-        cache_invalid = False
-        # Check if cached file is too old
-        if _max_age is not None and filepath is not None and filepath.exists():
-            last_modified = datetime.fromtimestamp(filepath.stat().st_mtime, tz=timezone.utc)
-            now = datetime.now(timezone.utc)
-            if (now - last_modified) > _max_age:
-                cache_invalid = True
+        Parameters
+        ----------
+        filepath : Path, optional
+            Path where the page is cached.
+        end : datetime, optional
+            The time of the last match on the page. None if unknown.
 
-        return not cache_invalid and filepath is not None and filepath.exists()
+        Returns
+        -------
+        bool
+        """
+        if self.incremental_lookback is None or filepath is None or end is None:
+            return True
+        entry = self.cache.lookup(filepath)
+        return entry is None or entry.fetched_at < end + self.incremental_lookback
+
+    def _save(
+        self,
+        url: str,
+        filepath: Optional[Path],
+        payload: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store the data downloaded from `url` in the cache at `filepath`.
+
+        The data is compressed with the method in ``cache_compression``.
+        """
+        if self.no_store or filepath is None:
+            return
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with filepath.open(mode="wb") as fh:
+            fh.write(compress(payload, self.cache_compression))
+        self.cache.record(url, filepath, len(payload), etag, last_modified)
 
     @abstractmethod
     def _download_and_save(
@@ -372,7 +1213,7 @@ class BaseReader(ABC):
     @classmethod
     def _all_leagues(cls) -> dict[str, str]:
         """Return a dict mapping all canonical league IDs to source league IDs."""
-        if not hasattr(cls, "_all_leagues_dict"):
+        if "_all_leagues_dict" not in cls.__dict__:
             cls._all_leagues_dict = {  # type: ignore
                 k: v[cls.__name__] for k, v in LEAGUE_DICT.items() if cls.__name__ in v
             }
@@ -487,23 +1328,105 @@ class BaseRequestsReader(BaseReader):
             data_dir=data_dir,
         )
 
-        self._session = self._init_session(headers)
+        self._headers = headers
+        self._local = threading.local()
+
+    @property
+    def _session(self) -> tls_requests.Client:
+        """Return the HTTP session of the current thread.
+
+        Each worker thread used by :meth:`get_many` gets its own session,
+        which is created on first use.
+        """
+        if not hasattr(self._local, "session"):
+            self._local.session = self._init_session(self._headers)
+        return self._local.session
+
+    @_session.setter
+    def _session(self, session: tls_requests.Client) -> None:
+        self._local.session = session
 
     def _init_session(self, headers: Optional[dict[str, str]] = None) -> tls_requests.Client:
         return tls_requests.Client(proxy=self.proxy(), headers=headers)
 
+    def _validators(self, filepath: Optional[Path] = None) -> dict[str, str]:
+        """Return the headers to revalidate the data cached at `filepath`.
+
+        If the server replies that the data was not modified, the cached data
+        can be reused without downloading it again.
+        """
+        if filepath is None or self.no_store or not filepath.exists():
+            return {}
+        entry = self.cache.lookup(filepath)
+        headers = {}
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
     def _download_and_save(
         self,
         url: str,
         filepath: Optional[Path] = None,
         var: Optional[Union[str, Iterable[str]]] = None,
     ) -> IO[bytes]:
-        """Download file at url to filepath. Overwrites if filepath exists."""
+        """Download file at url to filepath. Overwrites if filepath exists.
+
+        If the data at `filepath` is stale, a conditional request is sent and
+        the cached data is reused when the server replies that it was not
+        modified.
+        """
+        breaker = CircuitBreaker.for_host(urlsplit(url).netloc)
         for i in range(5):
+            breaker.wait()
+            try:
+                self._wait_for_rate_limit(url)
+                response = self._session.get(url, headers=self._validators(filepath))
+            except Exception:  # noqa: BLE001 - any network or proxy failure is retried
+                logger.exception(
+                    "Error while scraping %s. Retrying... (attempt %d of 5).",
+                    url,
+                    i + 1,
+                )
+                # The connection or the proxy may be broken
+                self._session = self._init_session(self._headers)
+                time.sleep(backoff_delay(i))
+                continue
+            if response.status_code in (403, 429) or _is_block_page(response):
+                # Blocked or throttled; retry with a new session after the
+                # delay requested by the host
+                logger.warning(
+                    "Request to %s was blocked (status %d). Retrying... (attempt %d of 5).",
+                    url,
+                    response.status_code,
+                    i + 1,
+                )
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                breaker.record_block(retry_after)
+                self._session = self._init_session(self._headers)
+                if retry_after is None:
+                    time.sleep(backoff_delay(i))
+                continue
+            if response.status_code in RETRY_STATUS_CODES:
+                logger.warning(
+                    "Error while scraping %s (status %d). Retrying... (attempt %d of 5).",
+                    url,
+                    response.status_code,
+                    i + 1,
+                )
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                time.sleep(retry_after if retry_after is not None else backoff_delay(i))
+                continue
+            if response.status_code >= 400:
+                # Retrying does not help for other client errors
+                raise ConnectionError(f"Could not download {url} (status {response.status_code}).")
+            breaker.record_success()
             try:
-                response = self._session.get(url)
-                time.sleep(self.rate_limit + random.random() * self.max_delay)
-                response.raise_for_status()
+                if response.status_code == 304 and filepath is not None:
+                    logger.debug("%s was not modified", url)
+                    self.cache.touch(filepath)
+                    return open_cached(filepath, self.mmap_cache)
                 if var is not None:
                     if isinstance(var, str):
                         var = [var]
@@ -518,9 +1441,13 @@ class BaseRequestsReader(BaseReader):
                     payload = json.dumps(data).encode("utf-8")
                 else:
                     payload = response.content
-                if not self.no_store and filepath is not None:
-                    with filepath.open(mode="wb") as fh:
-                        fh.write(payload)
+                self._save(
+                    url,
+                    filepath,
+                    payload,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
                 return io.BytesIO(payload)
             except Exception:
                 logger.exception(
@@ -528,14 +1455,298 @@ class BaseRequestsReader(BaseReader):
                     url,
                     i + 1,
                 )
-                self._session = self._init_session()
                 continue
 
         raise ConnectionError(f"Could not download {url}.")
 
 
+class AsyncBaseRequestsReader:
+    """Asynchronous counterpart of :class:`BaseRequestsReader`.
+
+    The reader wraps an instance of the synchronous reader class given by
+    ``reader_class`` and exposes its download and ``read_*`` methods as
+    coroutines. All other attributes (e.g., ``leagues``, ``seasons`` and
+    ``rate_limit``) are forwarded to the wrapped reader.
+
+    The TLS client that is used to download data does not support
+    non-blocking I/O. Therefore, blocking work is offloaded to a pool of
+    ``max_concurrency`` worker threads, such that the event loop is never
+    blocked and the number of threads does not grow with the number of
+    awaited requests. Caching, rate limiting and retries work exactly as for
+    the synchronous reader.
+
+    Parameters
+    ----------
+    *args, **kwargs
+        Passed to the constructor of ``reader_class``.
+    """
+
+    reader_class: ClassVar[type[BaseRequestsReader]] = BaseRequestsReader
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize the reader."""
+        self._reader = self.reader_class(*args, **kwargs)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("_reader", "_executor"):
+            raise AttributeError(name)
+        return getattr(self._reader, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+        else:
+            setattr(self._reader, name, value)
+
+    async def __aenter__(self) -> "AsyncBaseRequestsReader":  # noqa: PYI034
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Shut down the worker threads of the reader."""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def get(
+        self,
+        url: str,
+        filepath: Optional[Path] = None,
+        max_age: Optional[Union[int, timedelta]] = MAXAGE,
+        no_cache: bool = False,
+        var: Optional[Union[str, Iterable[str]]] = None,
+    ) -> IO[bytes]:
+        """Load data from `url`.
+
+        See :meth:`BaseRequestsReader.get`.
+        """
+        return await self._run(self._reader.get, url, filepath, max_age, no_cache, var)
+
+    async def get_many(
+        self,
+        requests: Iterable[tuple[str, Optional[Path]]],
+        max_age: Optional[Union[int, timedelta]] = MAXAGE,
+        no_cache: bool = False,
+        var: Optional[Union[str, Iterable[str]]] = None,
+    ) -> list[IO[bytes]]:
+        """Load data from multiple URLs concurrently.
+
+        See :meth:`BaseRequestsReader.get_many`.
+
+        Returns
+        -------
+        list of io.BufferedIOBase
+            File-like objects of downloaded data, in the same order as
+            ``requests``.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.get(url, filepath, max_age=max_age, no_cache=no_cache, var=var)
+                    for url, filepath in requests
+                )
+            )
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking function in one of the worker threads of the reader."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, self._reader.max_concurrency),
+                thread_name_prefix=type(self).__name__,
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+
+def awaitable(method: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """Turn a method of a synchronous reader into a coroutine function.
+
+    The returned coroutine function runs the method on the reader that is
+    wrapped by an :class:`AsyncBaseRequestsReader`. Since a ``read_*`` method
+    only waits for its downloads, it is executed in the default executor of
+    the event loop, while the downloads themselves are limited by the
+    reader's ``max_concurrency``.
+
+    Parameters
+    ----------
+    method : callable
+        An unbound method of ``reader_class``.
+
+    Returns
+    -------
+    callable
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: AsyncBaseRequestsReader, *args: Any, **kwargs: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(method, self._reader, *args, **kwargs)
+        )
+
+    return wrapper
+
+
+class DriverPool:
+    """A pool of Selenium drivers that can be shared by multiple threads.
+
+    Drivers are started when they are first needed, up to `size` drivers.
+    Each driver is used by a single thread at a time. The pool keeps track of
+    the consecutive failures and the number of uses of each driver. A driver
+    is quit and replaced by a new one, which gets a new proxy, after
+    `max_failures` consecutive failures or after `max_uses` uses.
+
+    Parameters
+    ----------
+    factory : callable
+        Function that starts a new driver.
+    size : int
+        The maximum number of drivers.
+    max_failures : int
+        Replace a driver after this number of consecutive failures.
+    max_uses : int, optional
+        Replace a driver after it was used this number of times. Long-running
+        browsers tend to slow down and use more memory over time.
+
+    Raises
+    ------
+    ValueError
+        If `size` or `max_failures` is smaller than 1.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], "sb.Driver"],
+        size: int = 1,
+        max_failures: int = 1,
+        max_uses: Optional[int] = None,
+    ):
+        if size < 1:
+            raise ValueError("The size of the pool should be at least 1.")
+        if max_failures < 1:
+            raise ValueError("max_failures should be at least 1.")
+        self.factory = factory
+        self.size = size
+        self.max_failures = max_failures
+        self.max_uses = max_uses
+        self._idle: deque[sb.Driver] = deque()
+        # driver -> [number of uses, number of consecutive failures]
+        self._health: dict[int, list[int]] = {}
+        self._n_drivers = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def start(self) -> None:
+        """Start a driver, such that errors show up before it is needed."""
+        self._release(self._checkout(), failed=False)
+
+    @contextmanager
+    def acquire(self) -> Iterator["sb.Driver"]:
+        """Borrow a driver from the pool.
+
+        Waits until a driver is available. If an exception is raised while
+        the driver is borrowed, the use counts as a failure of the driver.
+
+        Raises
+        ------
+        RuntimeError
+            If the pool is closed.
+
+        Yields
+        ------
+        sb.Driver
+            A driver that is not used by any other thread.
+        """
+        driver = self._checkout()
+        try:
+            yield driver
+        except BaseException:
+            self._release(driver, failed=True)
+            raise
+        self._release(driver, failed=False)
+
+    def close(self) -> None:
+        """Quit all drivers. Borrowed drivers are quit when they are returned."""
+        with self._cond:
+            self._closed = True
+            drivers = list(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+        for driver in drivers:
+            self._quit(driver)
+
+    def _checkout(self) -> "sb.Driver":
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("The driver pool is closed.")
+                if self._idle:
+                    return self._idle.popleft()
+                if self._n_drivers < self.size:
+                    self._n_drivers += 1
+                    break
+                self._cond.wait()
+        try:
+            driver = self.factory()
+        except BaseException:
+            with self._cond:
+                self._n_drivers -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._health[id(driver)] = [0, 0]
+        return driver
+
+    def _release(self, driver: "sb.Driver", failed: bool) -> None:
+        with self._cond:
+            health = self._health[id(driver)]
+            health[0] += 1
+            health[1] = health[1] + 1 if failed else 0
+            retire = (
+                self._closed
+                or health[1] >= self.max_failures
+                or (self.max_uses is not None and health[0] >= self.max_uses)
+            )
+            if retire:
+                del self._health[id(driver)]
+                self._n_drivers -= 1
+            else:
+                self._idle.append(driver)
+            self._cond.notify()
+        if retire:
+            if failed and not self._closed:
+                logger.info("Replacing a Selenium driver after %d failures", health[1])
+            self._quit(driver)
+
+    @staticmethod
+    def _quit(driver: "sb.Driver") -> None:
+        with suppress(Exception):
+            driver.quit()
+
+
 class BaseSeleniumReader(BaseReader):
-    """Base class for readers that use Selenium."""
+    """Base class for readers that use Selenium.
+
+    Parameters
+    ----------
+    n_drivers : int
+        The number of browsers that scrape pages in parallel. Each browser
+        uses its own proxy.
+    http_first : bool
+        If True, pages are downloaded with a lightweight HTTP client that
+        reuses the cookies, user agent and proxy of the browsers. The browser is
+        only used to obtain the cookies, to evaluate JavaScript variables
+        that are not embedded as JSON in the page and when the HTTP client
+        is blocked.
+    """
+
+    # URL patterns of resources that the browsers do not load, such as
+    # images, fonts and ads. See BLOCKED_RESOURCES.
+    blocked_resources: ClassVar[tuple[str, ...]] = ()
 
     def __init__(
         self,
@@ -546,6 +1757,8 @@ class BaseSeleniumReader(BaseReader):
         data_dir: Path = DATA_DIR,
         path_to_browser: Optional[Path] = None,
         headless: bool = True,
+        n_drivers: int = 1,
+        http_first: bool = False,
     ):
         """Initialize the reader."""
         super().__init__(
@@ -557,9 +1770,23 @@ class BaseSeleniumReader(BaseReader):
         )
         self.path_to_browser = path_to_browser
         self.headless = headless
+        self.max_concurrency = n_drivers
+        self._drivers = DriverPool(self._init_webdriver, size=n_drivers)
+        self.http_first = http_first
+        # The minimum number of seconds between two HTTP requests to a host
+        self.http_rate_limit = 1.0
+        # (version, cookies, user agent, proxy) of the browser session
+        self._http_state: Optional[tuple[int, dict[str, str], str, Optional[str]]] = None
+        # The proxy of each browser, so that its cookies are replayed from
+        # the same IP address
+        self._driver_proxies: weakref.WeakKeyDictionary[Any, Optional[str]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._http_lock = threading.Lock()
+        self._http_local = threading.local()
 
         try:
-            self._driver = self._init_webdriver()
+            self._drivers.start()
         except WebDriverException as e:
             logger.error(
                 """
@@ -570,23 +1797,33 @@ class BaseSeleniumReader(BaseReader):
                 e,
             )
 
+    def close(self) -> None:
+        """Quit all browsers that were started by the reader."""
+        self._drivers.close()
+
     def _init_webdriver(self) -> "sb.Driver":
-        """Start the Selenium driver."""
-        # Quit existing driver
-        if hasattr(self, "_driver"):
-            self._driver.quit()
-        # Start a new driver
+        """Start a new Selenium driver."""
         proxy_str = self.proxy()
         resolver_rules = None
         if proxy_str is not None:
             resolver_rules = "MAP * ~NOTFOUND , EXCLUDE 127.0.0.1"
-        return sb.Driver(
+        driver = sb.Driver(
             uc=True,
             headless=self.headless,
             binary_location=self.path_to_browser,
             host_resolver_rules=resolver_rules,
             proxy=proxy_str,
         )
+        self._driver_proxies[driver] = proxy_str
+        if self.blocked_resources:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd(
+                    "Network.setBlockedURLs", {"urls": list(self.blocked_resources)}
+                )
+            except WebDriverException:
+                logger.warning("Could not block resources in the browser", exc_info=True)
+        return driver
 
     def _download_and_save(
         self,
@@ -595,47 +1832,118 @@ class BaseSeleniumReader(BaseReader):
         var: Optional[Union[str, Iterable[str]]] = None,
     ) -> IO[bytes]:
         """Download file at url to filepath. Overwrites if filepath exists."""
+        if self.http_first and (var is None or isinstance(var, str)):
+            content = self._download_with_http(url)
+            if content is not None and var is not None:
+                content = extract_json_var(content, var)
+            if content is not None:
+                self._save(url, filepath, content)
+                return io.BytesIO(content)
+        breaker = CircuitBreaker.for_host(urlsplit(url).netloc)
         for i in range(5):
+            breaker.wait()
+            blocked = False
             try:
-                self._driver.get(url)
-                time.sleep(self.rate_limit + random.random() * self.max_delay)
-                if "Incapsula incident ID" in self._driver.page_source:
-                    raise WebDriverException(
-                        "Your IP is blocked. Use tor or a proxy to continue scraping."
-                    )
-                if var is None:
-                    response = self._driver.execute_script(
-                        "return document.body.innerHTML;"
-                    ).encode("utf-8")
-                    if response == b"":
-                        raise Exception("Empty response.")
-                else:
-                    if not isinstance(var, str):
-                        raise NotImplementedError("Only implemented for single variables.")
-                    try:
-                        response = json.dumps(self._driver.execute_script("return " + var)).encode(
+                with self._drivers.acquire() as driver:
+                    driver.get(url)
+                    time.sleep(self.rate_limit + random.random() * self.max_delay)
+                    page_source = driver.page_source
+                    if any(marker.decode() in page_source for marker in BLOCK_MARKERS):
+                        blocked = True
+                        raise WebDriverException(
+                            "Your IP is blocked. Use tor or a proxy to continue scraping."
+                        )
+                    if var is None:
+                        response = driver.execute_script("return document.body.innerHTML;").encode(
                             "utf-8"
                         )
-                    except JavascriptException:
-                        response = json.dumps(None).encode("utf-8")
-                if not self.no_store and filepath is not None:
-                    filepath.parent.mkdir(parents=True, exist_ok=True)
-                    with filepath.open(mode="wb") as fh:
-                        fh.write(response)
+                        if response == b"":
+                            raise Exception("Empty response.")
+                    else:
+                        if not isinstance(var, str):
+                            raise NotImplementedError("Only implemented for single variables.")
+                        # Reading the embedded JSON is much cheaper than
+                        # serializing the JavaScript object in the browser
+                        extracted = extract_json_var(page_source.encode("utf-8"), var)
+                        if extracted is not None:
+                            response = extracted
+                        else:
+                            try:
+                                response = json.dumps(
+                                    driver.execute_script("return " + var)
+                                ).encode("utf-8")
+                            except JavascriptException:
+                                response = json.dumps(None).encode("utf-8")
+                    if self.http_first:
+                        self._share_session(driver)
+                breaker.record_success()
+                self._save(url, filepath, response)
                 return io.BytesIO(response)
             except Exception:
+                delay = backoff_delay(i, base=10)
                 logger.exception(
                     "Error while scraping %s. Retrying in %d seconds... (attempt %d of 5).",
                     url,
-                    i * 10,
+                    delay,
                     i + 1,
                 )
-                time.sleep(i * 10)
-                self._driver = self._init_webdriver()
+                if blocked:
+                    breaker.record_block()
+                # The pool replaces the failed driver with a new one
+                time.sleep(delay)
                 continue
 
         raise ConnectionError(f"Could not download {url}.")
 
+    def _share_session(self, driver: "sb.Driver") -> None:
+        """Let the HTTP client use the cookies, user agent and proxy of `driver`."""
+        cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+        user_agent = driver.execute_script("return navigator.userAgent;")
+        proxy = self._driver_proxies.get(driver)
+        with self._http_lock:
+            version = self._http_state[0] + 1 if self._http_state is not None else 0
+            self._http_state = (version, cookies, user_agent, proxy)
+
+    def _http_session(self) -> Optional[tls_requests.Client]:
+        """Return the HTTP client of the current thread.
+
+        Returns None if no browser session can be reused yet.
+        """
+        with self._http_lock:
+            state = self._http_state
+        if state is None:
+            return None
+        version, cookies, user_agent, proxy = state
+        if getattr(self._http_local, "version", None) != version:
+            if hasattr(self._http_local, "session"):
+                self._http_local.session.close()
+            self._http_local.session = tls_requests.Client(
+                proxy=proxy, headers={"User-Agent": user_agent}, cookies=cookies
+            )
+            self._http_local.version = version
+        return self._http_local.session
+
+    def _download_with_http(self, url: str) -> Optional[bytes]:
+        """Download `url` with an HTTP client that reuses the browser session.
+
+        Returns None if the request failed or was blocked. The data should
+        then be downloaded with the browser, which also renews the session.
+        """
+        session = self._http_session()
+        if session is None:
+            return None
+        RateLimiter.for_host(urlsplit(url).netloc).wait(self.http_rate_limit)
+        try:
+            response = session.get(url)
+            response.raise_for_status()
+        except Exception:  # noqa: BLE001 - any failure falls back to the browser
+            logger.debug("Could not download %s without a browser", url, exc_info=True)
+            return None
+        if response.content == b"" or _is_block_page(response):
+            logger.debug("Downloading %s without a browser was blocked", url)
+            return None
+        return response.content
+
 
 def make_game_id(row: pd.Series) -> str:
     """Return a game id based on date, home and away team."""
@@ -653,6 +1961,31 @@ def make_game_id(row: pd.Series) -> str:
     return game_id
 
 
+def make_game_ids(df: pd.DataFrame) -> pd.Series:
+    """Return the game ids of all games in a dataframe.
+
+    This is the vectorized version of :func:`make_game_id`. It produces the
+    same ids, but builds them from whole columns instead of row by row.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataframe with a 'date', 'home_team' and 'away_team' column.
+
+    Returns
+    -------
+    pd.Series
+        The game ids, with the same index as `df`.
+    """
+    teams = df["home_team"].astype(str) + "-" + df["away_team"].astype(str)
+    dates = df["date"]
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        days = dates.dt.strftime("%Y-%m-%d")
+    else:
+        days = dates.map(lambda d: d.strftime("%Y-%m-%d") if not pd.isnull(d) else None)
+    return (days + " " + teams).where(days.notna(), teams).astype(object)
+
+
 def add_alt_team_names(team: Union[str, list[str]]) -> set[str]:
     """Add a set of alternative team names for a standardized team name.
 
@@ -672,11 +2005,9 @@ def add_alt_team_names(team: Union[str, list[str]]) -> set[str]:
     """
     teams = [team] if isinstance(team, str) else team
 
-    alt_teams = set()
+    alt_teams: set[str] = set()
     for team in teams:
-        for alt_name, norm_name in TEAMNAME_REPLACEMENTS.items():
-            if norm_name == team:
-                alt_teams.add(alt_name)
+        alt_teams.update(TEAMNAME_ALTERNATIVES.get(team, ()))
         alt_teams.add(team)
     return alt_teams
 
@@ -701,13 +2032,56 @@ def add_standardized_team_name(team: Union[str, list[str]]) -> set[str]:
     teams = [team] if isinstance(team, str) else team
     std_teams = set()
     for _team in teams:
-        for alt_name, norm_name in TEAMNAME_REPLACEMENTS.items():
-            if alt_name == _team:
-                std_teams.add(norm_name)
+        if _team in TEAMNAME_REPLACEMENTS:
+            std_teams.add(TEAMNAME_REPLACEMENTS[_team])
         std_teams.add(_team)
     return std_teams
 
 
+def standardize_team_names(df: pd.DataFrame, cols: Optional[list[str]] = None) -> pd.DataFrame:
+    """Replace team names by their standardized name.
+
+    Each distinct team name is looked up only once in the configured team
+    name replacements, regardless of the number of rows.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataframe with team names.
+    cols : list of str, optional
+        The columns with team names. Defaults to ``["team"]``. Columns that
+        do not exist are ignored.
+
+    Returns
+    -------
+    pd.DataFrame
+        A copy of `df` with standardized team names.
+    """
+    cols = ["team"] if cols is None else cols
+    df = df.copy(deep=False)
+    for i, label in enumerate(df.columns):
+        if label in cols:
+            df.isetitem(i, _standardize_team_names(df.iloc[:, i]))
+    return df
+
+
+def _standardize_team_names(teams: pd.Series) -> pd.Series:
+    if len(TEAMNAME_REPLACEMENTS) == 0:
+        return teams
+    if isinstance(teams.dtype, pd.CategoricalDtype):
+        return teams.map(lambda team: TEAMNAME_REPLACEMENTS.get(team, team))
+    codes, uniques = pd.factorize(teams)
+    std_uniques = np.array([TEAMNAME_REPLACEMENTS.get(team, team) for team in uniques] + [None])
+    # The last element is selected by missing values, which have code -1
+    is_replaced = np.append(std_uniques[:-1] != uniques, False)
+    if not is_replaced.any():
+        return teams
+    mask = is_replaced[codes]
+    values = teams.to_numpy(dtype=object, copy=True)
+    values[mask] = std_uniques[codes[mask]]
+    return pd.Series(values, index=teams.index, name=teams.name)
+
+
 def standardize_colnames(df: pd.DataFrame, cols: Optional[list[str]] = None) -> pd.DataFrame:
     """Convert DataFrame column names to snake case."""
 
@@ -730,6 +2104,221 @@ def standardize_colnames(df: pd.DataFrame, cols: Optional[list[str]] = None) ->
     return df.rename(columns={c: to_snake(c) for c in cols})
 
 
+def load_json(data: Union[IO[bytes], bytes, str]) -> Any:
+    """Deserialize a JSON document.
+
+    If the orjson package is installed, it is used to decode the data, which
+    is several times faster than the json module of the standard library.
+    Documents that orjson rejects, such as documents with NaN values, are
+    decoded with the json module.
+
+    Parameters
+    ----------
+    data : file object, bytes or str
+        The document to decode. File objects that provide a ``getbuffer``
+        method, such as memory-mapped cached files, are decoded without
+        copying their content.
+
+    Returns
+    -------
+    Any
+        The decoded document.
+    """
+    content: Union[bytes, str]
+    if isinstance(data, (bytes, str)):
+        content = data
+    elif orjson is not None and hasattr(data, "getbuffer"):
+        with data.getbuffer() as view:
+            try:
+                return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                return json.loads(view.tobytes())
+    else:
+        content = data.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def extract_json_var(source: bytes, var: str) -> Optional[bytes]:
+    """Extract a JSON value that is assigned to a variable in a page's source.
+
+    Scripts often embed their data as a literal, such as
+    ``var data = {...};`` or ``args = {data: {...}}``. This function finds
+    the value without rendering the page or evaluating its scripts. The
+    JSON decoder scans the source from the start of the value and stops at
+    its end, such that the rest of the page is never parsed.
+
+    Parameters
+    ----------
+    source : bytes
+        The source of the page.
+    var : str
+        The variable. For an attribute such as
+        ``require.config.params['args'].matchCentreData``, the value that is
+        assigned to the last attribute is extracted.
+
+    Returns
+    -------
+    bytes or None
+        The JSON value, or None if the variable is not assigned a valid JSON
+        value in the source.
+    """
+    name = re.split(r"[.\[\]'\"]+", var.strip(".[]'\""))[-1]
+    assignment = re.compile(
+        rb"(?<![\w$.])[\"']?%b[\"']?\s*[:=]\s*" % re.escape(name.encode("utf-8"))
+    )
+    decoder = json.JSONDecoder()
+    for match in assignment.finditer(source):
+        text = source[match.end() :].decode("utf-8", errors="replace")
+        try:
+            _, end = decoder.raw_decode(text)
+        except ValueError:
+            # Not a JSON value, such as a JavaScript expression or object literal
+            continue
+        return text[:end].encode("utf-8")
+    return None
+
+
+def _import_pyarrow():  # type: ignore
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "The pyarrow package is required for Arrow and Parquet output. "
+            "Please install it with `pip install pyarrow`."
+        )
+    return pyarrow
+
+
+def _import_polars():  # type: ignore
+    try:
+        import polars
+    except ImportError:
+        raise ImportError(
+            "The polars package is required for Polars output. "
+            "Please install it with `pip install polars`."
+        )
+    return polars
+
+
+def to_arrow(df: pd.DataFrame) -> Any:
+    """Convert a dataframe returned by a reader to an Arrow table.
+
+    The index levels become regular columns, such that the table can be
+    partitioned or joined on them. Column names that consist of multiple
+    levels are joined with an underscore.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The dataframe to convert.
+
+    Raises
+    ------
+    ImportError
+        If the pyarrow package is not installed.
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    pa = _import_pyarrow()
+    if not (isinstance(df.index, pd.RangeIndex) and df.index.name is None):
+        df = df.reset_index()
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.set_axis(
+            ["_".join(str(level) for level in col if level != "") for col in df.columns],
+            axis="columns",
+        )
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def convert_output(result: Any, output: str = "pandas") -> Any:
+    """Convert the dataframe returned by a ``read_*`` method.
+
+    Parameters
+    ----------
+    result : pd.DataFrame
+        The dataframe returned by a ``read_*`` method.
+    output : str
+        One of 'pandas', 'arrow' or 'polars'. With 'arrow' a
+        :class:`pyarrow.Table` is returned (see :func:`to_arrow`) and with
+        'polars' a :class:`polars.DataFrame`.
+
+    Raises
+    ------
+    ValueError
+        If the output format does not exist.
+    TypeError
+        If the output format is not 'pandas' and `result` is not a dataframe.
+
+    Returns
+    -------
+    pd.DataFrame or pyarrow.Table or polars.DataFrame
+    """
+    if output == "pandas":
+        return result
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Invalid output format: '{output}'. Use one of {', '.join(OUTPUT_FORMATS)}."
+        )
+    if not isinstance(result, pd.DataFrame):
+        raise TypeError(f"Cannot convert a {type(result).__name__} to '{output}' output.")
+    table = to_arrow(result)
+    if output == "polars":
+        return _import_polars().from_arrow(table)
+    return table
+
+
+def to_parquet(
+    data: Any,
+    path: Union[str, Path],
+    partition_by: Optional[Iterable[str]] = ("league", "season"),
+) -> None:
+    """Write the data returned by a reader to Parquet.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or pyarrow.Table or polars.DataFrame
+        The data returned by a ``read_*`` method.
+    path : str or Path
+        With `partition_by`, the root directory of the partitioned dataset.
+        Otherwise, the path of the Parquet file.
+    partition_by : list of str, optional
+        Columns to partition the dataset by. Each partition is written to a
+        ``column=value`` subdirectory, which is understood by Spark, DuckDB
+        and pyarrow. Columns that are not in the data are ignored. Set to
+        None to write a single file.
+
+    Raises
+    ------
+    ImportError
+        If the pyarrow package is not installed.
+
+    Examples
+    --------
+    >>> to_parquet(fbref.read_schedule(output="arrow"), "schedule")
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    if isinstance(data, pd.DataFrame):
+        table = to_arrow(data)
+    elif hasattr(data, "to_arrow"):
+        table = data.to_arrow()
+    else:
+        table = data
+    partition_cols = [col for col in partition_by or [] if col in table.column_names]
+    if partition_cols:
+        pq.write_to_dataset(table, root_path=str(path), partition_cols=partition_cols)
+    else:
+        pq.write_table(table, str(path))
+
+
 def get_proxy() -> dict[str, str]:
     """Return a public proxy."""
     # list of free proxy apis
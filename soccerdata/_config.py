@@ -16,7 +16,20 @@ NOSTORE = os.environ.get("SOCCERDATA_NOSTORE", "False").lower() in ("true", "1",
 MAXAGE = None
 if os.environ.get("SOCCERDATA_MAXAGE") is not None:
     MAXAGE = int(os.environ.get("SOCCERDATA_MAXAGE", 0))
+INCREMENTAL_LOOKBACK = None
+if os.environ.get("SOCCERDATA_INCREMENTAL_LOOKBACK") is not None:
+    INCREMENTAL_LOOKBACK = int(os.environ.get("SOCCERDATA_INCREMENTAL_LOOKBACK", "0"))
 LOGLEVEL = os.environ.get("SOCCERDATA_LOGLEVEL", "INFO").upper()
+CACHE_BACKEND = os.environ.get("SOCCERDATA_CACHE_BACKEND", "file").lower()
+CACHE_COMPRESSION = os.environ.get("SOCCERDATA_CACHE_COMPRESSION", "none").lower()
+PARSE_CACHE = os.environ.get("SOCCERDATA_PARSE_CACHE", "False").lower() in ("true", "1", "t")
+RESULT_CACHE = os.environ.get("SOCCERDATA_RESULT_CACHE", "False").lower() in ("true", "1", "t")
+MMAP_CACHE = os.environ.get("SOCCERDATA_MMAP_CACHE", "False").lower() in ("true", "1", "t")
+SHARED_RATELIMIT = os.environ.get("SOCCERDATA_SHARED_RATELIMIT", "False").lower() in (
+    "true",
+    "1",
+    "t",
+)
 
 # Directories
 BASE_DIR = Path(os.environ.get("SOCCERDATA_DIR", Path.home() / "soccerdata"))
@@ -93,6 +106,10 @@ else:
         "No custom team name replacements found. You can configure these in %s.",
         _f_custom_teamnname_replacements,
     )
+# Reverse index of the team name replacements
+TEAMNAME_ALTERNATIVES: dict[str, set[str]] = {}
+for _alt_name, _norm_name in TEAMNAME_REPLACEMENTS.items():
+    TEAMNAME_ALTERNATIVES.setdefault(_norm_name, set()).add(_alt_name)
 
 
 # League dict
@@ -0,0 +1,245 @@
+"""Resumable scrapes of the games in the selected leagues and seasons."""
+
+import hashlib
+import inspect
+import json
+import pickle
+import re
+import tempfile
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import pandas as pd
+
+from ._common import BaseReader
+from ._config import logger
+
+
+class ScrapeJob:
+    """Scrape the data of each game separately, with a checkpoint after each game.
+
+    The job calls a ``read_*`` method of a reader once for each game in the
+    schedule of the selected leagues and seasons. After each game, the status
+    of all games is written to a manifest in the ``jobs`` directory of the
+    reader's data directory and the result of the game is stored next to it.
+    If the job is interrupted, it can be resumed by running it again; games
+    that are done are skipped. Games that fail are retried at the end of the
+    run.
+
+    Parameters
+    ----------
+    reader : BaseReader
+        The reader to scrape the games with.
+    method : str
+        The name of a ``read_*`` method of the reader that accepts a
+        ``match_id`` argument, such as 'read_events'.
+    name : str, optional
+        The name of the job. By default, the name is derived from the reader,
+        the method, the selected leagues and seasons and the arguments, such
+        that running the same job again resumes it.
+    max_attempts : int
+        The number of times a failing game is tried in a single run.
+    match_id : list, optional
+        Only scrape these games. By default, all games in the schedule are
+        scraped.
+    **kwargs
+        Other arguments for the ``read_*`` method.
+
+    Raises
+    ------
+    ValueError
+        If the reader has no such method, the method does not accept a
+        ``match_id`` argument or `max_attempts` is smaller than 1.
+
+    Examples
+    --------
+    >>> ws = sd.WhoScored("ENG-Premier League", "2021")
+    >>> job = ScrapeJob(ws, "read_events", on_error="raise")
+    >>> job.run()  # resumes the job if it was interrupted
+    >>> events = job.result()
+    """
+
+    def __init__(
+        self,
+        reader: BaseReader,
+        method: str,
+        name: Optional[str] = None,
+        max_attempts: int = 3,
+        match_id: Optional[list] = None,
+        **kwargs: Any,
+    ):
+        if not method.startswith("read_") or not hasattr(reader, method):
+            raise ValueError(f"{type(reader).__name__} has no method '{method}'.")
+        if "match_id" not in inspect.signature(getattr(reader, method)).parameters:
+            raise ValueError(f"{type(reader).__name__}.{method} does not accept a match_id.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts should be at least 1.")
+        self.reader = reader
+        self.method = method
+        self.max_attempts = max_attempts
+        self.match_id = match_id
+        self.kwargs = kwargs
+        self.name = name or self._default_name()
+        self.path = reader.data_dir / "jobs" / self.name
+
+    def _definition(self) -> dict[str, Any]:
+        """Return what identifies the job, as stored in the manifest."""
+        return {
+            "reader": type(self.reader).__name__,
+            "method": self.method,
+            "leagues": self.reader.leagues,
+            "seasons": getattr(self.reader, "_season_ids", None),
+            "match_id": self.match_id,
+            "kwargs": self.kwargs,
+        }
+
+    def _default_name(self) -> str:
+        definition = json.dumps(self._definition(), sort_keys=True, default=str)
+        digest = hashlib.sha1(definition.encode("utf-8")).hexdigest()[:10]
+        return f"{self.method}_{digest}"
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.path / "manifest.json"
+
+    def _result_path(self, game_id: Any) -> Path:
+        return self.path / "results" / (re.sub(r"[^\w.-]", "_", str(game_id)) + ".pkl")
+
+    def _load_manifest(self) -> dict[str, Any]:
+        definition = json.loads(json.dumps(self._definition(), default=str))
+        if not self._manifest_path.exists():
+            return {**definition, "games": []}
+        with self._manifest_path.open() as fh:
+            manifest = json.load(fh)
+        if {key: manifest.get(key) for key in definition} != definition:
+            raise ValueError(
+                f"A different job named '{self.name}' exists in {self.path}. Use another name."
+            )
+        return manifest
+
+    def _save_manifest(self, manifest: dict[str, Any]) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=self.path, suffix=".tmp", delete=False
+        ) as fh:
+            json.dump(manifest, fh, indent=2, default=str)
+        Path(fh.name).replace(self._manifest_path)
+
+    def _add_games(self, manifest: dict[str, Any]) -> None:
+        """Add the games in the schedule that are not in the manifest yet."""
+        schedule = self.reader.read_schedule().reset_index()  # type: ignore[attr-defined]
+        schedule = schedule[schedule["game_id"].notna()]
+        if self.match_id is not None:
+            schedule = schedule[schedule["game_id"].isin(self.match_id)]
+        known = {game["game_id"] for game in manifest["games"]}
+        for game in schedule.itertuples():
+            game_id = game.game_id.item() if hasattr(game.game_id, "item") else game.game_id
+            if game_id not in known:
+                manifest["games"].append(
+                    {
+                        "league": game.league,
+                        "season": game.season,
+                        "game": game.game,
+                        "game_id": game_id,
+                        "status": "pending",
+                        "attempts": 0,
+                        "error": None,
+                    }
+                )
+
+    def _scrape(self, game: dict[str, Any]) -> None:
+        """Scrape a single game and record the outcome in `game`."""
+        try:
+            result = getattr(self.reader, self.method)(match_id=game["game_id"], **self.kwargs)
+        except Exception as e:  # noqa: BLE001 - a failing game must not stop the job
+            logger.exception("Job %s: could not scrape game %s", self.name, game["game_id"])
+            game["status"] = "failed"
+            game["error"] = f"{type(e).__name__}: {e}"
+        else:
+            filepath = self._result_path(game["game_id"])
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=filepath.parent, suffix=".tmp", delete=False
+            ) as fh:
+                pickle.dump(result, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            Path(fh.name).replace(filepath)
+            game["status"] = "done"
+            game["error"] = None
+        game["attempts"] += 1
+        game["updated_at"] = datetime.now(tz=timezone.utc).isoformat()
+
+    def run(self) -> pd.DataFrame:
+        """Scrape the games that are not done yet.
+
+        The games are scraped in the order of the schedule. The games that
+        fail are retried after all other games, until they were tried
+        `max_attempts` times in this run. Games that failed in a previous run
+        are tried again.
+
+        Returns
+        -------
+        pd.DataFrame
+            The status of each game. See :meth:`status`.
+        """
+        manifest = self._load_manifest()
+        self._add_games(manifest)
+        self._save_manifest(manifest)
+
+        queue = deque(game for game in manifest["games"] if game["status"] != "done")
+        logger.info("Job %s: %d of %d games left", self.name, len(queue), len(manifest["games"]))
+        attempts: dict[Any, int] = {}
+        while queue:
+            game = queue.popleft()
+            self._scrape(game)
+            self._save_manifest(manifest)
+            attempts[game["game_id"]] = attempts.get(game["game_id"], 0) + 1
+            if game["status"] == "failed" and attempts[game["game_id"]] < self.max_attempts:
+                queue.append(game)
+
+        status = self.status()
+        counts = status["status"].value_counts()
+        logger.info(
+            "Job %s: %d done, %d failed, %d pending",
+            self.name,
+            counts.get("done", 0),
+            counts.get("failed", 0),
+            counts.get("pending", 0),
+        )
+        for game_id, error in status.loc[status["status"] == "failed", "error"].items():
+            logger.warning("Job %s: game %s failed: %s", self.name, game_id, error)
+        return status
+
+    def status(self) -> pd.DataFrame:
+        """Return the status of each game in the job.
+
+        Returns
+        -------
+        pd.DataFrame
+            A dataframe indexed by game ID with the league, season, game,
+            status ('pending', 'done' or 'failed'), number of attempts over
+            all runs and the last error of each game.
+        """
+        games = self._load_manifest()["games"]
+        columns = ["league", "season", "game", "game_id", "status", "attempts", "error"]
+        return pd.DataFrame(games, columns=columns).set_index("game_id")
+
+    def result(self) -> Union[pd.DataFrame, dict[Any, Any]]:
+        """Return the results of the games that are done.
+
+        Returns
+        -------
+        pd.DataFrame or dict
+            The results of all games combined in a single dataframe if the
+            method returns dataframes. Otherwise, a dict that maps the ID of
+            each game to its result.
+        """
+        results = {}
+        for game in self._load_manifest()["games"]:
+            if game["status"] == "done":
+                with self._result_path(game["game_id"]).open(mode="rb") as fh:
+                    results[game["game_id"]] = pickle.load(fh)
+        if results and all(isinstance(r, pd.DataFrame) for r in results.values()):
+            return pd.concat(results.values())
+        return results
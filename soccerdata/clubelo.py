@@ -8,8 +8,13 @@ from typing import IO, Callable, Optional, Union
 import pandas as pd
 from unidecode import unidecode
 
-from ._common import BaseRequestsReader, add_alt_team_names, standardize_colnames
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS
+from ._common import (
+    BaseRequestsReader,
+    add_alt_team_names,
+    standardize_colnames,
+    standardize_team_names,
+)
+from ._config import DATA_DIR, NOCACHE, NOSTORE
 
 CLUB_ELO_DATADIR = DATA_DIR / "ClubElo"
 CLUB_ELO_API = "http://api.clubelo.com"
@@ -101,7 +106,7 @@ class ClubElo(BaseRequestsReader):
             _parse_csv(data)
             .pipe(standardize_colnames)
             .rename(columns={"club": "team"})
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             .replace("None", float("nan"))
             .assign(rank=lambda x: x["rank"].astype("float"))
             .assign(league=lambda x: x["country"] + "_" + x["level"].astype(str))
@@ -160,7 +165,7 @@ class ClubElo(BaseRequestsReader):
 
             if len(df) > 0:
                 # clubelo.com returns a CSV with just a header for nonexistent club
-                df.replace({"team": TEAMNAME_REPLACEMENTS}, inplace=True)
+                df = standardize_team_names(df)
                 return df
 
         raise ValueError(f"No data found for team {team}")
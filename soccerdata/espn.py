@@ -1,16 +1,24 @@
 """Scraper for http://site.api.espn.com/apis/site/v2/sports/soccer."""
 
 import itertools
-import json
 import re
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Callable, Optional, Union
 
 import pandas as pd
 
-from ._common import BaseRequestsReader, make_game_id, standardize_colnames
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS, logger
+from ._common import (
+    AsyncBaseRequestsReader,
+    BaseRequestsReader,
+    awaitable,
+    load_json,
+    make_game_ids,
+    standardize_colnames,
+    standardize_team_names,
+)
+from ._config import DATA_DIR, NOCACHE, NOSTORE, logger
 
 # http://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/summary?event=513466
 # http://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/scoreboard?dates=20180901
@@ -69,6 +77,7 @@ class ESPN(BaseRequestsReader):
             no_store=no_store,
             data_dir=data_dir,
         )
+        self.max_concurrency = 4
         self.seasons = seasons
 
     def read_schedule(self, force_cache: bool = False) -> pd.DataFrame:
@@ -98,19 +107,30 @@ class ESPN(BaseRequestsReader):
             url = urlmask.format(lkey, start_date)
             filepath = self.data_dir / filemask.format(lkey, start_date)
             reader = self.get(url, filepath)
-            data = json.load(reader)
+            data = load_json(reader)
 
             match_dates = [
-                datetime.strptime(d, "%Y-%m-%dT%H:%MZ").strftime("%Y%m%d")  # noqa: DTZ007
+                datetime.strptime(d, "%Y-%m-%dT%H:%MZ").replace(tzinfo=timezone.utc)
                 for d in data["leagues"][0]["calendar"]
             ]
+            current_season = not self._is_complete(lkey, skey)
+            cached, refresh = [], []
             for date in match_dates:
-                url = urlmask.format(lkey, date)
-                filepath = self.data_dir / filemask.format(lkey, date)
-                current_season = not self._is_complete(lkey, skey)
-                reader = self.get(url, filepath, no_cache=current_season and not force_cache)
-
-                data = json.load(reader)
+                page = (
+                    urlmask.format(lkey, date.strftime("%Y%m%d")),
+                    self.data_dir / filemask.format(lkey, date.strftime("%Y%m%d")),
+                )
+                if (
+                    current_season
+                    and not force_cache
+                    and self._needs_refresh(page[1], date + timedelta(days=1))
+                ):
+                    refresh.append(page)
+                else:
+                    cached.append(page)
+            readers = itertools.chain(self.get_many(cached), self.get_many(refresh, no_cache=True))
+            for reader in readers:
+                data = load_json(reader)
                 df_list.extend(
                     [
                         {
@@ -128,10 +148,10 @@ class ESPN(BaseRequestsReader):
         return (
             pd.DataFrame(df_list)
             .pipe(self._translate_league)
-            .replace({"home_team": TEAMNAME_REPLACEMENTS, "away_team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names, cols=["home_team", "away_team"])
             .assign(date=lambda x: pd.to_datetime(x["date"]))
             .dropna(subset=["home_team", "away_team", "date"])
-            .assign(game=lambda df: df.apply(make_game_id, axis=1))
+            .assign(game=make_game_ids)
             .set_index(["league", "season", "game"])
             .sort_index()
         )
@@ -153,28 +173,8 @@ class ESPN(BaseRequestsReader):
         -------
         pd.DataFrame.
         """
-        urlmask = ESPN_API + "/{}/summary?event={}"
-        filemask = "Summary_{}.json"
-
-        df_schedule = self.read_schedule().reset_index()
-        if match_id is not None:
-            iterator = df_schedule[
-                df_schedule.game_id.isin([match_id] if isinstance(match_id, int) else match_id)
-            ]
-            if len(iterator) == 0:
-                raise ValueError(
-                    "No games with the given IDs found for the selected seasons and leagues."
-                )
-        else:
-            iterator = df_schedule
-
         df_list = []
-        for i, match in iterator.iterrows():
-            url = urlmask.format(match["league_id"], match["game_id"])
-            filepath = self.data_dir / filemask.format(match["game_id"])
-            reader = self.get(url, filepath)
-
-            data = json.load(reader)
+        for match, data in self._iter_summaries(match_id):
             for i in range(2):
                 match_sheet = {
                     "game": match["game"],
@@ -201,15 +201,13 @@ class ESPN(BaseRequestsReader):
                 df_list.append(match_sheet)
         return (
             pd.DataFrame(df_list)
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             .pipe(standardize_colnames)
             .set_index(["league", "season", "game", "team"])
             .sort_index()
         )
 
-    def read_lineup(  # noqa: C901
-        self, match_id: Optional[Union[int, list[int]]] = None
-    ) -> pd.DataFrame:
+    def read_lineup(self, match_id: Optional[Union[int, list[int]]] = None) -> pd.DataFrame:
         """Retrieve lineups for the selected leagues and seasons.
 
         Parameters
@@ -226,6 +224,39 @@ class ESPN(BaseRequestsReader):
         -------
         pd.DataFrame.
         """
+        df_list = [player for players in self._iter_lineup(match_id) for player in players]
+        return self._format_lineup(df_list)
+
+    def iter_lineup(
+        self, match_id: Optional[Union[int, list[int]]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Retrieve lineups for the selected games one game at a time.
+
+        This is the streaming version of :meth:`read_lineup`. The lineups of
+        a game are yielded as soon as the game summary is retrieved. Games
+        without lineup info are skipped.
+
+        Parameters
+        ----------
+        match_id : int or list of int, optional
+            Retrieve the lineup for a specific game.
+
+        Raises
+        ------
+        ValueError
+            If no games with the given IDs were found for the selected seasons and leagues.
+
+        Yields
+        ------
+        pd.DataFrame
+            The lineups of a single game.
+        """
+        for df_list in self._iter_lineup(match_id):
+            if len(df_list) > 0:
+                yield self._format_lineup(df_list)
+
+    def _iter_summaries(self, match_id: Optional[Union[int, list[int]]]) -> Iterator[tuple]:
+        """Yield each selected game in the schedule together with its summary."""
         urlmask = ESPN_API + "/{}/summary?event={}"
         filemask = "Summary_{}.json"
 
@@ -241,13 +272,22 @@ class ESPN(BaseRequestsReader):
         else:
             iterator = df_schedule
 
-        df_list = []
-        for i, match in iterator.iterrows():
-            url = urlmask.format(match["league_id"], match["game_id"])
-            filepath = self.data_dir / filemask.format(match["game_id"])
-            reader = self.get(url, filepath)
-
-            data = json.load(reader)
+        readers = self.get_many(
+            (
+                urlmask.format(match["league_id"], match["game_id"]),
+                self.data_dir / filemask.format(match["game_id"]),
+            )
+            for _, match in iterator.iterrows()
+        )
+        for (_, match), reader in zip(iterator.iterrows(), readers):
+            yield match, load_json(reader)
+
+    def _iter_lineup(  # noqa: C901
+        self, match_id: Optional[Union[int, list[int]]]
+    ) -> Iterator[list[dict]]:
+        """Yield the lineup of each selected game as a list of records."""
+        for match, data in self._iter_summaries(match_id):
+            df_list = []
             for i in range(2):
                 if "roster" not in data["rosters"][i]:
                     logger.info(
@@ -326,14 +366,37 @@ class ESPN(BaseRequestsReader):
                             match_sheet[stat["name"]] = stat["value"]
 
                     df_list.append(match_sheet)
+            yield df_list
 
+    @staticmethod
+    def _format_lineup(df_list: list[dict]) -> pd.DataFrame:
+        """Build a dataframe from the lineups of one or more games."""
         if len(df_list) == 0:
             return pd.DataFrame()
 
         return (
             pd.DataFrame(df_list)
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             .pipe(standardize_colnames)
             .set_index(["league", "season", "game", "team", "player"])
             .sort_index()
         )
+
+
+class AsyncESPN(AsyncBaseRequestsReader):
+    """Asynchronous version of :class:`ESPN`.
+
+    Accepts the same parameters as :class:`ESPN`. All ``read_*`` methods
+    are coroutines.
+
+    Examples
+    --------
+    >>> async with AsyncESPN() as reader:
+    ...     df = await reader.read_schedule()
+    """
+
+    reader_class = ESPN
+
+    read_schedule = awaitable(ESPN.read_schedule)
+    read_matchsheet = awaitable(ESPN.read_matchsheet)
+    read_lineup = awaitable(ESPN.read_lineup)
@@ -1,6 +1,8 @@
 """Scraper for http://fbref.com."""
 
+import re
 import warnings
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from functools import reduce
 from pathlib import Path
@@ -8,15 +10,18 @@ from typing import Callable, Optional, Union
 
 import pandas as pd
 from lxml import etree, html
+from pandas.io.parsers import TextParser
 
+from ._cache import ParseMemo
 from ._common import (
     BaseRequestsReader,
     SeasonCode,
     add_alt_team_names,
-    make_game_id,
+    make_game_ids,
     standardize_colnames,
+    standardize_team_names,
 )
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS, logger
+from ._config import DATA_DIR, NOCACHE, NOSTORE, logger
 
 FBREF_DATADIR = DATA_DIR / "FBref"
 FBREF_API = "https://fbref.com"
@@ -152,7 +157,7 @@ class FBref(BaseRequestsReader):
         dfs = []
         tree = html.parse(reader)
         for html_table in tree.xpath("//table[contains(@id, 'comps')]"):
-            df_table = _parse_table(html_table)
+            df_table = _parse_table(html_table, self._parse_memo)
             df_table["url"] = html_table.xpath(".//th[@data-stat='league_name']/a/@href")
             dfs.append(df_table)
 
@@ -201,7 +206,7 @@ class FBref(BaseRequestsReader):
             # extract season links
             tree = html.parse(reader)
             (html_table,) = tree.xpath("//table[@id='seasons']")
-            df_table = _parse_table(html_table)
+            df_table = _parse_table(html_table, self._parse_memo)
             df_table["url"] = html_table.xpath(
                 "//th[@data-stat='year_id' or @data-stat='year']/a/@href"
             )
@@ -320,7 +325,7 @@ class FBref(BaseRequestsReader):
             (html_table,) = tree.xpath(
                 f"//table[@id='stats_teams_{stat_type}' or @id='stats_squads_{stat_type}']"
             )
-            df_table = _parse_table(html_table)
+            df_table = _parse_table(html_table, self._parse_memo)
             df_table["league"] = lkey
             df_table["season"] = skey
             df_table["url"] = html_table.xpath(".//*[@data-stat='team']/a/@href")
@@ -336,7 +341,7 @@ class FBref(BaseRequestsReader):
         return (
             _concat(teams, key=["league", "season"])
             .rename(columns={"Squad": "team", "# Pl": "players_used"})
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             # .pipe(standardize_colnames)
             .set_index(["league", "season", "team"])
             .sort_index()
@@ -465,7 +470,7 @@ class FBref(BaseRequestsReader):
             for elem in html_table.xpath("//tfoot"):
                 elem.getparent().remove(elem)
             # parse table
-            df_table = _parse_table(html_table)
+            df_table = _parse_table(html_table, self._parse_memo)
             df_table["season"] = skey
             df_table["team"] = team
             df_table["Time"] = [
@@ -487,11 +492,7 @@ class FBref(BaseRequestsReader):
         # return data frame
         df = (
             _concat(stats, key=["league", "season", "team"])
-            .replace(
-                {
-                    "Opponent": TEAMNAME_REPLACEMENTS,
-                }
-            )
+            .pipe(standardize_team_names, cols=["Opponent"])
             .rename(columns={"Comp": "league"})
             .pipe(self._translate_league)
             .pipe(
@@ -513,13 +514,9 @@ class FBref(BaseRequestsReader):
         # create match id column
         df_tmp = df[["team", "opponent", "venue", "date"]].copy()
         df_tmp.columns = ["team", "opponent", "venue", "date"]
-        df_tmp["home_team"] = df_tmp.apply(
-            lambda x: x["team"] if x["venue"] == "Home" else x["opponent"], axis=1
-        )
-        df_tmp["away_team"] = df_tmp.apply(
-            lambda x: x["team"] if x["venue"] == "Away" else x["opponent"], axis=1
-        )
-        df["game"] = df_tmp.apply(make_game_id, axis=1)
+        df_tmp["home_team"] = df_tmp["team"].where(df_tmp["venue"] == "Home", df_tmp["opponent"])
+        df_tmp["away_team"] = df_tmp["team"].where(df_tmp["venue"] == "Away", df_tmp["opponent"])
+        df["game"] = make_game_ids(df_tmp)
         return (
             df
             # .dropna(subset="league")
@@ -612,7 +609,7 @@ class FBref(BaseRequestsReader):
             for elem in tree.xpath("//td[@data-stat='comp_level']//span"):
                 elem.getparent().remove(elem)
             if big_five:
-                df_table = _parse_table(tree)
+                df_table = _parse_table(tree, self._parse_memo)
                 df_table[("Unnamed: league", "league")] = (
                     df_table.xs("Comp", axis=1, level=1).squeeze().map(BIG_FIVE_DICT)
                 )
@@ -624,7 +621,7 @@ class FBref(BaseRequestsReader):
                 (html_table,) = etree.fromstring(el.text, parser).xpath(
                     f"//table[contains(@id, 'stats_{stat_type}')]"
                 )
-                df_table = _parse_table(html_table)
+                df_table = _parse_table(html_table, self._parse_memo)
                 df_table[("Unnamed: league", "league")] = lkey
                 df_table[("Unnamed: season", "season")] = skey
             df_table = _fix_nation_col(df_table)
@@ -637,7 +634,7 @@ class FBref(BaseRequestsReader):
             df.drop("Matches", axis=1, level=0)
             .drop("Rk", axis=1, level=0)
             .rename(columns={"Squad": "team"})
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             .pipe(standardize_colnames, cols=["Player", "Nation", "Pos", "Age", "Born"])
             .set_index(["league", "season", "team", "player"])
             .sort_index()
@@ -678,7 +675,7 @@ class FBref(BaseRequestsReader):
             )
             tree = html.parse(reader)
             html_table = tree.xpath("//table[contains(@id, 'sched')]")[0]
-            df_table = _parse_table(html_table)
+            df_table = _parse_table(html_table, self._parse_memo)
             df_table["Match Report"] = [
                 (
                     mlink.xpath("./a/@href")[0]
@@ -702,16 +699,11 @@ class FBref(BaseRequestsReader):
                     "xG.1": "away_xg",
                 }
             )
-            .replace(
-                {
-                    "home_team": TEAMNAME_REPLACEMENTS,
-                    "away_team": TEAMNAME_REPLACEMENTS,
-                }
-            )
+            .pipe(standardize_team_names, cols=["home_team", "away_team"])
             .pipe(standardize_colnames)
         )
         df["date"] = pd.to_datetime(df["date"]).ffill()
-        df["game"] = df.apply(make_game_id, axis=1)
+        df["game"] = make_game_ids(df)
         df.loc[~df.match_report.isna(), "game_id"] = (
             df.loc[~df.match_report.isna(), "match_report"].str.split("/").str[3]
         )
@@ -774,6 +766,62 @@ class FBref(BaseRequestsReader):
         -------
         pd.DataFrame
         """
+        stats = [
+            table
+            for tables in self._iter_player_match_stats(stat_type, match_id, force_cache)
+            for table in tables
+        ]
+        return self._format_player_match_stats(stats)
+
+    def iter_player_match_stats(
+        self,
+        stat_type: str = "summary",
+        match_id: Optional[Union[str, list[str]]] = None,
+        force_cache: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Retrieve the match stats for the selected games one game at a time.
+
+        This is the streaming version of :meth:`read_player_match_stats`. The
+        stats of a game are yielded as soon as its match report is parsed,
+        such that they can be processed without keeping the stats of all
+        games in memory. Games without stats are skipped. Since the columns
+        are harmonized per game, games of different seasons may yield a
+        different set of columns.
+
+        Parameters
+        ----------
+        stat_type : str
+            Type of stats to retrieve. See :meth:`read_player_match_stats`.
+        match_id : int or list of int, optional
+            Retrieve the stats for a specific game.
+        force_cache : bool
+            By default no cached data is used to scrape the list of available
+            games for the current season. If True, will force the use of
+            cached data anyway.
+
+        Raises
+        ------
+        ValueError
+            If no games with the given IDs were found for the selected seasons and leagues.
+        TypeError
+            If ``stat_type`` is not valid.
+
+        Yields
+        ------
+        pd.DataFrame
+            The player stats of a single game.
+        """
+        for stats in self._iter_player_match_stats(stat_type, match_id, force_cache):
+            if len(stats) > 0:
+                yield self._format_player_match_stats(stats)
+
+    def _iter_player_match_stats(
+        self,
+        stat_type: str,
+        match_id: Optional[Union[str, list[str]]],
+        force_cache: bool,
+    ) -> Iterator[list[pd.DataFrame]]:
+        """Yield the parsed player stats tables of each selected game."""
         match_stats = [
             "summary",
             "keepers",
@@ -790,22 +838,14 @@ class FBref(BaseRequestsReader):
         if stat_type not in match_stats:
             raise TypeError(f"Invalid argument: stat_type should be in {match_stats}")
 
-        # Retrieve games for which a match report is available
-        df_schedule = self.read_schedule(force_cache).reset_index()
-        df_schedule = df_schedule[~df_schedule.game_id.isna() & ~df_schedule.match_report.isnull()]
-        # Selec requested games if available
-        if match_id is not None:
-            iterator = df_schedule[
-                df_schedule.game_id.isin([match_id] if isinstance(match_id, str) else match_id)
-            ]
-            if len(iterator) == 0:
-                raise ValueError("No games found with the given IDs in the selected seasons.")
-        else:
-            iterator = df_schedule
+        iterator = self._select_match_reports(match_id, force_cache)
+        readers = self.get_many(
+            (urlmask.format(game["game_id"]), self.data_dir / filemask.format(game["game_id"]))
+            for _, game in iterator.iterrows()
+        )
 
-        stats = []
-        for i, game in iterator.reset_index().iterrows():
-            url = urlmask.format(game["game_id"])
+        for (i, game), reader in zip(iterator.iterrows(), readers):
+            stats = []
             # get league and season
             logger.info(
                 "[%s/%s] Retrieving game with id=%s",
@@ -813,14 +853,12 @@ class FBref(BaseRequestsReader):
                 len(iterator),
                 game["game_id"],
             )
-            filepath = self.data_dir / filemask.format(game["game_id"])
-            reader = self.get(url, filepath)
             tree = html.parse(reader)
             (home_team, away_team) = self._parse_teams(tree)
             id_format = "keeper_stats_{}" if stat_type == "keepers" else "stats_{}_" + stat_type
             html_table = tree.find("//table[@id='" + id_format.format(home_team["id"]) + "']")
             if html_table is not None:
-                df_table = _parse_table(html_table)
+                df_table = _parse_table(html_table, self._parse_memo)
                 df_table["team"] = home_team["name"]
                 df_table["game"] = game["game"]
                 df_table["league"] = game["league"]
@@ -831,7 +869,7 @@ class FBref(BaseRequestsReader):
                 logger.warning("No stats found for home team for game with id=%s", game["game_id"])
             html_table = tree.find("//table[@id='" + id_format.format(away_team["id"]) + "']")
             if html_table is not None:
-                df_table = _parse_table(html_table)
+                df_table = _parse_table(html_table, self._parse_memo)
                 df_table["team"] = away_team["name"]
                 df_table["game"] = game["game"]
                 df_table["league"] = game["league"]
@@ -840,12 +878,16 @@ class FBref(BaseRequestsReader):
                 stats.append(df_table)
             else:
                 logger.warning("No stats found for away team for game with id=%s", game["game_id"])
+            yield stats
 
+    @staticmethod
+    def _format_player_match_stats(stats: list[pd.DataFrame]) -> pd.DataFrame:
+        """Combine the player stats tables of one or more games."""
         df = _concat(stats, key=["game"])
         df = df[~df.Player.str.contains(r"^\d+\sPlayers$")]
         return (
             df.rename(columns={"#": "jersey_number"})
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             .pipe(standardize_colnames, cols=["Player", "Nation", "Pos", "Age", "Min"])
             .set_index(["league", "season", "game", "team", "player"])
             .sort_index()
@@ -876,24 +918,56 @@ class FBref(BaseRequestsReader):
         -------
         pd.DataFrame.
         """
+        lineups = [
+            table for tables in self._iter_lineup(match_id, force_cache) for table in tables
+        ]
+        return pd.concat(lineups).set_index(["league", "season", "game"])
+
+    def iter_lineup(
+        self,
+        match_id: Optional[Union[str, list[str]]] = None,
+        force_cache: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Retrieve lineups for the selected games one game at a time.
+
+        This is the streaming version of :meth:`read_lineup`. The lineups of
+        a game are yielded as soon as its match report is parsed.
+
+        Parameters
+        ----------
+        match_id : int or list of int, optional
+            Retrieve the lineup for a specific game.
+        force_cache : bool
+            By default no cached data is used to scrape the list of available
+            games for the current season. If True, will force the use of
+            cached data anyway.
+
+        Raises
+        ------
+        ValueError
+            If no games with the given IDs were found for the selected seasons and leagues.
+
+        Yields
+        ------
+        pd.DataFrame
+            The lineups of a single game.
+        """
+        for lineups in self._iter_lineup(match_id, force_cache):
+            if len(lineups) > 0:
+                yield pd.concat(lineups).set_index(["league", "season", "game"])
+
+    def _iter_lineup(
+        self,
+        match_id: Optional[Union[str, list[str]]],
+        force_cache: bool,
+    ) -> Iterator[list[pd.DataFrame]]:
+        """Yield the parsed lineup tables of each selected game."""
         urlmask = FBREF_API + "/en/matches/{}"
         filemask = "match_{}.html"
 
-        # Retrieve games for which a match report is available
-        df_schedule = self.read_schedule(force_cache).reset_index()
-        df_schedule = df_schedule[~df_schedule.game_id.isna() & ~df_schedule.match_report.isnull()]
-        # Select requested games if available
-        if match_id is not None:
-            iterator = df_schedule[
-                df_schedule.game_id.isin([match_id] if isinstance(match_id, str) else match_id)
-            ]
-            if len(iterator) == 0:
-                raise ValueError("No games found with the given IDs in the selected seasons.")
-        else:
-            iterator = df_schedule
-
-        lineups = []
-        for i, game in iterator.reset_index().iterrows():
+        iterator = self._select_match_reports(match_id, force_cache)
+        for i, game in iterator.iterrows():
+            lineups = []
             url = urlmask.format(game["game_id"])
             # get league and season
             logger.info(
@@ -909,7 +983,7 @@ class FBref(BaseRequestsReader):
             html_tables = tree.xpath("//div[@class='lineup']")
             for i, html_table in enumerate(html_tables):
                 # parse lineup table
-                df_table = _parse_table(html_table)
+                df_table = _parse_table(html_table, self._parse_memo)
                 df_table.columns = ["jersey_number", "player"]
                 df_table["team"] = teams[i]["name"]
                 if "Bench" in df_table.jersey_number.values:
@@ -925,7 +999,7 @@ class FBref(BaseRequestsReader):
                 html_stats_table = tree.find(
                     "//table[@id='" + "stats_{}_summary".format(teams[i]["id"]) + "']"
                 )
-                df_stats_table = _parse_table(html_stats_table)
+                df_stats_table = _parse_table(html_stats_table, self._parse_memo)
                 df_stats_table = df_stats_table.droplevel(0, axis=1)[["Player", "#", "Pos", "Min"]]
                 df_stats_table.columns = [
                     "player",
@@ -940,7 +1014,30 @@ class FBref(BaseRequestsReader):
                 )
                 df_table["minutes_played"] = df_table["minutes_played"].fillna(0)
                 lineups.append(df_table)
-        return pd.concat(lineups).set_index(["league", "season", "game"])
+            yield lineups
+
+    def _select_match_reports(
+        self, match_id: Optional[Union[str, list[str]]], force_cache: bool
+    ) -> pd.DataFrame:
+        """Return the selected games for which a match report is available.
+
+        Raises
+        ------
+        ValueError
+            If no games with the given IDs were found for the selected seasons and leagues.
+        """
+        df_schedule = self.read_schedule(force_cache).reset_index()
+        df_schedule = df_schedule[~df_schedule.game_id.isna() & ~df_schedule.match_report.isnull()]
+        # Select requested games if available
+        if match_id is not None:
+            iterator = df_schedule[
+                df_schedule.game_id.isin([match_id] if isinstance(match_id, str) else match_id)
+            ]
+            if len(iterator) == 0:
+                raise ValueError("No games found with the given IDs in the selected seasons.")
+        else:
+            iterator = df_schedule
+        return iterator.reset_index()
 
     def read_events(
         self,
@@ -1035,7 +1132,7 @@ class FBref(BaseRequestsReader):
 
         return (
             pd.concat(events)
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             .set_index(["league", "season", "game"])
             .sort_index()
             .dropna(how="all")
@@ -1101,7 +1198,7 @@ class FBref(BaseRequestsReader):
             tree = html.parse(reader)
             html_table = tree.find("//table[@id='shots_all']")
             if html_table is not None:
-                df_table = _parse_table(html_table)
+                df_table = _parse_table(html_table, self._parse_memo)
                 df_table["league"] = game["league"]
                 df_table["season"] = game["season"]
                 df_table["game"] = game["game"]
@@ -1115,7 +1212,7 @@ class FBref(BaseRequestsReader):
         return (
             _concat(shots, key=["game"])
             .rename(columns={"Squad": "team"})
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             .pipe(
                 standardize_colnames,
                 cols=[
@@ -1134,13 +1231,15 @@ class FBref(BaseRequestsReader):
         )
 
 
-def _parse_table(html_table: html.HtmlElement) -> pd.DataFrame:
+def _parse_table(html_table: html.HtmlElement, memo: Optional[ParseMemo] = None) -> pd.DataFrame:
     """Parse HTML table into a dataframe.
 
     Parameters
     ----------
     html_table : lxml.html.HtmlElement
         HTML table to clean up.
+    memo : ParseMemo, optional
+        If given, a table that was parsed before is not parsed again.
 
     Returns
     -------
@@ -1156,10 +1255,91 @@ def _parse_table(html_table: html.HtmlElement) -> pd.DataFrame:
     for elem in html_table.xpath("//tbody/tr[contains(@class, 'thead')]"):
         elem.getparent().remove(elem)
     # parse HTML to dataframe
-    (df_table,) = pd.read_html(html.tostring(html_table), flavor="lxml")
+    if memo is not None:
+        return memo.get(
+            "fbref-table", html.tostring(html_table), lambda content: _read_table(html_table)
+        )
+    return _read_table(html_table)
+
+
+def _read_html_table(content: bytes) -> pd.DataFrame:
+    (df_table,) = pd.read_html(content, flavor="lxml")
+    return df_table.convert_dtypes()
+
+
+_RE_WHITESPACE = re.compile(r"[\r\n]+|\s{2,}")
+_text_content = etree.XPath("string()")
+
+
+def _read_table(html_table: etree._Element) -> pd.DataFrame:
+    """Convert an HTML table to a dataframe.
+
+    The cells of the already parsed table are read directly, which avoids
+    serializing the table and parsing it again with ``pd.read_html``. The
+    result is identical to that of ``pd.read_html``. Tables with a layout
+    that is not supported by this fast path are passed to ``pd.read_html``.
+    """
+    table_rows = _read_table_rows(html_table)
+    if table_rows is None:
+        return _read_html_table(html.tostring(html_table))
+    head, body = table_rows
+    header: Union[int, list[int]] = (
+        0 if len(head) == 1 else [i for i, row in enumerate(head) if any(row)]
+    )
+    # fill out rows that are "ragged"
+    width = max(len(row) for row in head + body)
+    rows = [row + [""] * (width - len(row)) for row in head + body]
+    with TextParser(rows, header=header, thousands=",") as parser:
+        df_table = parser.read()
     return df_table.convert_dtypes()
 
 
+def _read_table_rows(
+    html_table: etree._Element,
+) -> Optional[tuple[list[list[str]], list[list[str]]]]:
+    """Return the text of the header rows and the body and footer rows of a table.
+
+    Returns None if the table is hidden, contains nested tables, line breaks,
+    style rules or cells that span multiple rows, or if it has no header. Body
+    cells that span multiple columns are not supported either.
+    """
+    tables = html_table.xpath("descendant-or-self::table")
+    if len(tables) != 1:
+        return None
+    (table,) = tables
+    if (
+        "display:none" in table.get("style", "").replace(" ", "")
+        or table.xpath(".//br|.//style|.//*[@rowspan]|./thead/th|./thead/td")
+        or any(
+            "display:none" in elem.get("style", "").replace(" ", "")
+            for elem in table.xpath(".//*[@style]")
+        )
+    ):
+        return None
+
+    def _cells(tr: etree._Element) -> list[tuple[str, int]]:
+        cells = []
+        for cell in tr:
+            if cell.tag not in ("td", "th"):
+                continue
+            text = (cell.text or "") if len(cell) == 0 else _text_content(cell)
+            cells.append((_RE_WHITESPACE.sub(" ", text.strip()), int(cell.get("colspan") or 1)))
+        return cells
+
+    head = []
+    for tr in table.xpath(".//thead/tr"):
+        head.append([text for text, colspan in _cells(tr) for _ in range(colspan)])
+    body = []
+    for tr in table.xpath(".//tbody//tr") + table.xpath("./tr") + table.xpath(".//tfoot//tr"):
+        cells = _cells(tr)
+        if any(colspan > 1 for _, colspan in cells):
+            return None
+        body.append([text for text, _ in cells])
+    if len(head) == 0 or len(body) == 0:
+        return None
+    return head, body
+
+
 def _concat(dfs: list[pd.DataFrame], key: list[str]) -> pd.DataFrame:
     """Merge matching tables scraped from different pages.
 
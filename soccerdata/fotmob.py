@@ -1,7 +1,6 @@
 """Scraper for http://fotmob.com."""
 
 import itertools
-import json
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Callable, Optional, Union
@@ -9,8 +8,16 @@ from typing import Callable, Optional, Union
 import pandas as pd
 import tls_requests
 
-from ._common import BaseRequestsReader, add_standardized_team_name, make_game_id
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS, logger
+from ._common import (
+    AsyncBaseRequestsReader,
+    BaseRequestsReader,
+    add_standardized_team_name,
+    awaitable,
+    load_json,
+    make_game_ids,
+    standardize_team_names,
+)
+from ._config import DATA_DIR, NOCACHE, NOSTORE, logger
 
 FOTMOB_DATADIR = DATA_DIR / "FotMob"
 FOTMOB_API = "https://www.fotmob.com/api/"
@@ -64,6 +71,7 @@ class FotMob(BaseRequestsReader):
             no_store=no_store,
             data_dir=data_dir,
         )
+        self.max_concurrency = 2
         self.seasons = seasons
         if not self.no_store:
             (self.data_dir / "leagues").mkdir(parents=True, exist_ok=True)
@@ -94,7 +102,7 @@ class FotMob(BaseRequestsReader):
         url = FOTMOB_API + "allLeagues"
         filepath = self.data_dir / "allLeagues.json"
         reader = self.get(url, filepath)
-        data = json.load(reader)
+        data = load_json(reader)
         leagues = []
         for k, v in data.items():
             if k == "international":
@@ -143,7 +151,7 @@ class FotMob(BaseRequestsReader):
             url = urlmask.format(league.league_id)
             filepath = self.data_dir / filemask.format(lkey)
             reader = self.get(url, filepath)
-            data = json.load(reader)
+            data = load_json(reader)
             # extract season IDs
             avail_seasons = data["allAvailableSeasons"]
             for season in avail_seasons:
@@ -189,7 +197,7 @@ class FotMob(BaseRequestsReader):
             url = urlmask.format(season.league_id, season.season_id)
             current_season = not self._is_complete(lkey, skey)
             reader = self.get(url, filepath, no_cache=current_season and not force_cache)
-            season_data = json.load(reader)
+            season_data = load_json(reader)
             table_data = season_data["table"][0]["data"]
             if "tables" in table_data:
                 if "stage" not in idx:
@@ -241,7 +249,7 @@ class FotMob(BaseRequestsReader):
         return (
             pd.concat(mult_tables, axis=0)
             .rename(columns={"Squad": "team"})
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             .set_index(idx)
             .sort_index()[cols]
         )
@@ -282,7 +290,7 @@ class FotMob(BaseRequestsReader):
             url = urlmask.format(season.league_id, season.season_id)
             current_season = not self._is_complete(lkey, skey)
             reader = self.get(url, filepath, no_cache=current_season and not force_cache)
-            season_data = json.load(reader)
+            season_data = load_json(reader)
 
             df = pd.json_normalize(season_data["fixtures"]["allMatches"])
             df["league"] = lkey
@@ -303,15 +311,10 @@ class FotMob(BaseRequestsReader):
                     "id": "game_id",
                 }
             )
-            .replace(
-                {
-                    "home_team": TEAMNAME_REPLACEMENTS,
-                    "away_team": TEAMNAME_REPLACEMENTS,
-                }
-            )
+            .pipe(standardize_team_names, cols=["home_team", "away_team"])
             .assign(date=lambda x: pd.to_datetime(x["status.utcTime"], format="mixed"))
         )
-        df["game"] = df.apply(make_game_id, axis=1)
+        df["game"] = make_game_ids(df)
         df["url"] = "https://fotmob.com" + df["url"]
         df[["home_score", "away_score"]] = df["status.scoreStr"].str.split("-", expand=True)
         return df.set_index(["league", "season", "game"]).sort_index()[cols]
@@ -322,6 +325,7 @@ class FotMob(BaseRequestsReader):
         opponent_stats: bool = True,
         team: Optional[Union[str, list[str]]] = None,
         force_cache: bool = False,
+        match_id: Optional[Union[int, list[int]]] = None,
     ) -> pd.DataFrame:
         """Retrieve the match stats for the selected leagues and seasons.
 
@@ -346,6 +350,8 @@ class FotMob(BaseRequestsReader):
             By default no cached data is used to scrape the list of available
             games for the current season. If True, will force the use of
             cached data anyway.
+        match_id : int or list of int, optional
+            Retrieve the match stats for specific games.
 
         Raises
         ------
@@ -364,6 +370,14 @@ class FotMob(BaseRequestsReader):
         # Retrieve games for which a match report is available
         df_matches = self.read_schedule(force_cache)
         df_complete = df_matches.loc[df_matches["status"].isin(["FT", "AET", "Pen"])]
+        if match_id is not None:
+            df_complete = df_complete[
+                df_complete.game_id.isin([match_id] if isinstance(match_id, int) else match_id)
+            ]
+            if len(df_complete) == 0:
+                raise ValueError(
+                    "No games with the given IDs found for the selected seasons and leagues."
+                )
 
         if team is not None:
             # get alternative names of the specified team(s)
@@ -382,20 +396,26 @@ class FotMob(BaseRequestsReader):
             iterator = df_complete
             teams_to_check = iterator.home_team.tolist() + iterator.away_team.tolist()
 
+        iterator = iterator.reset_index()
+        readers = self.get_many(
+            (
+                urlmask.format(game.game_id),
+                self.data_dir / filemask.format(game["league"], game["season"], game.game_id),
+            )
+            for _, game in iterator.iterrows()
+        )
+
         stats = []
-        for i, game in iterator.reset_index().iterrows():
+        for (i, game), reader in zip(iterator.iterrows(), readers):
             lkey, skey, gkey = game["league"], game["season"], game["game"]
             # Get data for specific game
-            url = urlmask.format(game.game_id)
-            filepath = self.data_dir / filemask.format(lkey, skey, game.game_id)
-            reader = self.get(url, filepath)
             logger.info(
                 "[%s/%s] Retrieving game with id=%s",
                 i + 1,
                 len(iterator),
                 game["game_id"],
             )
-            game_data = json.load(reader)
+            game_data = load_json(reader)
 
             # Get stats types
             all_stats = game_data["content"]["stats"]["Periods"]["All"]["stats"]
@@ -429,3 +449,24 @@ class FotMob(BaseRequestsReader):
             df[[col, col + " (%)"]] = df[col].str.split(expand=True)
             df[col + " (%)"] = df[col + " (%)"].str.extract(r"(\d+)").astype(float).div(100)
         return df
+
+
+class AsyncFotMob(AsyncBaseRequestsReader):
+    """Asynchronous version of :class:`FotMob`.
+
+    Accepts the same parameters as :class:`FotMob`. All ``read_*`` methods
+    are coroutines.
+
+    Examples
+    --------
+    >>> async with AsyncFotMob() as reader:
+    ...     df = await reader.read_schedule()
+    """
+
+    reader_class = FotMob
+
+    read_leagues = awaitable(FotMob.read_leagues)
+    read_seasons = awaitable(FotMob.read_seasons)
+    read_league_table = awaitable(FotMob.read_league_table)
+    read_schedule = awaitable(FotMob.read_schedule)
+    read_team_match_stats = awaitable(FotMob.read_team_match_stats)
@@ -6,8 +6,8 @@ from typing import IO, Callable, Optional, Union
 
 import pandas as pd
 
-from ._common import BaseRequestsReader, make_game_id
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS, logger
+from ._common import BaseRequestsReader, make_game_ids, standardize_team_names
+from ._config import DATA_DIR, NOCACHE, NOSTORE, logger
 
 MATCH_HISTORY_DATA_DIR = DATA_DIR / "MatchHistory"
 MATCH_HISTORY_API = "https://www.football-data.co.uk"
@@ -120,17 +120,12 @@ class MatchHistory(BaseRequestsReader):
             )
             .drop("time", axis=1)
             .pipe(self._translate_league)
-            .replace(
-                {
-                    "home_team": TEAMNAME_REPLACEMENTS,
-                    "away_team": TEAMNAME_REPLACEMENTS,
-                }
-            )
+            .pipe(standardize_team_names, cols=["home_team", "away_team"])
             .dropna(subset=["home_team", "away_team"])
         )
 
         df = df.loc[:, ~df.columns.str.contains("^Unnamed")]
-        df["game"] = df.apply(make_game_id, axis=1)
+        df["game"] = make_game_ids(df)
         df.set_index(["league", "season", "game"], inplace=True)
         df.sort_index(inplace=True)
         return df
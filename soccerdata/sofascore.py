@@ -1,7 +1,6 @@
 """Scraper for https://www.sofascore.com/."""
 
 import itertools
-import json
 from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,8 +8,16 @@ from typing import Callable, Optional, Union
 
 import pandas as pd
 
-from ._common import BaseRequestsReader, make_game_id
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS
+from ._cache import open_cached
+from ._common import (
+    AsyncBaseRequestsReader,
+    BaseRequestsReader,
+    awaitable,
+    load_json,
+    make_game_ids,
+    standardize_team_names,
+)
+from ._config import DATA_DIR, NOCACHE, NOSTORE, logger
 
 SOFASCORE_DATADIR = DATA_DIR / "Sofascore"
 SOFASCORE_API = "https://api.sofascore.com/api/v1/"
@@ -80,7 +87,7 @@ class Sofascore(BaseRequestsReader):
         url = SOFASCORE_API + "config/default-unique-tournaments/EN/football"
         filepath = self.data_dir / "leagues.json"
         reader = self.get(url, filepath)
-        data = json.load(reader)
+        data = load_json(reader)
         leagues = []
         for k in data["uniqueTournaments"]:
             leagues.append(
@@ -113,7 +120,7 @@ class Sofascore(BaseRequestsReader):
             url = SOFASCORE_API + "unique-tournament/{}/seasons"
             filepath = self.data_dir / filemask.format(lkey)
             reader = self.get(url.format(league.league_id), filepath)
-            data = json.load(reader)["seasons"]
+            data = load_json(reader)["seasons"]
             for season in data:
                 seasons.append(
                     {
@@ -154,7 +161,7 @@ class Sofascore(BaseRequestsReader):
             url = urlmask.format(season.league_id, season.season_id)
             current_season = not self._is_complete(lkey, skey)
             reader = self.get(url, filepath, no_cache=current_season and not force_cache)
-            season_data = json.load(reader)
+            season_data = load_json(reader)
             for row in season_data["standings"][0]["rows"]:
                 mult_tables.append(
                     {
@@ -174,7 +181,7 @@ class Sofascore(BaseRequestsReader):
             df = (
                 pd.DataFrame(mult_tables)
                 .set_index(idx)
-                .replace({"team": TEAMNAME_REPLACEMENTS})
+                .pipe(standardize_team_names)
                 .sort_index()[cols]
             )
         return df
@@ -215,14 +222,36 @@ class Sofascore(BaseRequestsReader):
             url1 = urlmask1.format(season["league_id"], season["season_id"])
             current_season = not self._is_complete(lkey, skey)
             reader1 = self.get(url1, filepath1, no_cache=current_season and not force_cache)
-            season_data = json.load(reader1)
+            season_data = load_json(reader1)
             rounds = season_data["rounds"]
 
-            for round in rounds:  # noqa: A001
+            cached, refresh = [], []
+            for round in rounds:
                 filepath2 = self.data_dir / filemask2.format(lkey, skey, round["round"])
-                url2 = urlmask2.format(season["league_id"], season["season_id"], round["round"])
-                reader2 = self.get(url2, filepath2, no_cache=current_season and not force_cache)
-                match_data = json.load(reader2)
+                page = (
+                    round,
+                    urlmask2.format(season["league_id"], season["season_id"], round["round"]),
+                    filepath2,
+                )
+                if (
+                    current_season
+                    and not force_cache
+                    and (
+                        self.incremental_lookback is None
+                        or self._needs_refresh(filepath2, self._round_end(filepath2))
+                    )
+                ):
+                    refresh.append(page)
+                else:
+                    cached.append(page)
+            readers = itertools.chain(
+                self.get_many([(url2, filepath2) for _, url2, filepath2 in cached]),
+                self.get_many(
+                    [(url2, filepath2) for _, url2, filepath2 in refresh], no_cache=True
+                ),
+            )
+            for (round, _, _), reader2 in zip(cached + refresh, readers):
+                match_data = load_json(reader2)
                 for _match in match_data["events"]:
                     if _match["status"]["code"] == 100 or _match["status"]["code"] == 0:
                         if _match["status"]["code"] == 100:
@@ -249,11 +278,44 @@ class Sofascore(BaseRequestsReader):
                             }
                         )
 
-        df = pd.DataFrame(all_schedules).replace(
-            {
-                "home_team": TEAMNAME_REPLACEMENTS,
-                "away_team": TEAMNAME_REPLACEMENTS,
-            }
-        )
-        df["game"] = df.apply(make_game_id, axis=1)
+        df = standardize_team_names(pd.DataFrame(all_schedules), cols=["home_team", "away_team"])
+        df["game"] = make_game_ids(df)
         return df.set_index(["league", "season", "game"]).sort_index()[cols]
+
+    def _round_end(self, filepath: Path) -> Optional[datetime]:
+        """Return the start time of the last match in a cached round.
+
+        Returns None if the round is not cached, if the cached data cannot be
+        read or if not all of its matches are finished.
+        """
+        if self.cache.lookup(filepath) is None:
+            return None
+        try:
+            with open_cached(filepath, self.mmap_cache) as fh:
+                events = load_json(fh)["events"]
+        except (OSError, EOFError, ValueError, KeyError):
+            logger.debug("Could not read the cached round %s", filepath)
+            return None
+        if len(events) == 0 or any(e["status"]["code"] != 100 for e in events):
+            return None
+        return datetime.fromtimestamp(max(e["startTimestamp"] for e in events), tz=timezone.utc)
+
+
+class AsyncSofascore(AsyncBaseRequestsReader):
+    """Asynchronous version of :class:`Sofascore`.
+
+    Accepts the same parameters as :class:`Sofascore`. All ``read_*`` methods
+    are coroutines.
+
+    Examples
+    --------
+    >>> async with AsyncSofascore() as reader:
+    ...     df = await reader.read_schedule()
+    """
+
+    reader_class = Sofascore
+
+    read_leagues = awaitable(Sofascore.read_leagues)
+    read_seasons = awaitable(Sofascore.read_seasons)
+    read_league_table = awaitable(Sofascore.read_league_table)
+    read_schedule = awaitable(Sofascore.read_schedule)
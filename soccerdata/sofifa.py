@@ -1,6 +1,5 @@
 """Scraper for http://sofifa.com."""
 
-import json
 import re
 from datetime import timedelta
 from itertools import product
@@ -13,10 +12,12 @@ from lxml import html
 from ._common import (
     BaseRequestsReader,
     add_standardized_team_name,
+    load_json,
     safe_xpath_text,
     standardize_colnames,
+    standardize_team_names,
 )
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS, logger
+from ._config import DATA_DIR, NOCACHE, NOSTORE, logger
 
 SO_FIFA_DATADIR = DATA_DIR / "SoFIFA"
 SO_FIFA_API = "https://sofifa.com"
@@ -95,7 +96,7 @@ class SoFIFA(BaseRequestsReader):
         filepath = self.data_dir / "leagues.json"
         urlmask = SO_FIFA_API + "/api/league"
         reader = self.get(urlmask, filepath)
-        response = json.load(reader)
+        response = load_json(reader)
 
         # extract league links
         leagues = []
@@ -209,7 +210,7 @@ class SoFIFA(BaseRequestsReader):
                 )
 
         # return data frame
-        return pd.DataFrame(teams).replace({"team": TEAMNAME_REPLACEMENTS}).set_index(["team_id"])
+        return pd.DataFrame(teams).pipe(standardize_team_names).set_index(["team_id"])
 
     def read_players(self, team: Optional[Union[str, list[str]]] = None) -> pd.DataFrame:
         """Retrieve all players for the selected leagues.
@@ -367,7 +368,7 @@ class SoFIFA(BaseRequestsReader):
         # return data frame
         return (
             pd.DataFrame(teams)
-            .replace({"team": TEAMNAME_REPLACEMENTS})
+            .pipe(standardize_team_names)
             .set_index(["league", "team"])
             .sort_index()
         )
@@ -1,18 +1,25 @@
 """Scraper for understat.com."""
 
 import itertools
-import io
-import json
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from html import unescape
 from pathlib import Path
-from typing import Any, Callable, IO, Optional, Union
+from typing import Any, Callable, Optional, Union
 
+import numpy as np
 import pandas as pd
-
-from ._common import BaseRequestsReader, make_game_id
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS
+import tls_requests
+
+from ._common import (
+    AsyncBaseRequestsReader,
+    BaseRequestsReader,
+    awaitable,
+    load_json,
+    make_game_ids,
+    standardize_team_names,
+)
+from ._config import DATA_DIR, NOCACHE, NOSTORE, logger
 
 UNDERSTAT_DATADIR = DATA_DIR / "Understat"
 UNDERSTAT_URL = "https://understat.com"
@@ -40,6 +47,38 @@ SHOT_RESULTS = {
     "ShotOnPost": "Shot On Post",
 }
 
+PLAYER_SEASON_STATS = {
+    "matches": ("games", int),
+    "minutes": ("time", int),
+    "goals": ("goals", int),
+    "xg": ("xG", float),
+    "np_goals": ("npg", int),
+    "np_xg": ("npxG", float),
+    "assists": ("assists", int),
+    "xa": ("xA", float),
+    "shots": ("shots", int),
+    "key_passes": ("key_passes", int),
+    "yellow_cards": ("yellow_cards", int),
+    "red_cards": ("red_cards", int),
+    "xg_chain": ("xGChain", float),
+    "xg_buildup": ("xGBuildup", float),
+}
+
+PLAYER_MATCH_STATS = {
+    "minutes": ("time", int),
+    "goals": ("goals", int),
+    "own_goals": ("own_goals", int),
+    "shots": ("shots", int),
+    "xg": ("xG", float),
+    "xg_chain": ("xGChain", float),
+    "xg_buildup": ("xGBuildup", float),
+    "assists": ("assists", int),
+    "xa": ("xA", float),
+    "key_passes": ("key_passes", int),
+    "yellow_cards": ("yellow_card", int),
+    "red_cards": ("red_card", int),
+}
+
 
 class Understat(BaseRequestsReader):
     """Provides pd.DataFrames from data at https://understat.com.
@@ -83,15 +122,19 @@ class Understat(BaseRequestsReader):
             no_cache=no_cache,
             no_store=no_store,
             data_dir=data_dir,
+            headers=UNDERSTAT_HEADERS,
         )
         self.seasons = seasons
-        self._cookies_initialized = False
 
-    def _ensure_cookies(self) -> None:
-        """Ensure the session has cookies from the homepage."""
-        if not self._cookies_initialized:
-            self._session.get(UNDERSTAT_URL)
-            self._cookies_initialized = True
+    def _init_session(self, headers: Optional[dict[str, str]] = None) -> tls_requests.Client:
+        session = super()._init_session(headers)
+        # The API only responds to sessions with the cookies of the homepage
+        self._wait_for_rate_limit(UNDERSTAT_URL)
+        try:
+            session.get(UNDERSTAT_URL)
+        except tls_requests.exceptions.HTTPError:
+            logger.warning("Could not load the cookies of %s", UNDERSTAT_URL)
+        return session
 
     def read_leagues(self) -> pd.DataFrame:
         """Retrieve the selected leagues from the datasource.
@@ -247,13 +290,8 @@ class Understat(BaseRequestsReader):
         df = (
             pd.DataFrame.from_records(matches)
             .assign(date=lambda g: pd.to_datetime(g["date"], format="%Y-%m-%d %H:%M:%S"))
-            .replace(
-                {
-                    "home_team": TEAMNAME_REPLACEMENTS,
-                    "away_team": TEAMNAME_REPLACEMENTS,
-                }
-            )
-            .assign(game=lambda g: g.apply(make_game_id, axis=1))
+            .pipe(standardize_team_names, cols=["home_team", "away_team"])
+            .assign(game=make_game_ids)
             .set_index(index)
             .sort_index()
             .convert_dtypes()
@@ -279,7 +317,8 @@ class Understat(BaseRequestsReader):
         """
         df_seasons = self.read_seasons()
 
-        stats = {}
+        schedule: dict[Optional[int], dict] = {}
+        sides: dict[tuple[Optional[int], str], dict] = {}
 
         for (league, season), league_season in df_seasons.iterrows():
             league_id = league_season["league_id"]
@@ -291,73 +330,79 @@ class Understat(BaseRequestsReader):
 
             data = self._read_league_season(url, league_id, season_id, no_cache)
 
-            schedule = {}
             matches = {}
-
             matches_data = data["datesData"]
             for match in matches_data:
                 match_id = _as_int(match["id"])
-                match_date = match["datetime"]
-                schedule[match_id] = {
-                    "league_id": league_id,
-                    "league": league,
-                    "season_id": season_id,
-                    "season": season,
-                    "game_id": match_id,
-                    "date": match["datetime"],
-                    "home_team_id": _as_int(match["h"]["id"]),
-                    "away_team_id": _as_int(match["a"]["id"]),
-                    "home_team": _as_str(match["h"]["title"]),
-                    "away_team": _as_str(match["a"]["title"]),
-                    "away_team_code": _as_str(match["a"]["short_title"]),
-                    "home_team_code": _as_str(match["h"]["short_title"]),
-                }
+                schedule.setdefault(
+                    match_id,
+                    {
+                        "league_id": league_id,
+                        "league": league,
+                        "season_id": season_id,
+                        "season": season,
+                        "match": match,
+                    },
+                )
                 for side in ("h", "a"):
-                    team_id = _as_int(match[side]["id"])
-                    matches[(match_date, team_id)] = match_id
+                    matches[(match["datetime"], _as_int(match[side]["id"]))] = match_id
 
             teams_data = data["teamsData"]
             for team in teams_data.values():
                 team_id = _as_int(team["id"])
                 for match in team["history"]:
-                    match_date = match["date"]
-                    match_id = matches[(match_date, team_id)]
-                    team_side = match["h_a"]
-                    prefix = "home" if team_side == "h" else "away"
-
-                    if match_id not in stats:
-                        stats[match_id] = schedule[match_id]
-
-                    ppda = match["ppda"]
-                    team_ppda = (ppda["att"] / ppda["def"]) if ppda["def"] != 0 else pd.NA
-
-                    stats[match_id].update(
-                        {
-                            f"{prefix}_points": _as_int(match["pts"]),
-                            f"{prefix}_expected_points": _as_float(match["xpts"]),
-                            f"{prefix}_goals": _as_int(match["scored"]),
-                            f"{prefix}_xg": _as_float(match["xG"]),
-                            f"{prefix}_np_xg": _as_float(match["npxG"]),
-                            f"{prefix}_np_xg_difference": _as_float(match["npxGD"]),
-                            f"{prefix}_ppda": _as_float(team_ppda),
-                            f"{prefix}_deep_completions": _as_int(match["deep"]),
-                        }
-                    )
+                    match_id = matches[(match["date"], team_id)]
+                    sides[(match_id, match["h_a"])] = match
 
         index = ["league", "season", "game"]
-        if len(stats) == 0:
+        match_ids = list(dict.fromkeys(match_id for match_id, _ in sides))
+        if len(match_ids) == 0:
             return pd.DataFrame(index=index)
 
-        return (
-            pd.DataFrame.from_records(list(stats.values()))
-            .assign(date=lambda g: pd.to_datetime(g["date"], format="%Y-%m-%d %H:%M:%S"))
-            .replace(
+        games = [schedule[match_id] for match_id in match_ids]
+        matches_data = [game["match"] for game in games]
+        columns = {
+            "league_id": [game["league_id"] for game in games],
+            "league": [game["league"] for game in games],
+            "season_id": [game["season_id"] for game in games],
+            "season": [game["season"] for game in games],
+            "game_id": match_ids,
+            "date": [match["datetime"] for match in matches_data],
+            "home_team_id": _int_column([match["h"]["id"] for match in matches_data]),
+            "away_team_id": _int_column([match["a"]["id"] for match in matches_data]),
+            "home_team": _str_column([match["h"]["title"] for match in matches_data]),
+            "away_team": _str_column([match["a"]["title"] for match in matches_data]),
+            "away_team_code": _str_column([match["a"]["short_title"] for match in matches_data]),
+            "home_team_code": _str_column([match["h"]["short_title"] for match in matches_data]),
+        }
+        for side, prefix in (("h", "home"), ("a", "away")):
+            history = [sides.get((match_id, side), {}) for match_id in match_ids]
+            ppda_att = _float_column([match.get("ppda", {}).get("att") for match in history])
+            ppda_def = _float_column([match.get("ppda", {}).get("def") for match in history])
+            columns.update(
                 {
-                    "home_team": TEAMNAME_REPLACEMENTS,
-                    "away_team": TEAMNAME_REPLACEMENTS,
+                    f"{prefix}_points": _int_column([match.get("pts") for match in history]),
+                    f"{prefix}_expected_points": _float_column(
+                        [match.get("xpts") for match in history]
+                    ),
+                    f"{prefix}_goals": _int_column([match.get("scored") for match in history]),
+                    f"{prefix}_xg": _float_column([match.get("xG") for match in history]),
+                    f"{prefix}_np_xg": _float_column([match.get("npxG") for match in history]),
+                    f"{prefix}_np_xg_difference": _float_column(
+                        [match.get("npxGD") for match in history]
+                    ),
+                    f"{prefix}_ppda": (ppda_att / ppda_def).where(ppda_def != 0),
+                    f"{prefix}_deep_completions": _int_column(
+                        [match.get("deep") for match in history]
+                    ),
                 }
             )
-            .assign(game=lambda g: g.apply(make_game_id, axis=1))
+
+        return (
+            pd.DataFrame(columns)
+            .assign(date=lambda g: pd.to_datetime(g["date"], format="%Y-%m-%d %H:%M:%S"))
+            .pipe(standardize_team_names, cols=["home_team", "away_team"])
+            .assign(game=make_game_ids)
             .set_index(index)
             .sort_index()
             .convert_dtypes()
@@ -378,7 +423,15 @@ class Understat(BaseRequestsReader):
         """
         df_seasons = self.read_seasons()
 
-        stats = []
+        players: list[dict] = []
+        context: dict[str, list] = {
+            "league": [],
+            "league_id": [],
+            "season": [],
+            "season_id": [],
+            "team": [],
+            "team_id": [],
+        }
         for (league, season), league_season in df_seasons.iterrows():
             league_id = league_season["league_id"]
             season_id = league_season["season_id"]
@@ -397,51 +450,34 @@ class Understat(BaseRequestsReader):
                 team_mapping[team_name] = team_id
 
             players_data = data["playersData"]
-            for player in players_data:
-                player_team_name = player["team_title"]
-                if "," in player_team_name:  # pick first team if multiple teams are listed
-                    player_team_name = player_team_name.split(",")[0]
-                player_team_name = _as_str(player_team_name)
-                player_team_id = team_mapping[player_team_name]
-                stats.append(
-                    {
-                        "league": league,
-                        "league_id": league_id,
-                        "season": season,
-                        "season_id": season_id,
-                        "team": player_team_name,
-                        "team_id": player_team_id,
-                        "player": _as_str(player["player_name"]),
-                        "player_id": _as_int(player["id"]),
-                        "position": _as_str(player["position"]),
-                        "matches": _as_int(player["games"]),
-                        "minutes": _as_int(player["time"]),
-                        "goals": _as_int(player["goals"]),
-                        "xg": _as_float(player["xG"]),
-                        "np_goals": _as_int(player["npg"]),
-                        "np_xg": _as_float(player["npxG"]),
-                        "assists": _as_int(player["assists"]),
-                        "xa": _as_float(player["xA"]),
-                        "shots": _as_int(player["shots"]),
-                        "key_passes": _as_int(player["key_passes"]),
-                        "yellow_cards": _as_int(player["yellow_cards"]),
-                        "red_cards": _as_int(player["red_cards"]),
-                        "xg_chain": _as_float(player["xGChain"]),
-                        "xg_buildup": _as_float(player["xGBuildup"]),
-                    }
-                )
+            # pick first team if multiple teams are listed
+            team_names = [_as_str(player["team_title"].split(",")[0]) for player in players_data]
+            players.extend(players_data)
+            _extend(
+                context,
+                len(players_data),
+                league=league,
+                league_id=league_id,
+                season=season,
+                season_id=season_id,
+            )
+            context["team"].extend(team_names)
+            context["team_id"].extend(team_mapping[team_name] for team_name in team_names)
 
         index = ["league", "season", "team", "player"]
-        if len(stats) == 0:
+        if len(players) == 0:
             return pd.DataFrame(index=index)
 
+        columns = {
+            **context,
+            "player": _str_column([player["player_name"] for player in players]),
+            "player_id": _int_column([player["id"] for player in players]),
+            "position": _str_column([player["position"] for player in players]),
+        }
+        columns.update(_stat_columns(players, PLAYER_SEASON_STATS))
         return (
-            pd.DataFrame.from_records(stats)
-            .replace(
-                {
-                    "team": TEAMNAME_REPLACEMENTS,
-                }
-            )
+            pd.DataFrame(columns)
+            .pipe(standardize_team_names)
             .set_index(index)
             .sort_index()
             .convert_dtypes()
@@ -469,7 +505,16 @@ class Understat(BaseRequestsReader):
         df_schedule = self.read_schedule(include_matches_without_data=False)
         df_results = self._select_matches(df_schedule, match_id)
 
-        stats = []
+        players: list[dict] = []
+        context: dict[str, list] = {
+            "league": [],
+            "league_id": [],
+            "season": [],
+            "season_id": [],
+            "game_id": [],
+            "game": [],
+            "team": [],
+        }
         for (league, season, game), league_season_game in df_results.iterrows():
             league_id = league_season_game["league_id"]
             season_id = league_season_game["season_id"]
@@ -485,51 +530,40 @@ class Understat(BaseRequestsReader):
                 match_info[side]: _as_str(match_info[f"team_{side}"]) for side in ("h", "a")
             }
 
-            players_data = data["rostersData"]
-            for team_players in players_data.values():
-                for player in team_players.values():
-                    team_id = player["team_id"]
-                    team = team_id_to_name[team_id]
-                    stats.append(
-                        {
-                            "league": league,
-                            "league_id": league_id,
-                            "season": season,
-                            "season_id": season_id,
-                            "game_id": game_id,
-                            "game": game,
-                            "team": team,
-                            "team_id": _as_int(team_id),
-                            "player": _as_str(player["player"]),
-                            "player_id": _as_int(player["player_id"]),
-                            "position": _as_str(player["position"]),
-                            "position_id": _as_int(player["positionOrder"]),
-                            "minutes": _as_int(player["time"]),
-                            "goals": _as_int(player["goals"]),
-                            "own_goals": _as_int(player["own_goals"]),
-                            "shots": _as_int(player["shots"]),
-                            "xg": _as_float(player["xG"]),
-                            "xg_chain": _as_float(player["xGChain"]),
-                            "xg_buildup": _as_float(player["xGBuildup"]),
-                            "assists": _as_int(player["assists"]),
-                            "xa": _as_float(player["xA"]),
-                            "key_passes": _as_int(player["key_passes"]),
-                            "yellow_cards": _as_int(player["yellow_card"]),
-                            "red_cards": _as_int(player["red_card"]),
-                        }
-                    )
+            players_data = [
+                player
+                for team_players in data["rostersData"].values()
+                for player in team_players.values()
+            ]
+            players.extend(players_data)
+            _extend(
+                context,
+                len(players_data),
+                league=league,
+                league_id=league_id,
+                season=season,
+                season_id=season_id,
+                game_id=game_id,
+                game=game,
+            )
+            context["team"].extend(team_id_to_name[player["team_id"]] for player in players_data)
 
         index = ["league", "season", "game", "team", "player"]
-        if len(stats) == 0:
+        if len(players) == 0:
             return pd.DataFrame(index=index)
 
+        columns = {
+            **context,
+            "team_id": _int_column([player["team_id"] for player in players]),
+            "player": _str_column([player["player"] for player in players]),
+            "player_id": _int_column([player["player_id"] for player in players]),
+            "position": _str_column([player["position"] for player in players]),
+            "position_id": _int_column([player["positionOrder"] for player in players]),
+        }
+        columns.update(_stat_columns(players, PLAYER_MATCH_STATS))
         return (
-            pd.DataFrame.from_records(stats)
-            .replace(
-                {
-                    "team": TEAMNAME_REPLACEMENTS,
-                }
-            )
+            pd.DataFrame(columns)
+            .pipe(standardize_team_names)
             .set_index(index)
             .sort_index()
             .convert_dtypes()
@@ -552,10 +586,47 @@ class Understat(BaseRequestsReader):
         -------
         pd.DataFrame
         """
+        shots: dict[str, list] = {}
+        for game_shots in self._iter_shot_events(match_id):
+            for col, values in game_shots.items():
+                shots.setdefault(col, []).extend(values)
+        return self._format_shot_events(shots)
+
+    def iter_shot_events(
+        self, match_id: Optional[Union[int, list[int]]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Retrieve the shot events for the selected matches one match at a time.
+
+        This is the streaming version of :meth:`read_shot_events`. The shots
+        of a match are yielded as soon as the match is retrieved. Matches
+        without shots are skipped.
+
+        Parameters
+        ----------
+        match_id : int or list of int, optional
+            Retrieve the shot events for a specific match.
+
+        Raises
+        ------
+        ValueError
+            If the given match_id could not be found in the selected seasons.
+
+        Yields
+        ------
+        pd.DataFrame
+            The shot events of a single match.
+        """
+        for shots in self._iter_shot_events(match_id):
+            if len(shots["shot_id"]) > 0:
+                yield self._format_shot_events(shots)
+
+    def _iter_shot_events(
+        self, match_id: Optional[Union[int, list[int]]]
+    ) -> Iterator[dict[str, list]]:
+        """Yield the raw values of the shot events of each selected match by column."""
         df_schedule = self.read_schedule(include_matches_without_data=False)
         df_results = self._select_matches(df_schedule, match_id)
 
-        shots = []
         for (league, season, game), league_season_game in df_results.iterrows():
             league_id = league_season_game["league_id"]
             season_id = league_season_game["season_id"]
@@ -580,52 +651,68 @@ class Understat(BaseRequestsReader):
                     player_id = _as_int(player["id"])
                     player_name_to_id[player_name] = player_id
 
-            shots_data = data["shotsData"]
-            for team_shots in shots_data.values():
-                for shot in team_shots:
-                    team_side = shot["h_a"]
-                    team = _as_str(shot[f"{team_side}_team"])
-                    team_id = team_name_to_id[team]
-                    assist_player = _as_str(shot["player_assisted"])
-                    assist_player_id = player_name_to_id.get(assist_player, pd.NA)
-                    shots.append(
-                        {
-                            "league_id": league_id,
-                            "league": league,
-                            "season_id": season_id,
-                            "season": season,
-                            "game_id": game_id,
-                            "game": game,
-                            "date": shot["date"],
-                            "shot_id": _as_int(shot["id"]),
-                            "team_id": team_id,
-                            "team": team,
-                            "player_id": _as_int(shot["player_id"]),
-                            "player": shot["player"],
-                            "assist_player_id": assist_player_id,
-                            "assist_player": assist_player,
-                            "xg": _as_float(shot["xG"]),
-                            "location_x": _as_float(shot["X"]),
-                            "location_y": _as_float(shot["Y"]),
-                            "minute": _as_int(shot["minute"]),
-                            "body_part": SHOT_BODY_PARTS.get(shot["shotType"], pd.NA),
-                            "situation": SHOT_SITUATIONS.get(shot["situation"], pd.NA),
-                            "result": SHOT_RESULTS.get(shot["result"], pd.NA),
-                        }
-                    )
+            shots_data = [shot for team_shots in data["shotsData"].values() for shot in team_shots]
+            teams = [_as_str(shot[f"{shot['h_a']}_team"]) for shot in shots_data]
+            assist_players = [_as_str(shot["player_assisted"]) for shot in shots_data]
+            shots: dict[str, list] = {
+                key: [] for key in ["league_id", "league", "season_id", "season"]
+            }
+            _extend(
+                shots,
+                len(shots_data),
+                league_id=league_id,
+                league=league,
+                season_id=season_id,
+                season=season,
+                game_id=game_id,
+                game=game,
+            )
+            shots.update(
+                {
+                    "date": [shot["date"] for shot in shots_data],
+                    "shot_id": [shot["id"] for shot in shots_data],
+                    "team_id": [team_name_to_id[team] for team in teams],
+                    "team": teams,
+                    "player_id": [shot["player_id"] for shot in shots_data],
+                    "player": [shot["player"] for shot in shots_data],
+                    "assist_player_id": [
+                        player_name_to_id.get(player, pd.NA) for player in assist_players
+                    ],
+                    "assist_player": assist_players,
+                    "xg": [shot["xG"] for shot in shots_data],
+                    "location_x": [shot["X"] for shot in shots_data],
+                    "location_y": [shot["Y"] for shot in shots_data],
+                    "minute": [shot["minute"] for shot in shots_data],
+                    "body_part": [shot["shotType"] for shot in shots_data],
+                    "situation": [shot["situation"] for shot in shots_data],
+                    "result": [shot["result"] for shot in shots_data],
+                }
+            )
+            yield shots
 
+    @staticmethod
+    def _format_shot_events(shots: dict[str, list]) -> pd.DataFrame:
+        """Build a dataframe from the shot events of one or more matches."""
         index = ["league", "season", "game", "team", "player"]
-        if len(shots) == 0:
+        if len(shots.get("shot_id", [])) == 0:
             return pd.DataFrame(index=index)
 
+        columns = {
+            **shots,
+            "shot_id": _int_column(shots["shot_id"]),
+            "player_id": _int_column(shots["player_id"]),
+            "xg": _float_column(shots["xg"]),
+            "location_x": _float_column(shots["location_x"]),
+            "location_y": _float_column(shots["location_y"]),
+            "minute": _int_column(shots["minute"]),
+            "body_part": _map_column(shots["body_part"], SHOT_BODY_PARTS),
+            "situation": _map_column(shots["situation"], SHOT_SITUATIONS),
+            "result": _map_column(shots["result"], SHOT_RESULTS),
+        }
         return (
-            pd.DataFrame.from_records(shots)
+            pd.DataFrame(columns)
             .assign(date=lambda g: pd.to_datetime(g["date"], format="%Y-%m-%d %H:%M:%S"))
-            .replace(
-                {
-                    "team": TEAMNAME_REPLACEMENTS,
-                }
-            )
+            .pipe(standardize_team_names)
             .set_index(index)
             .sort_index()
             .convert_dtypes()
@@ -647,17 +734,15 @@ class Understat(BaseRequestsReader):
         return df
 
     def _read_leagues(self, no_cache: bool = False) -> dict:
-        self._ensure_cookies()
         url = UNDERSTAT_URL + "/getStatData"
         filepath = self.data_dir / "leagues.json"
-        reader = self._request_api(url, filepath, no_cache=no_cache)
-        data = json.load(reader)
+        reader = self.get(url, filepath, no_cache=no_cache)
+        data = load_json(reader)
         return {"statData": data["stat"]}
 
     def _read_league_season(
         self, url: str, league_id: int, season_id: int, no_cache: bool = False
     ) -> dict:
-        self._ensure_cookies()
         # Extract league slug and season from the HTML page URL
         # URL format: https://understat.com/league/{league_slug}/{season_id}
         parts = url.rstrip("/").split("/")
@@ -665,8 +750,8 @@ class Understat(BaseRequestsReader):
         season = parts[-1]
         api_url = UNDERSTAT_URL + f"/getLeagueData/{league_slug}/{season}"
         filepath = self.data_dir / f"league_{league_id}_season_{season_id}.json"
-        reader = self._request_api(api_url, filepath, no_cache=no_cache)
-        data = json.load(reader)
+        reader = self.get(api_url, filepath, no_cache=no_cache)
+        data = load_json(reader)
         return {
             "datesData": data["dates"],
             "playersData": data["players"],
@@ -674,55 +759,41 @@ class Understat(BaseRequestsReader):
         }
 
     def _read_match(self, url: str, match_id: int) -> Optional[dict]:
-        self._ensure_cookies()
         try:
             api_url = UNDERSTAT_URL + f"/getMatchData/{match_id}"
             filepath = self.data_dir / f"match_{match_id}.json"
-            reader = self._request_api(api_url, filepath)
-            data = json.load(reader)
-
-            # Construct match_info from tmpl and rosters
-            home_team_name = self._extract_team_name(data["tmpl"]["home"])
-            away_team_name = self._extract_team_name(data["tmpl"]["away"])
-            rosters = data["rosters"]
-            home_team_id = next(iter(rosters["h"].values()))["team_id"]
-            away_team_id = next(iter(rosters["a"].values()))["team_id"]
-
-            match_info = {
-                "h": home_team_id,
-                "a": away_team_id,
-                "team_h": home_team_name,
-                "team_a": away_team_name,
-            }
-
-            return {
-                "match_info": match_info,
-                "rostersData": rosters,
-                "shotsData": data["shots"],
-            }
+            reader = self.get(api_url, filepath)
+            content = reader.read()
         except ConnectionError:
             return None
+        memo = self._parse_memo
+        if memo is not None:
+            return memo.get("understat-match", content, self._parse_match)
+        return self._parse_match(content)
+
+    @classmethod
+    def _parse_match(cls, content: bytes) -> dict:
+        data = load_json(content)
+
+        # Construct match_info from tmpl and rosters
+        home_team_name = cls._extract_team_name(data["tmpl"]["home"])
+        away_team_name = cls._extract_team_name(data["tmpl"]["away"])
+        rosters = data["rosters"]
+        home_team_id = next(iter(rosters["h"].values()))["team_id"]
+        away_team_id = next(iter(rosters["a"].values()))["team_id"]
+
+        match_info = {
+            "h": home_team_id,
+            "a": away_team_id,
+            "team_h": home_team_name,
+            "team_a": away_team_name,
+        }
 
-    def _request_api(
-        self, url: str, filepath: Optional[Path] = None, no_cache: bool = False
-    ) -> IO[bytes]:
-        """Make an API request with proper headers and caching."""
-        is_cached = (
-            filepath is not None and filepath.exists() and not no_cache and not self.no_cache
-        )
-        if is_cached and filepath is not None:
-            return filepath.open(mode="rb")
-
-        response = self._session.get(url, headers=UNDERSTAT_HEADERS)
-        response.raise_for_status()
-        payload = response.content
-
-        if not self.no_store and filepath is not None:
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            with filepath.open(mode="wb") as fh:
-                fh.write(payload)
-
-        return io.BytesIO(payload)
+        return {
+            "match_info": match_info,
+            "rostersData": rosters,
+            "shotsData": data["shots"],
+        }
 
     @staticmethod
     def _extract_team_name(html: str) -> str:
@@ -733,6 +804,59 @@ class Understat(BaseRequestsReader):
         return ""
 
 
+def _extend(columns: dict[str, list], n: int, **values: Any) -> None:
+    """Append `n` copies of each of the given values to their column."""
+    for col, value in values.items():
+        columns.setdefault(col, []).extend([value] * n)
+
+
+def _int_column(values: list[Any]) -> pd.Series:
+    """Convert a column of raw values to integers at once.
+
+    Falls back to converting each value with :func:`_as_int` if some values
+    are not integers.
+    """
+    try:
+        return pd.Series(np.array(values, dtype=np.int64))
+    except (TypeError, ValueError, OverflowError):
+        return pd.Series([_as_int(value) for value in values], dtype=object)
+
+
+def _float_column(values: list[Any]) -> pd.Series:
+    """Convert a column of raw values to floats at once.
+
+    Falls back to converting each value with :func:`_as_float` if some
+    values are not numbers.
+    """
+    try:
+        return pd.Series(np.array(values, dtype=np.float64))
+    except (TypeError, ValueError):
+        return pd.Series([_as_float(value) for value in values], dtype="float64")
+
+
+def _str_column(values: list[Any]) -> pd.Series:
+    """Unescape a column of raw strings, handling each distinct string once."""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object))
+    unescaped = np.array([_as_str(value) for value in uniques] + [None], dtype=object)
+    return pd.Series(unescaped[codes], dtype=object)
+
+
+def _map_column(values: list[Any], mapping: dict[str, str]) -> pd.Series:
+    """Map a column of raw values. Values without a mapping become NA."""
+    mapped = pd.Series(values, dtype=object).map(mapping).astype(object)
+    return mapped.where(mapped.notna(), pd.NA)
+
+
+def _stat_columns(
+    records: list[dict[str, Any]], fields: dict[str, tuple[str, type]]
+) -> dict[str, pd.Series]:
+    """Extract the given numeric fields of a list of records by column."""
+    return {
+        col: (_float_column if kind is float else _int_column)([r[key] for r in records])
+        for col, (key, kind) in fields.items()
+    }
+
+
 def _as_bool(value: Any) -> Optional[bool]:
     try:
         return bool(value)
@@ -759,3 +883,26 @@ def _as_str(value: Any) -> Optional[str]:
         return unescape(value)
     except (TypeError, ValueError):
         return None
+
+
+class AsyncUnderstat(AsyncBaseRequestsReader):
+    """Asynchronous version of :class:`Understat`.
+
+    Accepts the same parameters as :class:`Understat`. All ``read_*`` methods
+    are coroutines.
+
+    Examples
+    --------
+    >>> async with AsyncUnderstat() as reader:
+    ...     df = await reader.read_schedule()
+    """
+
+    reader_class = Understat
+
+    read_leagues = awaitable(Understat.read_leagues)
+    read_seasons = awaitable(Understat.read_seasons)
+    read_schedule = awaitable(Understat.read_schedule)
+    read_team_match_stats = awaitable(Understat.read_team_match_stats)
+    read_player_season_stats = awaitable(Understat.read_player_season_stats)
+    read_player_match_stats = awaitable(Understat.read_player_match_stats)
+    read_shot_events = awaitable(Understat.read_shot_events)
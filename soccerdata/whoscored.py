@@ -1,15 +1,17 @@
 """Scraper for http://whoscored.com."""
 
 import itertools
-import json
 import re
 import time
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Literal, Optional, Union
+from typing import IO, Callable, Literal, Optional, Union
 
 import numpy as np
 import pandas as pd
+import seleniumbase as sb
+from dateutil.relativedelta import relativedelta
 from lxml import html
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
@@ -17,8 +19,15 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.common.by import By
 
-from ._common import BaseSeleniumReader, make_game_id, standardize_colnames
-from ._config import DATA_DIR, NOCACHE, NOSTORE, TEAMNAME_REPLACEMENTS, logger
+from ._common import (
+    BLOCKED_RESOURCES,
+    BaseSeleniumReader,
+    load_json,
+    make_game_ids,
+    standardize_colnames,
+    standardize_team_names,
+)
+from ._config import DATA_DIR, MAXAGE, NOCACHE, NOSTORE, logger
 
 WHOSCORED_DATADIR = DATA_DIR / "WhoScored"
 WHOSCORED_URL = "https://www.whoscored.com"
@@ -143,8 +152,19 @@ class WhoScored(BaseSeleniumReader):
     headless : bool, default: True
         If True, will run Chrome in headless mode. Setting this to False might
         help to avoid getting blocked. Only supported for Selenium <4.13.
+    n_drivers : int, default: 1
+        The number of browsers that scrape pages in parallel. Each browser
+        uses its own proxy and waits between page loads, so scraping many
+        games is about `n_drivers` times faster.
+    http_first : bool, default: False
+        If True, the fixtures, the match centre data and other pages that do
+        not require JavaScript are downloaded with a lightweight HTTP client
+        that reuses the cookies of the browser. The browser is used when the
+        HTTP client is blocked.
     """
 
+    blocked_resources = BLOCKED_RESOURCES
+
     def __init__(
         self,
         leagues: Optional[Union[str, list[str]]] = None,
@@ -155,6 +175,8 @@ class WhoScored(BaseSeleniumReader):
         data_dir: Path = WHOSCORED_DATADIR,
         path_to_browser: Optional[Path] = None,
         headless: bool = False,
+        n_drivers: int = 1,
+        http_first: bool = False,
     ):
         """Initialize the WhoScored reader."""
         super().__init__(
@@ -165,6 +187,8 @@ class WhoScored(BaseSeleniumReader):
             data_dir=data_dir,
             path_to_browser=path_to_browser,
             headless=headless,
+            n_drivers=n_drivers,
+            http_first=http_first,
         )
         self.seasons = seasons
         self.rate_limit = 5
@@ -186,7 +210,7 @@ class WhoScored(BaseSeleniumReader):
         filepath = self.data_dir / "tiers.json"
         reader = self.get(url, filepath, var="allRegions")
 
-        data = json.load(reader)
+        data = load_json(reader)
 
         leagues = []
         for region in data:
@@ -373,21 +397,28 @@ class WhoScored(BaseSeleniumReader):
                 var="wsCalendar",
                 no_cache=current_season and not force_cache,
             )
-            mask = json.load(calendar)["mask"]
+            mask = load_json(calendar)["mask"]
 
             # get the fixtures for each month
-            it = [(year, month) for year in mask for month in mask[year]]
-            for i, (year, month) in enumerate(it):
+            calls = []
+            for year, month in [(y, m) for y in mask for m in mask[y]]:
                 filepath = self.data_dir / filemask_schedule.format(lkey, skey, stage_id, month)
                 url = (
                     WHOSCORED_URL + f"/tournaments/{stage_id}/data/?d={year}{(int(month) + 1):02d}"
                 )
-
+                month_end = datetime(int(year), int(month) + 1, 1, tzinfo=timezone.utc)
+                month_end += relativedelta(months=1)
+                no_cache = (
+                    current_season and not force_cache and self._needs_refresh(filepath, month_end)
+                )
+                calls.append((url, filepath, MAXAGE, no_cache))
+            # the months are scraped in parallel if the reader has multiple drivers
+            for i, future in enumerate(self._submit_many(self.get, calls)):
                 if stage_name is not None:
                     logger.info(
                         "[%s/%s] Retrieving fixtures for %s %s (%s)",
                         i + 1,
-                        len(it),
+                        len(calls),
                         lkey,
                         skey,
                         stage_name,
@@ -396,15 +427,13 @@ class WhoScored(BaseSeleniumReader):
                     logger.info(
                         "[%s/%s] Retrieving fixtures for %s %s",
                         i + 1,
-                        len(it),
+                        len(calls),
                         lkey,
                         skey,
                     )
 
-                reader = self.get(
-                    url, filepath, var=None, no_cache=current_season and not force_cache
-                )
-                data = json.load(reader)
+                reader = future.result()
+                data = load_json(reader)
                 for tournament in data["tournaments"]:
                     df_schedule = pd.DataFrame(tournament["matches"])
                     df_schedule["league"] = lkey
@@ -419,12 +448,7 @@ class WhoScored(BaseSeleniumReader):
         return (
             pd.concat(all_schedules)
             .drop_duplicates(subset=["id"])
-            .replace(
-                {
-                    "homeTeamName": TEAMNAME_REPLACEMENTS,
-                    "awayTeamName": TEAMNAME_REPLACEMENTS,
-                }
-            )
+            .pipe(standardize_team_names, cols=["homeTeamName", "awayTeamName"])
             .rename(
                 columns={
                     "homeTeamName": "home_team",
@@ -434,7 +458,7 @@ class WhoScored(BaseSeleniumReader):
                 }
             )
             .assign(date=lambda x: pd.to_datetime(x["date"]))
-            .assign(game=lambda df: df.apply(make_game_id, axis=1))
+            .assign(game=make_game_ids)
             .pipe(standardize_colnames)
             .set_index(["league", "season", "game"])
             .sort_index()
@@ -445,34 +469,26 @@ class WhoScored(BaseSeleniumReader):
         urlmask = WHOSCORED_URL + "/Matches/{}"
         url = urlmask.format(game_id)
         data = {}
-        self._driver.get(url)
+        tree = html.parse(self.get(url, no_cache=True))
         # league and season
-        breadcrumb = self._driver.find_elements(
-            By.XPATH,
-            "//div[@id='breadcrumb-nav']/*[not(contains(@class, 'separator'))]",
+        breadcrumb = tree.xpath(
+            "//div[@id='breadcrumb-nav']/*[not(contains(@class, 'separator'))]"
         )
-        country = breadcrumb[0].text
-        league, season = breadcrumb[1].text.split(" - ")
+        country = breadcrumb[0].text_content().strip()
+        league, season = breadcrumb[1].text_content().strip().split(" - ")
         data["league"] = {v: k for k, v in self._all_leagues().items()}[f"{country} - {league}"]
         data["season"] = self._season_code.parse(season)
         # match header
-        match_header = self._driver.find_element(By.XPATH, "//div[@id='match-header']")
-        score_info = match_header.find_element(By.XPATH, ".//div[@class='teams-score-info']")
-        data["home_team"] = score_info.find_element(
-            By.XPATH, "./span[contains(@class,'home team')]"
-        ).text
-        data["result"] = score_info.find_element(
-            By.XPATH, "./span[contains(@class,'result')]"
-        ).text
-        data["away_team"] = score_info.find_element(
-            By.XPATH, "./span[contains(@class,'away team')]"
-        ).text
-        info_blocks = match_header.find_elements(By.XPATH, ".//div[@class='info-block cleared']")
-        for block in info_blocks:
-            for desc_list in block.find_elements(By.TAG_NAME, "dl"):
-                for desc_def in desc_list.find_elements(By.TAG_NAME, "dt"):
-                    desc_val = desc_def.find_element(By.XPATH, "./following-sibling::dd")
-                    data[desc_def.text] = desc_val.text
+        match_header = tree.xpath("//div[@id='match-header']")[0]
+        score_info = match_header.xpath(".//div[@class='teams-score-info']")[0]
+        data["home_team"], data["result"], data["away_team"] = (
+            score_info.xpath(f"./span[contains(@class,'{cls}')]")[0].text_content().strip()
+            for cls in ("home team", "result", "away team")
+        )
+        for block in match_header.xpath(".//div[@class='info-block cleared']"):
+            for desc_def in block.xpath(".//dl/dt"):
+                desc_val = desc_def.xpath("./following-sibling::dd")[0]
+                data[desc_def.text_content().strip()] = desc_val.text_content().strip()
 
         return data
 
@@ -514,18 +530,23 @@ class WhoScored(BaseSeleniumReader):
         else:
             iterator = df_schedule.sample(frac=1)
 
-        match_sheets = []
-        for i, (_, game) in enumerate(iterator.iterrows()):
-            url = urlmask.format(game.game_id)
-            filepath = DATA_DIR / filemask.format(game["league"], game["season"], game["game_id"])
+        requests = [
+            (
+                urlmask.format(game.game_id),
+                DATA_DIR / filemask.format(game.league, game.season, game.game_id),
+            )
+            for game in iterator.itertuples()
+        ]
+        readers = self.get_many(requests, var=None)
 
+        match_sheets = []
+        for i, ((_, game), reader) in enumerate(zip(iterator.iterrows(), readers)):
             logger.info(
                 "[%s/%s] Retrieving game with id=%s",
                 i + 1,
                 len(iterator),
                 game["game_id"],
             )
-            reader = self.get(url, filepath, var=None)
 
             # extract missing players
             tree = html.parse(reader)
@@ -581,7 +602,7 @@ class WhoScored(BaseSeleniumReader):
             .sort_index()
         )
 
-    def read_events(  # noqa: C901
+    def read_events(
         self,
         match_id: Optional[Union[int, list[int]]] = None,
         force_cache: bool = False,
@@ -627,7 +648,9 @@ class WhoScored(BaseSeleniumReader):
         Raises
         ------
         ValueError
-            If the given match_id could not be found in the selected seasons.
+            If the given match_id could not be found in the selected seasons,
+            or if the requested output format is 'spadl', 'atomic-spadl' or
+            'loader' and the cached data is not stored or compressed.
         ConnectionError
             If the match page could not be retrieved.
         ImportError
@@ -639,15 +662,126 @@ class WhoScored(BaseSeleniumReader):
         See the description of the ``output_fmt`` parameter.
         """
         output_fmt = output_fmt.lower() if output_fmt is not None else None
+        events = {}
+        player_names: dict[int, str] = {}
+        team_names: dict[int, str] = {}
+        for game_id, json_data, game_events in self._iter_events(
+            match_id, force_cache, live, output_fmt, retry_missing, on_error
+        ):
+            game_players, game_teams = self._extract_names(json_data)
+            player_names.update(game_players)
+            team_names.update(game_teams)
+            if game_events is not None:
+                events[game_id] = game_events
+
+        if output_fmt is None:
+            return None
+
+        if output_fmt == "raw":
+            return events
+
+        if output_fmt == "loader":
+            from socceraction.data.opta import OptaLoader
+
+            return OptaLoader(
+                root=self.data_dir,
+                parser="whoscored",
+                feeds={
+                    "whoscored": str(Path("events/{competition_id}_{season_id}/{game_id}.json"))
+                },
+            )
+
+        return self._format_events(list(events.values()), player_names, team_names, output_fmt)
+
+    def iter_events(
+        self,
+        match_id: Optional[Union[int, list[int]]] = None,
+        force_cache: bool = False,
+        live: bool = False,
+        output_fmt: str = "events",
+        retry_missing: bool = True,
+        on_error: Literal["raise", "skip"] = "raise",
+    ) -> Iterator[Union[pd.DataFrame, dict[int, list]]]:
+        """Retrieve the event data of the selected games one game at a time.
+
+        This is the streaming version of :meth:`read_events`. The events of a
+        game are yielded as soon as the game is scraped, such that they can
+        be processed or written to disk without keeping the events of all
+        games in memory. Games without events are skipped.
+
+        Parameters
+        ----------
+        match_id : int or list of int, optional
+            Retrieve the event stream for a specific game.
+        force_cache : bool
+            By default no cached data is used to scrape the list of available
+            games for the current season. If True, will force the use of
+            cached data anyway.
+        live : bool
+            If True, will not return a cached copy of the event data.
+        output_fmt : str, default: 'events'
+            One of 'events', 'raw', 'spadl' or 'atomic-spadl'. See
+            :meth:`read_events` for a description of each format. With 'raw',
+            a dict that maps the game ID to its events is yielded.
+        retry_missing : bool
+            If no events were found for a game in a previous attempt, will
+            retry to scrape the events
+        on_error : "raise" or "skip", default: "raise"
+            Wheter to raise an exception or to skip the game if an error occurs.
+
+        Raises
+        ------
+        ValueError
+            If the output format is not supported or if the given match_id
+            could not be found in the selected seasons.
+
+        Yields
+        ------
+        pd.DataFrame or dict
+            The events of a single game.
+        """
+        output_fmt = output_fmt.lower()
+        if output_fmt not in ["events", "raw", "spadl", "atomic-spadl"]:
+            raise ValueError(f"The '{output_fmt}' output format is not supported.")
+        for game_id, json_data, game_events in self._iter_events(
+            match_id, force_cache, live, output_fmt, retry_missing, on_error
+        ):
+            if game_events is None:
+                continue
+            if output_fmt == "raw":
+                yield {game_id: game_events}
+                continue
+            player_names, team_names = self._extract_names(json_data)
+            yield self._format_events([game_events], player_names, team_names, output_fmt)
+
+    def _iter_events(
+        self,
+        match_id: Optional[Union[int, list[int]]],
+        force_cache: bool,
+        live: bool,
+        output_fmt: Optional[str],
+        retry_missing: bool,
+        on_error: Literal["raise", "skip"],
+    ) -> Iterator[tuple[int, dict, Optional[Union[pd.DataFrame, list]]]]:
+        """Scrape the selected games one at a time.
+
+        Yields the game ID, the match centre data and the events of the game
+        converted to `output_fmt`. The events are None if the game has no
+        events or if `output_fmt` does not require parsing them.
+        """
         if output_fmt in ["loader", "spadl", "atomic-spadl"]:
             if self.no_store:
                 raise ValueError(
                     f"The '{output_fmt}' output format is not supported "
                     "when using the 'no_store' option."
                 )
+            if self.cache_compression != "none":
+                raise ValueError(
+                    f"The '{output_fmt}' output format is not supported "
+                    "when the cached data is compressed."
+                )
             try:
                 from socceraction.atomic.spadl import convert_to_atomic
-                from socceraction.data.opta import OptaLoader
                 from socceraction.data.opta.loader import _eventtypesdf
                 from socceraction.data.opta.parsers import WhoScoredParser
                 from socceraction.spadl.opta import convert_to_actions
@@ -679,113 +813,107 @@ class WhoScored(BaseSeleniumReader):
         else:
             iterator = df_schedule.sample(frac=1)
 
-        events = {}
-        player_names = {}
-        team_names = {}
-        for i, (_, game) in enumerate(iterator.iterrows()):
-            url = urlmask.format(game["game_id"])
-            # get league and season
+        calls = [
+            (
+                urlmask.format(game.game_id),
+                self.data_dir / filemask.format(game.league, game.season, game.game_id),
+                live,
+                retry_missing,
+            )
+            for game in iterator.itertuples()
+        ]
+        # the games are scraped in parallel if the reader has multiple drivers
+        futures = self._submit_many(self._get_match_centre, calls)
+        for i, ((_, game), future) in enumerate(zip(iterator.iterrows(), futures)):
             logger.info(
                 "[%s/%s] Retrieving game with id=%s",
                 i + 1,
                 len(iterator),
                 game["game_id"],
             )
-            filepath = self.data_dir / filemask.format(
-                game["league"], game["season"], game["game_id"]
-            )
-
+            filepath = calls[i][1]
             try:
-                reader = self.get(
-                    url,
-                    filepath,
-                    var="require.config.params['args'].matchCentreData",
-                    no_cache=live,
-                )
-                reader_value = reader.read()
-                if (retry_missing and reader_value == b"null") or reader_value == b"":
-                    reader = self.get(
-                        url,
-                        filepath,
-                        var="require.config.params['args'].matchCentreData",
-                        no_cache=True,
-                    )
+                reader = future.result()
             except ConnectionError as e:
                 if on_error == "skip":
                     logger.warning("Error while scraping game %s: %s", game["game_id"], e)
                     continue
                 raise
-            reader.seek(0)
-            json_data = json.load(reader)
-            if json_data is not None:
-                player_names.update(
-                    {int(k): v for k, v in json_data["playerIdNameDictionary"].items()}
-                )
-                team_names.update(
-                    {
-                        int(json_data[side]["teamId"]): json_data[side]["name"]
-                        for side in ["home", "away"]
-                    }
-                )
-                if "events" in json_data:
-                    game_events = json_data["events"]
-                    if output_fmt == "events":
-                        df_events = pd.DataFrame(game_events)
-                        df_events["game"] = game["game"]
-                        df_events["league"] = game["league"]
-                        df_events["season"] = game["season"]
-                        df_events["game_id"] = game["game_id"]
-                        events[game["game_id"]] = df_events
-                    elif output_fmt == "raw":
-                        events[game["game_id"]] = game_events
-                    elif output_fmt in ["spadl", "atomic-spadl"]:
-                        parser = WhoScoredParser(
-                            str(filepath),
-                            competition_id=game["league"],
-                            season_id=game["season"],
-                            game_id=game["game_id"],
-                        )
-                        df_events = (
-                            pd.DataFrame.from_dict(parser.extract_events(), orient="index")
-                            .merge(_eventtypesdf, on="type_id", how="left")
-                            .reset_index(drop=True)
-                        )
-                        df_actions = convert_to_actions(
-                            df_events, home_team_id=int(json_data["home"]["teamId"])
-                        )
-                        if output_fmt == "spadl":
-                            events[game["game_id"]] = df_actions
-                        else:
-                            events[game["game_id"]] = convert_to_atomic(df_actions)
-
-            else:
+            json_data = load_json(reader)
+            if json_data is None:
                 logger.warning("No events found for game %s", game["game_id"])
-
-        if output_fmt is None:
-            return None
-
-        if output_fmt == "raw":
-            return events
-
-        if output_fmt == "loader":
-            return OptaLoader(
-                root=self.data_dir,
-                parser="whoscored",
-                feeds={
-                    "whoscored": str(Path("events/{competition_id}_{season_id}/{game_id}.json"))
-                },
-            )
-
+                continue
+
+            game_events = None
+            if "events" in json_data:
+                if output_fmt == "events":
+                    game_events = pd.DataFrame(json_data["events"])
+                    game_events["game"] = game["game"]
+                    game_events["league"] = game["league"]
+                    game_events["season"] = game["season"]
+                    game_events["game_id"] = game["game_id"]
+                elif output_fmt == "raw":
+                    game_events = json_data["events"]
+                elif output_fmt in ["spadl", "atomic-spadl"]:
+                    parser = WhoScoredParser(
+                        str(filepath),
+                        competition_id=game["league"],
+                        season_id=game["season"],
+                        game_id=game["game_id"],
+                    )
+                    df_events = (
+                        pd.DataFrame.from_dict(parser.extract_events(), orient="index")
+                        .merge(_eventtypesdf, on="type_id", how="left")
+                        .reset_index(drop=True)
+                    )
+                    game_events = convert_to_actions(
+                        df_events, home_team_id=int(json_data["home"]["teamId"])
+                    )
+                    if output_fmt == "atomic-spadl":
+                        game_events = convert_to_atomic(game_events)
+            yield game["game_id"], json_data, game_events
+
+    def _get_match_centre(
+        self, url: str, filepath: Path, live: bool, retry_missing: bool
+    ) -> IO[bytes]:
+        """Return the match centre data of a game."""
+        var = "require.config.params['args'].matchCentreData"
+        reader = self.get(url, filepath, var=var, no_cache=live)
+        # Only the first bytes are needed to detect missing data
+        head = reader.read(5)
+        if (retry_missing and head == b"null") or head == b"":
+            reader = self.get(url, filepath, var=var, no_cache=True)
+        reader.seek(0)
+        return reader
+
+    @staticmethod
+    def _extract_names(json_data: dict) -> tuple[dict[int, str], dict[int, str]]:
+        """Return the player and team names in the match centre data of a game."""
+        player_names = {int(k): v for k, v in json_data["playerIdNameDictionary"].items()}
+        team_names = {
+            int(json_data[side]["teamId"]): json_data[side]["name"] for side in ["home", "away"]
+        }
+        return player_names, team_names
+
+    @staticmethod
+    def _format_events(
+        events: list[pd.DataFrame],
+        player_names: dict[int, str],
+        team_names: dict[int, str],
+        output_fmt: str,
+    ) -> pd.DataFrame:
+        """Combine the events of one or more games in a single dataframe."""
         if len(events) == 0:
             return pd.DataFrame(index=["league", "season", "game"])
 
         df = (
-            pd.concat(events.values())
+            pd.concat(events)
             .pipe(standardize_colnames)
             .assign(
                 player=lambda x: x.player_id.replace(player_names),
-                team=lambda x: x.team_id.replace(team_names).replace(TEAMNAME_REPLACEMENTS),
+                team=lambda x: x.team_id.replace(team_names),
             )
+            .pipe(standardize_team_names)
         )
 
         if output_fmt == "events":
@@ -808,13 +936,13 @@ class WhoScored(BaseSeleniumReader):
 
         return df
 
-    def _handle_banner(self) -> None:
+    def _handle_banner(self, driver: "sb.Driver") -> None:
+        """Accept the cookie banner that is shown by `driver`."""
         try:
-            # self._driver.get(WHOSCORED_URL)
             time.sleep(2)
-            self._driver.find_element(By.XPATH, "//button[./span[text()='AGREE']]").click()
+            driver.find_element(By.XPATH, "//button[./span[text()='AGREE']]").click()
             time.sleep(2)
         except NoSuchElementException:
             # with open("/tmp/error.html", "w") as f:
-            # f.write(self._driver.page_source)
+            # f.write(driver.page_source)
             raise ElementClickInterceptedException()
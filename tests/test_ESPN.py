@@ -1,11 +1,120 @@
 """Unittests for class soccerdata.ESPN."""
 
+import io
+import json
+from pathlib import Path
+
 import pandas as pd
 import pytest
 
 from soccerdata.espn import ESPN
 
 
+def _player(name: str, starter: bool, subbed_in: bool, subbed_out: bool, minute: str = "") -> dict:
+    plays = [{"substitution": True, "clock": {"displayValue": minute}}] if minute else []
+    return {
+        "athlete": {"displayName": name},
+        "position": {"name": "Forward"},
+        "formationPlace": "9" if starter else "0",
+        "starter": starter,
+        "subbedIn": subbed_in,
+        "subbedOut": subbed_out,
+        "plays": plays,
+        "stats": [{"name": "totalGoals", "value": 1.0}],
+    }
+
+
+def _summary(game_id: int) -> dict:
+    rosters = [
+        {
+            "roster": [
+                _player(f"Home Starter {game_id}", True, False, True, "60'"),
+                _player(f"Home Sub {game_id}", False, True, False, "60'"),
+            ]
+        },
+        # the lineup of the away team is missing
+        {},
+    ]
+    return {
+        "boxscore": {
+            "form": [{"team": {"displayName": "Home FC"}}, {"team": {"displayName": "Away FC"}}],
+            "teams": [
+                {"statistics": [{"name": "possessionPct", "displayValue": "55.0"}]},
+                {"statistics": [{"name": "possessionPct", "displayValue": "45.0"}]},
+            ],
+        },
+        "gameInfo": {"venue": {"fullName": "Stadium", "capacity": 1000}, "attendance": 900},
+        "rosters": rosters,
+    }
+
+
+@pytest.fixture
+def espn_offline(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ESPN:
+    """Return an ESPN reader that serves mocked game summaries."""
+    reader = ESPN("ITA-Serie A", "20-21", no_store=True, data_dir=tmp_path)
+    schedule = pd.DataFrame(
+        {
+            "league": "ITA-Serie A",
+            "season": "2021",
+            "game": ["2020-09-19 Home FC-Away FC", "2020-09-26 Away FC-Home FC"],
+            "game_id": [1, 2],
+            "league_id": "ita.1",
+        }
+    ).set_index(["league", "season", "game"])
+    monkeypatch.setattr(reader, "read_schedule", lambda: schedule)
+    monkeypatch.setattr(
+        reader,
+        "get",
+        lambda url, *args, **kwargs: io.BytesIO(
+            json.dumps(_summary(int(url.rsplit("=", 1)[1]))).encode()
+        ),
+    )
+    return reader
+
+
+def test_read_matchsheet_offline(espn_offline: ESPN) -> None:
+    """It should return one row per team with the game info and team stats."""
+    df = espn_offline.read_matchsheet(match_id=[1, 2])
+    assert len(df) == 4
+    assert df.loc[("ITA-Serie A", "2021", "2020-09-19 Home FC-Away FC", "Home FC")].to_dict() == {
+        "is_home": True,
+        "venue": "Stadium",
+        "attendance": 900,
+        "capacity": 1000,
+        "roster": _summary(1)["rosters"][0]["roster"],
+        "possession_pct": "55.0",
+    }
+
+
+def test_read_lineup_offline(espn_offline: ESPN) -> None:
+    """It should return one row per player with the substitution minutes."""
+    df = espn_offline.read_lineup(match_id=[1, 2])
+    assert isinstance(df, pd.DataFrame)
+    assert len(df) == 4
+    starter = df.loc[
+        ("ITA-Serie A", "2021", "2020-09-19 Home FC-Away FC", "Home FC", "Home Starter 1")
+    ]
+    assert (starter["sub_in"], starter["sub_out"]) == ("start", 60)
+    sub = df.loc[("ITA-Serie A", "2021", "2020-09-19 Home FC-Away FC", "Home FC", "Home Sub 1")]
+    assert (sub["sub_in"], sub["sub_out"]) == (60, "end")
+
+
+def test_iter_lineup_offline(espn_offline: ESPN) -> None:
+    """It should yield the lineups of each game separately."""
+    lineups = list(espn_offline.iter_lineup(match_id=[1, 2]))
+    assert [df.index.get_level_values("player").tolist() for df in lineups] == [
+        ["Home Starter 1", "Home Sub 1"],
+        ["Home Starter 2", "Home Sub 2"],
+    ]
+    pd.testing.assert_frame_equal(pd.concat(lineups), espn_offline.read_lineup(match_id=[1, 2]))
+
+
+def test_read_lineup_offline_bad_id(espn_offline: ESPN) -> None:
+    """It should raise a ValueError if the selected game is not in the schedule."""
+    with pytest.raises(ValueError, match="No games with the given IDs found"):
+        espn_offline.read_lineup(match_id=3)
+
+
 def test_read_schedule(espn_seriea: ESPN) -> None:
     """It should return a dataframe with the schedule of the season."""
     assert isinstance(espn_seriea.read_schedule(), pd.DataFrame)
@@ -30,6 +139,13 @@ def test_read_lineups(espn_seriea: ESPN) -> None:
     assert isinstance(espn_seriea.read_lineup(match_id=554204), pd.DataFrame)
 
 
+def test_iter_lineups(espn_seriea: ESPN) -> None:
+    """It should yield a dataframe with the lineups of each game."""
+    lineups = list(espn_seriea.iter_lineup(match_id=554204))
+    assert len(lineups) == 1
+    pd.testing.assert_frame_equal(lineups[0], espn_seriea.read_lineup(match_id=554204))
+
+
 def test_id_not_in_season(espn_seriea: ESPN) -> None:
     """It should raise a ValueError if the selected game is not in the specified season."""
     with pytest.raises(
@@ -1,10 +1,15 @@
 """Unittests for class soccerdata.FBref."""
 
+from io import StringIO
+from pathlib import Path
+
 import pandas as pd
 import pytest
+from lxml import html
 
 import soccerdata as sd
-from soccerdata.fbref import FBref, _concat
+from soccerdata._cache import ParseMemo
+from soccerdata.fbref import FBref, _concat, _parse_table, _read_table
 
 
 def test_available_leagues() -> None:
@@ -21,6 +26,53 @@ def test_available_leagues() -> None:
     ]
 
 
+def test_parse_table_memo(tmp_path: Path) -> None:
+    page = (
+        "<table><thead><tr><th>Squad</th><th>Pts</th></tr></thead>"
+        "<tbody><tr><td>Lille</td><td>83</td></tr>"
+        "<tr class='spacer'><td></td><td></td></tr>"
+        "<tr><td>PSG</td><td>82</td></tr></tbody></table>"
+    )
+    memo = ParseMemo(tmp_path)
+    expected = _parse_table(html.fromstring(page))
+    pd.testing.assert_frame_equal(_parse_table(html.fromstring(page), memo), expected)
+    assert len(list(tmp_path.glob("*/*.pkl"))) == 1
+    pd.testing.assert_frame_equal(_parse_table(html.fromstring(page), memo), expected)
+    assert expected["Squad"].tolist() == ["Lille", "PSG"]
+
+
+@pytest.mark.parametrize(
+    "page",
+    [
+        # two header rows, links, thousands separators and a footer
+        (
+            "<table><thead><tr class='over_header'><th></th><th colspan='2'>Playing Time</th>"
+            "</tr><tr><th data-stat='player'>Player</th><th data-stat='minutes'>Min</th>"
+            "<th data-stat='xg'>xG</th></tr></thead><tbody><tr>"
+            "<th data-stat='player'><a href='/p/1'>Jonathan David</a></th>"
+            "<td data-stat='minutes'>3,054</td><td data-stat='xg'>12.4</td></tr>"
+            "<tr><th data-stat='player'>Renato  Sanches\n</th><td data-stat='minutes'></td>"
+            "<td data-stat='xg'>0.8</td></tr></tbody>"
+            "<tfoot><tr><td>Squad Total</td><td>3,420</td><td>13.2</td></tr></tfoot></table>"
+        ),
+        # a lineup table wrapped in a div
+        (
+            "<div class='lineup'><table><tr><th colspan='2'>Lille (4-4-2)</th></tr>"
+            "<tr><td>16</td><td>Ivo Grbić</td></tr><tr><td>Bench</td><td></td></tr></table></div>"
+        ),
+        # cells that span multiple rows are not supported by the fast path
+        (
+            "<table><thead><tr><th>Squad</th><th>Pts</th></tr></thead>"
+            "<tbody><tr><td rowspan='2'>Lille</td><td>83</td></tr><tr><td>82</td></tr></tbody>"
+            "</table>"
+        ),
+    ],
+)
+def test_read_table(page: str) -> None:
+    (expected,) = pd.read_html(StringIO(page), flavor="lxml")
+    pd.testing.assert_frame_equal(_read_table(html.fromstring(page)), expected.convert_dtypes())
+
+
 @pytest.mark.parametrize(
     "stat_type",
     [
@@ -140,6 +192,20 @@ def test_read_lineup(fbref_ligue1: FBref) -> None:
     assert isinstance(fbref_ligue1.read_lineup(match_id="796787da"), pd.DataFrame)
 
 
+def test_iter_lineup(fbref_ligue1: FBref) -> None:
+    lineups = list(fbref_ligue1.iter_lineup(match_id="796787da"))
+    assert len(lineups) == 1
+    pd.testing.assert_frame_equal(lineups[0], fbref_ligue1.read_lineup(match_id="796787da"))
+
+
+def test_iter_player_match_stats(fbref_ligue1: FBref) -> None:
+    stats = list(fbref_ligue1.iter_player_match_stats(match_id="796787da"))
+    assert len(stats) == 1
+    pd.testing.assert_frame_equal(
+        stats[0], fbref_ligue1.read_player_match_stats(match_id="796787da")
+    )
+
+
 def test_concat() -> None:
     df1 = pd.DataFrame(
         columns=pd.MultiIndex.from_tuples(
@@ -37,3 +37,12 @@ def test_read_team_match_stats_alt_names(fotmob_laliga: FotMob) -> None:
         fotmob_laliga.read_team_match_stats(stat_type="Top stats", team="Valencia CF"),
         pd.DataFrame,
     )
+
+
+def test_read_team_match_stats_match_id(fotmob_laliga: FotMob) -> None:
+    schedule = fotmob_laliga.read_schedule()
+    game_id = int(schedule.loc[schedule["status"] == "FT", "game_id"].iloc[0])
+    stats = fotmob_laliga.read_team_match_stats(match_id=game_id)
+    assert len(stats) == 2
+    with pytest.raises(ValueError, match="No games with the given IDs"):
+        fotmob_laliga.read_team_match_stats(match_id=0)
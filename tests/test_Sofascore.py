@@ -1,5 +1,9 @@
 """Unittests for class soccerdata.Sofascore."""
 
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
 import pandas as pd
 
 from soccerdata.sofascore import Sofascore
@@ -34,3 +38,19 @@ def test_read_league_table(sofascore_epl_1516: Sofascore) -> None:
     league_table = sofascore_epl_1516.read_league_table()
     assert isinstance(league_table, pd.DataFrame)
     assert len(league_table) == 20
+
+
+def test_round_end(tmp_path: Path) -> None:
+    """It should return the start of the last match of a finished round."""
+    reader = Sofascore("ENG-Premier League", "15-16", data_dir=tmp_path)
+    filepath = tmp_path / "round.json"
+    assert reader._round_end(filepath) is None
+    events = [
+        {"status": {"code": 100}, "startTimestamp": 1600000000},
+        {"status": {"code": 100}, "startTimestamp": 1600003600},
+    ]
+    filepath.write_text(json.dumps({"events": events}))
+    assert reader._round_end(filepath) == datetime.fromtimestamp(1600003600, tz=timezone.utc)
+    # a truncated file is downloaded again
+    filepath.write_text(json.dumps({"events": events})[:-10])
+    assert reader._round_end(filepath) is None
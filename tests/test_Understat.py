@@ -1,9 +1,20 @@
 """Unittests for class soccerdata.Understat."""
 
+from pathlib import Path
+from typing import Optional
+from unittest.mock import MagicMock
+
 import pandas as pd
 import pytest
+from pytest_mock import MockerFixture
 
-from soccerdata.understat import Understat
+from soccerdata.understat import (
+    Understat,
+    _float_column,
+    _int_column,
+    _map_column,
+    _str_column,
+)
 
 
 def test_read_leagues(understat_epl_1516: Understat) -> None:
@@ -66,3 +77,49 @@ def test_read_shots(understat_epl_1516: Understat) -> None:
         ValueError, match="No matches found with the given IDs in the selected seasons."
     ):
         understat_epl_1516.read_shot_events(42)
+
+
+def test_iter_shots(understat_epl_1516: Understat) -> None:
+    shots = list(understat_epl_1516.iter_shot_events([460, 461]))
+    assert len(shots) == 2
+    assert all(isinstance(df, pd.DataFrame) for df in shots)
+    assert sum(len(df) for df in shots) == len(understat_epl_1516.read_shot_events([460, 461]))
+
+
+def test_column_converters() -> None:
+    assert _int_column(["1", 2]).tolist() == [1, 2]
+    assert _int_column(["1", None, "x"]).tolist() == [1, None, None]
+    assert _float_column(["0.5", 1]).tolist() == [0.5, 1.0]
+    assert _float_column(["0.5", "x"]).isna().tolist() == [False, True]
+    assert _str_column(["O&#039;Neil", None, "O&#039;Neil"]).tolist() == ["O'Neil", None, "O'Neil"]
+    assert _map_column(["Goal", "Weird", None], {"Goal": "Goal!"}).tolist() == [
+        "Goal!",
+        pd.NA,
+        pd.NA,
+    ]
+
+
+def test_api_requests_are_retried(tmp_path: Path, mocker: MockerFixture) -> None:
+    """It should retry throttled API requests like all other downloads."""
+    sleep = mocker.patch("soccerdata._common.time.sleep")
+
+    def _response(
+        status_code: int, content: bytes = b"", headers: Optional[dict] = None
+    ) -> MagicMock:
+        response = mocker.MagicMock(status_code=status_code, content=content)
+        response.headers = headers or {}
+        return response
+
+    get = mocker.patch(
+        "tls_requests.Client.get",
+        side_effect=[
+            _response(200, b"<html></html>"),  # the homepage, for the cookies
+            _response(503, headers={"Retry-After": "5"}),
+            _response(200, b'{"stat": [{"league": "EPL"}]}'),
+        ],
+    )
+    reader = Understat("ENG-Premier League", "15-16", no_store=True, data_dir=tmp_path)
+    assert reader._read_leagues() == {"statData": [{"league": "EPL"}]}
+    assert get.call_count == 3
+    assert get.call_args.args[0] == "https://understat.com/getStatData"
+    assert sleep.call_args.args[0] == pytest.approx(5, abs=1)
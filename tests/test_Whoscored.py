@@ -2,6 +2,8 @@
 
 import pandas as pd
 
+from soccerdata.whoscored import WhoScored
+
 # Unittests -------------------------------------------------------------------
 
 
@@ -11,3 +13,36 @@ def test_whoscored_missing_players(whoscored):
 
 def test_whoscored_events(whoscored):
     assert isinstance(whoscored.read_events(1485184), pd.DataFrame)
+
+
+def test_whoscored_iter_events(whoscored):
+    events = list(whoscored.iter_events(1485184))
+    assert len(events) == 1
+    pd.testing.assert_frame_equal(events[0], whoscored.read_events(1485184))
+
+
+def test_read_game_info(mocker, tmp_path):
+    page = (
+        "<div id='breadcrumb-nav'><a>England</a><span class='separator'>&gt;</span>"
+        "<a>Premier League - 2020/2021</a></div>"
+        "<div id='match-header'><div class='teams-score-info'>"
+        "<span class='home team'>Arsenal</span><span class='result'>1 : 0</span>"
+        "<span class='away team'>Chelsea</span></div>"
+        "<div class='info-block cleared'><dl><dt>Kick off:</dt><dd>20:00</dd></dl></div></div>"
+    )
+    driver = mocker.MagicMock(page_source=page)
+    driver.execute_script.return_value = page
+    mocker.patch.object(WhoScored, "_init_webdriver", return_value=driver)
+    mocker.patch("soccerdata._common.time.sleep")
+    reader = WhoScored("ENG-Premier League", "20-21", no_store=True, data_dir=tmp_path)
+    # the page is loaded through the rate limited download path
+    assert reader._read_game_info(1485184) == {
+        "league": "ENG-Premier League",
+        "season": "2021",
+        "home_team": "Arsenal",
+        "result": "1 : 0",
+        "away_team": "Chelsea",
+        "Kick off:": "20:00",
+    }
+    driver.get.assert_called_once_with("https://www.whoscored.com/Matches/1485184")
+    reader.close()
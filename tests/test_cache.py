@@ -0,0 +1,254 @@
+"""Unittests for soccerdata._cache."""
+
+import gzip
+import json
+import os
+import tarfile
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+import time_machine
+
+from soccerdata._cache import (
+    FileCache,
+    MappedFile,
+    ParseMemo,
+    SQLiteCache,
+    compress,
+    export_archive,
+    get_cache_backend,
+    import_archive,
+    open_cached,
+    read_archive_manifest,
+    recompress,
+)
+from soccerdata._common import BaseRequestsReader
+
+
+def test_file_cache(tmp_path):
+    cache = FileCache()
+    filepath = tmp_path / "data.json"
+    assert cache.lookup(filepath) is None
+    filepath.write_bytes(b"{}")
+    entry = cache.lookup(filepath)
+    assert entry is not None
+    assert entry.size == 2
+
+
+def test_sqlite_cache_record(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    filepath = tmp_path / "data.json"
+    cache.record("http://example.com/data", filepath, 2, etag='"abc"')
+    entry = cache.lookup(filepath)
+    assert entry is not None
+    assert entry.url == "http://example.com/data"
+    assert entry.etag == '"abc"'
+    assert entry.size == 2
+    assert datetime.now(timezone.utc) - entry.fetched_at < timedelta(minutes=1)
+    cache.remove(filepath)
+    assert cache.lookup(filepath) is None
+
+
+def test_sqlite_cache_legacy_file(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    filepath = tmp_path / "data.json"
+    filepath.write_bytes(b"{}")
+    entry = cache.lookup(filepath)
+    assert entry is not None
+    assert entry.url is None
+    # The file is now indexed and no longer has to exist for a lookup
+    filepath.unlink()
+    assert cache.lookup(filepath) is not None
+
+
+def test_get_cache_backend_invalid():
+    with pytest.raises(ValueError, match="Invalid cache backend"):
+        get_cache_backend("foo")
+
+
+def test_reader_with_sqlite_cache(tmp_path):
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.content = b"Rank,Club,Country\n1,Barcelona,ESP"
+    mock_resp.headers = {"ETag": '"v1"'}
+    with patch("tls_requests.Client.get", return_value=mock_resp) as mock_get:
+        reader = BaseRequestsReader()
+        reader.cache = SQLiteCache(tmp_path / "cache.sqlite")
+        url = "http://api.clubelo.com/Barcelona"
+        filepath = tmp_path / "Barcelona.csv"
+        reader.get(url, filepath)
+        reader.get(url, filepath)
+        assert mock_get.call_count == 1
+        entry = reader.cache.lookup(filepath)
+        assert entry is not None
+        assert entry.etag == '"v1"'
+        # The file was removed behind the back of the index
+        filepath.unlink()
+        assert reader.get(url, filepath).read() == mock_resp.content
+        assert mock_get.call_count == 2
+
+
+def test_open_cached_gzip(tmp_path):
+    filepath = tmp_path / "data.json"
+    filepath.write_bytes(compress(b'{"a": 1}', "gzip"))
+    with open_cached(filepath) as fh:
+        assert fh.read() == b'{"a": 1}'
+        fh.seek(0)
+        assert fh.read(1) == b"{"
+        raw = fh.myfileobj  # type: ignore[attr-defined]
+    # the compressed file is closed together with the reader
+    assert raw.closed
+
+
+def test_open_cached_mmap(tmp_path):
+    filepath = tmp_path / "data.json"
+    filepath.write_bytes(b'{"a": 1}')
+    with open_cached(filepath, use_mmap=True) as fh:
+        assert isinstance(fh, MappedFile)
+        assert fh.read(4) == b'{"a"'
+        assert fh.read() == b": 1}"
+        fh.seek(0)
+        assert json.load(fh) == {"a": 1}
+        assert fh.getbuffer().tobytes() == b'{"a": 1}'
+    # compressed and empty files are not mapped
+    filepath.write_bytes(compress(b'{"a": 1}', "gzip"))
+    with open_cached(filepath, use_mmap=True) as fh:
+        assert not isinstance(fh, MappedFile)
+        assert fh.read() == b'{"a": 1}'
+    filepath.write_bytes(b"")
+    with open_cached(filepath, use_mmap=True) as fh:
+        assert fh.read() == b""
+
+
+def test_compress_invalid_method():
+    with pytest.raises(ValueError, match="Invalid compression method"):
+        compress(b"", "lzma")
+
+
+def test_recompress_keeps_mtime(tmp_path):
+    filepath = tmp_path / "data.json"
+    filepath.write_bytes(b"{}" * 1000)
+    mtime = datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp()
+    os.utime(filepath, (mtime, mtime))
+    before, after = recompress(filepath, "gzip")
+    assert before == 2000
+    assert after < before
+    assert filepath.stat().st_mtime == mtime
+    assert open_cached(filepath).read() == b"{}" * 1000
+
+
+def test_reader_with_compression(tmp_path):
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.content = b"Rank,Club,Country\n1,Barcelona,ESP"
+    mock_resp.headers = {}
+    with patch("tls_requests.Client.get", return_value=mock_resp):
+        reader = BaseRequestsReader()
+        reader.cache_compression = "gzip"
+        filepath = tmp_path / "Barcelona.csv"
+        reader.get("http://api.clubelo.com/Barcelona", filepath)
+        assert filepath.read_bytes()[:2] == b"\x1f\x8b"
+        assert reader.get("http://api.clubelo.com/Barcelona", filepath).read() == mock_resp.content
+
+
+def test_reader_revalidates_stale_data(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.sqlite")
+    filepath = tmp_path / "Barcelona.csv"
+    url = "http://api.clubelo.com/Barcelona"
+
+    mock_resp = MagicMock()
+    mock_resp.status_code = 200
+    mock_resp.content = b"Rank,Club,Country\n1,Barcelona,ESP"
+    mock_resp.headers = {"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    not_modified = MagicMock()
+    not_modified.status_code = 304
+    not_modified.content = b""
+    not_modified.headers = {}
+    with patch("tls_requests.Client.get", side_effect=[mock_resp, not_modified]) as mock_get:
+        reader = BaseRequestsReader()
+        reader.cache = cache
+        with time_machine.travel(datetime(2020, 1, 1, tzinfo=timezone.utc)):
+            reader.get(url, filepath)
+        data = reader.get(url, filepath, max_age=1)
+
+        assert mock_get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+        assert data.read() == mock_resp.content
+        # The cached data was refreshed
+        entry = cache.lookup(filepath)
+        assert entry is not None
+        assert datetime.now(timezone.utc) - entry.fetched_at < timedelta(1)
+
+
+def test_parse_memo(tmp_path):
+    memo = ParseMemo(tmp_path)
+    calls = []
+
+    def _parse(content):
+        calls.append(content)
+        return json.loads(content)
+
+    assert memo.get("test", b'{"a": 1}', _parse) == {"a": 1}
+    assert memo.get("test", b'{"a": 1}', _parse) == {"a": 1}
+    assert len(calls) == 1
+    # Different data or another parse function are parsed again
+    memo.get("test", b'{"a": 2}', _parse)
+    memo.get("other", b'{"a": 1}', _parse)
+    assert len(calls) == 3
+    assert len(list(tmp_path.rglob("*.pkl"))) == 3
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_export_import_archive(tmp_path):
+    source = tmp_path / "source"
+    (source / "matches").mkdir(parents=True)
+    (source / "matches" / "1.json").write_bytes(b'{"id": 1}')
+    (source / "schedule.json").write_bytes(gzip.compress(b"[]"))
+    cache = SQLiteCache(tmp_path / "source.sqlite")
+    cache.record("http://a.test/1", source / "matches" / "1.json", size=9, etag='"v1"')
+    source_entry = cache.lookup(source / "matches" / "1.json")
+    assert source_entry is not None
+    fetched_at = source_entry.fetched_at
+
+    archive = tmp_path / "cache.tar.gz"
+    files = [source / "matches" / "1.json", source / "schedule.json"]
+    export_archive(archive, source, files, cache, method="gzip", metadata={"reader": "Test"})
+    assert read_archive_manifest(archive)["reader"] == "Test"
+
+    target = tmp_path / "target"
+    target_cache = SQLiteCache(tmp_path / "target.sqlite")
+    assert import_archive(archive, target, target_cache) == 2
+    assert (target / "matches" / "1.json").read_bytes() == b'{"id": 1}'
+    # compressed files are copied as they are
+    assert (target / "schedule.json").read_bytes() == (source / "schedule.json").read_bytes()
+    entry = target_cache.lookup(target / "matches" / "1.json")
+    assert entry is not None
+    assert entry.url == "http://a.test/1"
+    assert entry.etag == '"v1"'
+    assert entry.fetched_at == fetched_at
+
+    # files that are already cached are not overwritten by older copies
+    assert import_archive(archive, target, target_cache) == 0
+
+
+def test_import_archive_file_cache(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "data.csv").write_bytes(b"a,b")
+    os.utime(source / "data.csv", (1_600_000_000, 1_600_000_000))
+    archive = tmp_path / "cache.tar"
+    export_archive(archive, source, [source / "data.csv"], FileCache(), method="none")
+
+    assert import_archive(archive, tmp_path / "target", FileCache()) == 1
+    assert (tmp_path / "target" / "data.csv").stat().st_mtime == 1_600_000_000
+
+
+def test_import_archive_invalid(tmp_path):
+    archive = tmp_path / "cache.tar"
+    with tarfile.open(archive, mode="w") as tar:
+        tar.add(__file__, arcname="data.csv")
+    with pytest.raises(ValueError, match="not a soccerdata cache archive"):
+        import_archive(archive, tmp_path, FileCache())
@@ -1,21 +1,43 @@
 """Unittests for soccerdata._common."""
 
+import asyncio
+import inspect
+import io
+import itertools
 import json
-from datetime import datetime, timezone
+import math
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 import time_machine
+import tls_requests
 
 import soccerdata
 from soccerdata._common import (
+    AsyncBaseRequestsReader,
     BaseRequestsReader,
+    BaseSeleniumReader,
+    CircuitBreaker,
+    DriverPool,
+    RateLimiter,
     SeasonCode,
     add_alt_team_names,
     add_standardized_team_name,
+    extract_json_var,
+    load_json,
     make_game_id,
+    make_game_ids,
+    parse_retry_after,
     standardize_colnames,
+    standardize_team_names,
+    to_arrow,
+    to_parquet,
 )
 
 # _download_and_save
@@ -31,6 +53,7 @@ def mock_tls_client():
             mock_resp = MagicMock()
             mock_resp.content = content.encode("utf-8")
             mock_resp.status_code = 200
+            mock_resp.headers = {}
             mock_resp.raise_for_status = lambda: None
             mock_get.return_value = mock_resp
             return mock_get
@@ -51,6 +74,7 @@ def mock_tls_client():
             mock_resp = MagicMock()
             mock_resp.content = html.encode("utf-8")
             mock_resp.status_code = 200
+            mock_resp.headers = {}
             mock_resp.raise_for_status = lambda: None
             mock_get.return_value = mock_resp
             return mock_get
@@ -150,6 +174,509 @@ def test_download_and_save_variable_no_store_no_filepath(mock_tls_client):
     assert stats["statData"]["player"] == "Messi"
 
 
+def _echo_url(url, *args, **kwargs):
+    mock_resp = MagicMock()
+    mock_resp.content = url.encode("utf-8")
+    mock_resp.status_code = 200
+    mock_resp.headers = {}
+    mock_resp.raise_for_status = lambda: None
+    return mock_resp
+
+
+def _status_response(status_code, headers=None):
+    mock_resp = MagicMock()
+    mock_resp.content = b"Rank,Club,Country\n1,Barcelona,ESP"
+    mock_resp.status_code = status_code
+    mock_resp.headers = headers or {}
+    return mock_resp
+
+
+def test_retry_after_throttled(mocker, mock_tls_client):
+    sleep = mocker.patch("soccerdata._common.time.sleep")
+    mock_tls_client.side_effect = [
+        _status_response(429, {"Retry-After": "30"}),
+        _status_response(200),
+    ]
+    reader = BaseRequestsReader(no_store=True)
+    assert reader.get("http://throttled.test/").read().startswith(b"Rank")
+    # the delay requested by the host is respected
+    assert sleep.call_args[0][0] == pytest.approx(30, abs=1)
+    assert mock_tls_client.call_count == 2
+
+
+def test_no_retry_on_client_error(mocker, mock_tls_client):
+    mocker.patch("soccerdata._common.time.sleep")
+    mock_tls_client.return_value = _status_response(404)
+    reader = BaseRequestsReader(no_store=True)
+    with pytest.raises(ConnectionError, match="status 404"):
+        reader.get("http://not-found.test/")
+    assert mock_tls_client.call_count == 1
+
+
+def test_retry_block_page(mocker, mock_tls_client):
+    mocker.patch("soccerdata._common.time.sleep")
+    blocked = _status_response(200)
+    blocked.content = b"<html>Incapsula incident ID: 123</html>"
+    mock_tls_client.side_effect = [blocked, _status_response(200)]
+    reader = BaseRequestsReader(no_store=True)
+    assert reader.get("http://block-page.test/").read().startswith(b"Rank")
+    assert mock_tls_client.call_count == 2
+
+
+def test_circuit_breaker(mocker):
+    sleep = mocker.patch("soccerdata._common.time.sleep")
+    breaker = CircuitBreaker("breaker.test", threshold=2, pause=10, max_pause=15)
+    breaker.wait()
+    breaker.record_block()
+    breaker.wait()
+    sleep.assert_not_called()
+    # the breaker opens after two consecutive blocks
+    breaker.record_block()
+    breaker.wait()
+    assert sleep.call_args[0][0] == pytest.approx(10, abs=1)
+    # the pause doubles, up to max_pause
+    breaker.record_block()
+    breaker.record_block()
+    breaker.wait()
+    assert sleep.call_args[0][0] == pytest.approx(15, abs=1)
+    assert CircuitBreaker.for_host("breaker.test") is CircuitBreaker.for_host("breaker.test")
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    retry_at = datetime.now(tz=timezone.utc) + timedelta(minutes=2)
+    date = retry_at.strftime("%a, %d %b %Y %H:%M:%S GMT")
+    assert parse_retry_after(date) == pytest.approx(120, abs=2)
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_get_many(tmp_path, mock_tls_client):
+    mock_tls_client.side_effect = _echo_url
+
+    reader = BaseRequestsReader()
+    reader.max_concurrency = 3
+    urls = [f"http://get-many.test/{i}" for i in range(10)]
+    data = reader.get_many((url, tmp_path / f"{i}.txt") for i, url in enumerate(urls))
+
+    # results are returned in the order of the requests
+    assert [d.read().decode("utf-8") for d in data] == urls
+    assert all((tmp_path / f"{i}.txt").exists() for i in range(10))
+
+
+def test_get_many_max_concurrency(tmp_path, mock_tls_client):
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def _slow_get(url, *args, **kwargs):
+        with lock:
+            in_flight.append(url)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(url)
+        return _echo_url(url)
+
+    mock_tls_client.side_effect = _slow_get
+
+    reader = BaseRequestsReader(no_store=True)
+    reader.max_concurrency = 2
+    urls = [f"http://max-concurrency.test/{i}" for i in range(6)]
+    data = list(reader.get_many((url, None) for url in urls))
+
+    assert len(data) == 6
+    assert max(max_in_flight) == 2
+
+    # the limit of a reader does not depend on the readers created before it
+    in_flight.clear()
+    max_in_flight.clear()
+    reader.max_concurrency = 3
+    assert len(list(reader.get_many((url, None) for url in urls))) == 6
+    assert max(max_in_flight) == 3
+
+
+def test_driver_pool():
+    drivers = []
+
+    def _start():
+        drivers.append(MagicMock())
+        return drivers[-1]
+
+    pool = DriverPool(_start, size=2, max_uses=3)
+    with pool.acquire() as d1, pool.acquire() as d2:
+        assert d1 is not d2
+    # idle drivers are reused
+    with pool.acquire() as d3:
+        assert d3 in (d1, d2)
+    assert len(drivers) == 2
+    # a driver that fails is replaced
+    with pytest.raises(ValueError), pool.acquire() as d4:
+        raise ValueError()
+    d4.quit.assert_called_once()
+    # a driver is replaced after max_uses uses
+    assert d4 is not d3
+    for _ in range(3):
+        with pool.acquire():
+            pass
+    d3.quit.assert_called_once()
+    assert len(drivers) == 3
+    pool.close()
+    assert all(d.quit.called for d in drivers)
+    with pytest.raises(RuntimeError), pool.acquire():
+        pass
+
+
+def test_driver_pool_concurrency():
+    lock = threading.Lock()
+    in_use = []
+    max_in_use = []
+
+    def _use(pool):
+        with pool.acquire() as driver:
+            with lock:
+                assert driver not in in_use
+                in_use.append(driver)
+                max_in_use.append(len(in_use))
+            time.sleep(0.02)
+            with lock:
+                in_use.remove(driver)
+
+    pool = DriverPool(MagicMock, size=3)
+    threads = [threading.Thread(target=_use, args=(pool,)) for _ in range(9)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(max_in_use) == 3
+
+
+def _mock_driver():
+    driver = MagicMock()
+    driver.page_source = ""
+    driver.get_cookies.return_value = [{"name": "session", "value": "abc"}]
+    driver.execute_script.side_effect = lambda script: (
+        "Mozilla/5.0" if "userAgent" in script else "browser"
+    )
+    return driver
+
+
+def test_selenium_reader_http_first(mocker, mock_tls_client):
+    mocker.patch.object(BaseSeleniumReader, "_init_webdriver", side_effect=_mock_driver)
+    reader = BaseSeleniumReader(no_store=True, http_first=True)
+    reader.http_rate_limit = 0
+    mock_tls_client.side_effect = _echo_url
+
+    # the first page is loaded in the browser to obtain the cookies
+    assert reader.get("http://http-first.test/1").read() == b"browser"
+    assert reader.get("http://http-first.test/2").read() == b"http://http-first.test/2"
+    # variables are read from the page if they are embedded as JSON
+    mock_tls_client.side_effect = lambda url, **kwargs: _echo_url('<script>x = {"a": 1};</script>')
+    assert reader.get("http://http-first.test/3", var="x").read() == b'{"a": 1}'
+    # ... and evaluated in the browser otherwise
+    assert reader.get("http://http-first.test/3", var="y").read() == b'"browser"'
+    # the browser is used when the HTTP client is blocked
+    mock_tls_client.side_effect = lambda url, **kwargs: _echo_url("Incapsula incident ID")
+    assert reader.get("http://http-first.test/4").read() == b"browser"
+    mock_tls_client.side_effect = lambda url, **kwargs: _echo_url("window._cf_chl_opt = {}")
+    assert reader.get("http://http-first.test/5").read() == b"browser"
+    # ... or when the request fails
+    mock_tls_client.side_effect = TimeoutError("timed out")
+    assert reader.get("http://http-first.test/6").read() == b"browser"
+    reader.close()
+
+
+def test_selenium_reader_http_first_reuses_proxy(mocker, mock_tls_client):
+    mocker.patch("soccerdata._common.sb.Driver", side_effect=lambda **kwargs: _mock_driver())
+    client = mocker.patch("tls_requests.Client", wraps=tls_requests.Client)
+    proxies = itertools.count()
+    reader = BaseSeleniumReader(
+        no_store=True, http_first=True, proxy=lambda: f"http://proxy-{next(proxies)}.test"
+    )
+    reader.http_rate_limit = 0
+    mock_tls_client.side_effect = _echo_url
+
+    assert reader.get("http://http-first-proxy.test/1").read() == b"browser"
+    assert reader.get("http://http-first-proxy.test/2").read() == b"http://http-first-proxy.test/2"
+    # the cookies are replayed from the IP address of the browser that earned them
+    assert client.call_args.kwargs["proxy"] == "http://proxy-0.test"
+    reader.close()
+
+
+def test_extract_json_var():
+    page = (
+        "<script>var matchCentreData = require.config.params;\n"
+        'require.config.params["args"] = {\n'
+        "  matchId: 1,\n"
+        '  matchCentreData: {"a": "}{\\"]", "b": [1, {"c": null}], "d": "Ivo Grbić"},\n'
+        "  formationIdNameMappings: {foo: 1}\n"
+        "};\n"
+        "var allRegions = [{'id': 1}];\n"
+        "var wsCalendar = null;</script>"
+    ).encode()
+    value = extract_json_var(page, "require.config.params['args'].matchCentreData")
+    assert value is not None
+    assert json.loads(value) == {"a": '}{"]', "b": [1, {"c": None}], "d": "Ivo Grbić"}
+    assert extract_json_var(page, "wsCalendar") == b"null"
+    # JavaScript object literals are not valid JSON
+    assert extract_json_var(page, "formationIdNameMappings") is None
+    assert extract_json_var(page, "allRegions") is None
+    assert extract_json_var(page, "Data") is None
+
+
+def test_async_get_many(tmp_path, mock_tls_client):
+    mock_tls_client.side_effect = _echo_url
+
+    async def _read():
+        async with AsyncBaseRequestsReader() as reader:
+            reader.max_concurrency = 3
+            urls = [f"http://async-get-many.test/{i}" for i in range(5)]
+            return await reader.get_many(
+                (url, tmp_path / f"{i}.txt") for i, url in enumerate(urls)
+            )
+
+    data = asyncio.run(_read())
+    assert [d.read().decode() for d in data] == [
+        f"http://async-get-many.test/{i}" for i in range(5)
+    ]
+    assert (tmp_path / "4.txt").exists()
+
+
+def test_async_reader_forwards_attributes():
+    reader = AsyncBaseRequestsReader(no_store=True)
+    reader.rate_limit = 5
+    assert reader._reader.rate_limit == 5
+    assert reader.no_store
+
+
+def test_needs_refresh(tmp_path):
+    reader = BaseRequestsReader()
+    filepath = tmp_path / "page.json"
+    end = datetime(2020, 1, 10, tzinfo=timezone.utc)
+    filepath.write_text("{}")
+    fetched_at = datetime(2020, 1, 11, tzinfo=timezone.utc).timestamp()
+    os.utime(filepath, (fetched_at, fetched_at))
+    # By default, all pages of a running season are refreshed
+    assert reader._needs_refresh(filepath, end)
+    reader.incremental_lookback = timedelta(days=1)
+    assert not reader._needs_refresh(filepath, end)
+    assert reader._needs_refresh(filepath, None)
+    assert reader._needs_refresh(tmp_path / "missing.json", end)
+    reader.incremental_lookback = timedelta(days=2)
+    assert reader._needs_refresh(filepath, end)
+
+
+class _CountingReader(BaseRequestsReader):
+    def __init__(self, data_dir):
+        super().__init__(data_dir=data_dir)
+        self.calls = 0
+
+    def read_data(self, no_cache=False):
+        self.calls += 1
+        reader = self.get(
+            "http://result-cache.test/", self.data_dir / "data.csv", no_cache=no_cache
+        )
+        return pd.read_csv(reader)
+
+
+def test_result_cache(tmp_path, mock_tls_client):
+    mock_tls_client.return_csv()
+    reader = _CountingReader(tmp_path)
+    reader.result_cache = True
+
+    df = reader.read_data()
+    pd.testing.assert_frame_equal(reader.read_data(), df)
+    assert reader.calls == 1
+    assert mock_tls_client.call_count == 1
+    # the temporary files of the result cache are moved into place
+    assert list(tmp_path.rglob("*.pkl"))
+    assert not list(tmp_path.rglob("*.tmp"))
+
+    # The result is invalidated when the raw data is downloaded again
+    reader.get("http://result-cache.test/", tmp_path / "data.csv", no_cache=True)
+    os.utime(tmp_path / "data.csv", (0, 0))
+    reader.read_data()
+    assert reader.calls == 2
+
+    # An unreadable entry is computed again
+    for path in tmp_path.glob("results/*"):
+        path.write_bytes(b"\x1f\x8b")
+    pd.testing.assert_frame_equal(reader.read_data(), df)
+    assert reader.calls == 3
+
+
+def test_result_cache_skips_downloaded_data(tmp_path, mock_tls_client):
+    mock_tls_client.return_csv()
+    reader = _CountingReader(tmp_path)
+    reader.result_cache = True
+
+    reader.read_data(no_cache=True)
+    reader.read_data(no_cache=True)
+    assert reader.calls == 2
+
+
+class _ScheduleReader(BaseRequestsReader):
+    def __init__(self, data_dir):
+        super().__init__(data_dir=data_dir)
+        self.calls = 0
+
+    def read_schedule(self, force_cache=False):
+        self.calls += 1
+        reader = self.get(
+            "http://memo.test/", self.data_dir / "schedule.csv", no_cache=not force_cache
+        )
+        return pd.read_csv(reader)
+
+    def read_games(self):
+        self.read_schedule(force_cache=False)
+        return self.read_schedule(force_cache=False)
+
+
+def test_memo(tmp_path, mock_tls_client):
+    mock_tls_client.return_csv()
+    reader = _ScheduleReader(tmp_path)
+
+    df = reader.read_schedule(force_cache=True)
+    df["Rank"] = 0  # modifying the result does not affect the memo
+    assert reader.read_schedule(force_cache=True)["Rank"].tolist() == [1]
+    assert reader.calls == 1
+
+    # The memo is invalidated when the raw data is downloaded again
+    os.utime(tmp_path / "schedule.csv", (0, 0))
+    reader.read_schedule(force_cache=True)
+    assert reader.calls == 2
+
+
+def test_memo_refreshed_data(tmp_path, mock_tls_client):
+    mock_tls_client.return_csv()
+    reader = _ScheduleReader(tmp_path)
+
+    # Data that is refreshed on each call is only reused within a call
+    reader.read_games()
+    assert reader.calls == 1
+    reader.read_schedule()
+    assert reader.calls == 2
+    assert mock_tls_client.call_count == 2
+
+
+def test_export_import_cache(tmp_path, mocker):
+    mocker.patch.object(
+        soccerdata.MatchHistory,
+        "_all_leagues",
+        return_value={"ENG-Premier League": "E0", "ESP-La Liga": "SP1"},
+    )
+    reader = soccerdata.MatchHistory("ENG-Premier League", "2021", data_dir=tmp_path / "a")
+    for name in [
+        "ENG-Premier League_2021.csv",
+        "ENG-Premier League_1920.csv",
+        "ESP-La Liga_2021.csv",
+    ]:
+        (reader.data_dir / name).write_text("Div\nE0")
+    (reader.data_dir / "results").mkdir()
+    (reader.data_dir / "results" / "result.pkl").write_bytes(b"")
+
+    assert reader.export_cache(tmp_path / "cache.tar.gz") == 1
+    other = soccerdata.MatchHistory("ENG-Premier League", "2021", data_dir=tmp_path / "b")
+    assert other.import_cache(tmp_path / "cache.tar.gz") == 1
+    assert [path.name for path in other.data_dir.iterdir()] == ["ENG-Premier League_2021.csv"]
+
+    with pytest.raises(ValueError, match="contains data of MatchHistory"):
+        _CountingReader(tmp_path / "c").import_cache(tmp_path / "cache.tar.gz")
+
+
+def _read_data(reader: _CountingReader, output: str) -> Any:
+    # The output argument is added by _cache_result, so type checkers do not
+    # know about it
+    kwargs: dict[str, Any] = {"output": output}
+    return reader.read_data(**kwargs)
+
+
+def test_read_output(tmp_path, mock_tls_client):
+    mock_tls_client.return_csv()
+    reader = _CountingReader(tmp_path)
+    assert "output" in inspect.signature(_CountingReader.read_data).parameters
+    assert isinstance(_read_data(reader, "pandas"), pd.DataFrame)
+    with pytest.raises(ValueError, match="Invalid output format"):
+        _read_data(reader, "csv")
+
+
+def test_read_output_arrow(tmp_path, mock_tls_client):
+    pytest.importorskip("pyarrow")
+    mock_tls_client.return_csv()
+    reader = _CountingReader(tmp_path)
+    table = _read_data(reader, "arrow")
+    assert table.column_names == ["Rank", "Club", "Country"]
+    assert table.to_pandas().equals(reader.read_data())
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_json(mocker, use_orjson):
+    if not use_orjson:
+        mocker.patch("soccerdata._common.orjson", None)
+    assert load_json(b'{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+    assert load_json('{"a": "\\u00e9"}') == {"a": "\u00e9"}
+    assert load_json(io.BytesIO(b'{"a": 1}')) == {"a": 1}
+    assert load_json(io.BufferedReader(io.BytesIO(b"[1]"))) == [1]
+    # documents that orjson rejects are decoded with the json module
+    assert math.isnan(load_json(io.BytesIO(b'{"a": NaN}'))["a"])
+
+
+def test_to_arrow_index_and_columns():
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        [[1, 2]],
+        index=pd.MultiIndex.from_tuples(
+            [("ENG-Premier League", "2021")], names=["league", "season"]
+        ),
+        columns=pd.MultiIndex.from_tuples([("Performance", "Gls"), ("Performance", "Ast")]),
+    )
+    assert to_arrow(df).column_names == ["league", "season", "Performance_Gls", "Performance_Ast"]
+
+
+def test_to_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    df = pd.DataFrame(
+        {"league": ["ENG-Premier League", "ESP-La Liga"], "season": ["2021", "2021"], "x": [1, 2]}
+    ).set_index(["league", "season"])
+    to_parquet(df, tmp_path / "data")
+    assert len(list((tmp_path / "data").glob("league=*/season=2021/*.parquet"))) == 2
+    assert pq.read_table(tmp_path / "data").num_rows == 2
+    to_parquet(df, tmp_path / "data.parquet", partition_by=None)
+    assert pq.read_table(tmp_path / "data.parquet").column_names == ["league", "season", "x"]
+
+
+def test_rate_limit_shared_between_instances(mock_tls_client):
+    mock_tls_client.side_effect = _echo_url
+
+    readers = [BaseRequestsReader(no_store=True) for _ in range(2)]
+    for reader in readers:
+        reader.rate_limit = 0.1
+    start = time.time()
+    for i in range(4):
+        readers[i % 2].get(f"http://rate-limit.test/{i}", None)
+    # The first request is sent immediately, the next three are spaced out
+    assert time.time() - start >= 0.3
+
+
+def test_rate_limit_shared_between_processes(tmp_path):
+    lock_file = tmp_path / "host.lock"
+    limiters = [RateLimiter(lock_file), RateLimiter(lock_file)]
+    start = time.time()
+    for i in range(4):
+        limiters[i % 2].wait(0.1)
+    assert time.time() - start >= 0.3
+
+
+def test_rate_limit_subtracts_elapsed_time():
+    limiter = RateLimiter()
+    limiter.wait(0.2)
+    time.sleep(0.2)
+    start = time.time()
+    limiter.wait(0.2)
+    assert time.time() - start < 0.1
+
+
 # def test_download_and_save_requests_tor(tmp_path):
 #     url = "https://check.torproject.org/api/ip"
 #     reader = BaseRequestsReader(proxy=None)
@@ -189,6 +716,29 @@ def test_make_game_id():
     assert game_id == "1993-07-30 Barcelona-Real Madrid"
 
 
+@pytest.mark.parametrize(
+    "dates",
+    [
+        pd.to_datetime(["1993-07-30 20:00", "1994-01-01 23:30", None]),
+        pd.to_datetime(["1993-07-30 20:00", "1994-01-01 23:30", None], utc=True),
+        [datetime(1993, 7, 30, tzinfo=timezone.utc), datetime(1994, 1, 1), None],
+        [datetime(1993, 7, 30).date(), datetime(1994, 1, 1).date(), None],
+    ],
+)
+def test_make_game_ids(dates):
+    df = pd.DataFrame(
+        {
+            "date": dates,
+            "home_team": ["Barcelona", "Getafe", "Sevilla"],
+            "away_team": ["Real Madrid", None, float("nan")],
+        },
+        index=[3, 1, 2],
+    )
+    game_ids = make_game_ids(df)
+    pd.testing.assert_series_equal(game_ids, df.apply(make_game_id, axis=1))
+    assert game_ids[3] == "1993-07-30 Barcelona-Real Madrid"
+
+
 # add_alt_team_names
 
 
@@ -206,6 +756,30 @@ def test_add_standardize_team_name():
     assert add_standardized_team_name("Arsenal") == {"Arsenal"}
 
 
+# standardize_team_names
+
+
+def test_standardize_team_names():
+    df = pd.DataFrame(
+        {
+            "home_team": ["Valencia", "Arsenal", None],
+            "away_team": ["Arsenal", "Valencia", "Valencia"],
+            "team": ["Valencia", "Valencia", "Valencia"],
+        }
+    )
+    std_df = standardize_team_names(df, cols=["home_team", "away_team", "missing"])
+    assert std_df["home_team"].tolist() == ["Valencia CF", "Arsenal", None]
+    assert std_df["away_team"].tolist() == ["Arsenal", "Valencia CF", "Valencia CF"]
+    # other columns are not replaced
+    assert std_df["team"].tolist() == ["Valencia", "Valencia", "Valencia"]
+    # the original dataframe is not modified
+    assert df["home_team"].tolist() == ["Valencia", "Arsenal", None]
+    # by default, the "team" column is replaced
+    pd.testing.assert_frame_equal(
+        standardize_team_names(df), df.replace({"team": {"Valencia": "Valencia CF"}})
+    )
+
+
 # standardize_colnames
 
 
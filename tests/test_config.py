@@ -61,6 +61,7 @@ def test_read_teamnname_replacements(monkeypatch, tmp_path):
         "Celta Vigo": "Celta de Vigo",
         "Celta": "Celta de Vigo",
     }
+    assert conf.TEAMNAME_ALTERNATIVES == {"Celta de Vigo": {"Celta Vigo", "Celta"}}
 
 
 def test_read_league_dict(monkeypatch, tmp_path):
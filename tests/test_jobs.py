@@ -0,0 +1,62 @@
+"""Unittests for soccerdata._jobs."""
+
+import pandas as pd
+import pytest
+
+from soccerdata import ScrapeJob
+from soccerdata._common import BaseRequestsReader
+
+
+class _GameReader(BaseRequestsReader):
+    def __init__(self, data_dir):
+        super().__init__(data_dir=data_dir)
+        self.failing: set[int] = set()
+        self.calls: list[int] = []
+
+    def read_schedule(self):
+        return pd.DataFrame(
+            {
+                "league": "ENG-Premier League",
+                "season": "2021",
+                "game": ["a", "b", "c"],
+                "game_id": [1, 2, 3],
+            }
+        ).set_index(["league", "season", "game"])
+
+    def read_stats(self, match_id=None, scale=1):
+        self.calls.append(match_id)
+        if match_id in self.failing:
+            raise ConnectionError(f"Could not download {match_id}.")
+        return pd.DataFrame({"game_id": [match_id], "value": [match_id * scale]})
+
+
+def test_scrape_job(tmp_path):
+    reader = _GameReader(tmp_path)
+    reader.failing = {2}
+    status = ScrapeJob(reader, "read_stats", max_attempts=2, scale=10).run()
+
+    assert status["status"].to_dict() == {1: "done", 2: "failed", 3: "done"}
+    assert status.loc[2, "error"] == "ConnectionError: Could not download 2."
+    # failing games are retried at the end of the run
+    assert reader.calls == [1, 2, 3, 2]
+
+    # resuming the job only scrapes the games that are not done
+    reader.failing = set()
+    job = ScrapeJob(reader, "read_stats", max_attempts=2, scale=10)
+    assert job.run()["status"].eq("done").all()
+    assert reader.calls == [1, 2, 3, 2, 2]
+    assert job.status().loc[2, "attempts"] == 3
+    assert job.result()["value"].tolist() == [10, 20, 30]
+    # all temporary files were moved into place
+    assert not list(job.path.rglob("*.tmp"))
+
+
+def test_scrape_job_invalid(tmp_path):
+    reader = _GameReader(tmp_path)
+    with pytest.raises(ValueError, match="does not accept a match_id"):
+        ScrapeJob(reader, "read_schedule")
+    with pytest.raises(ValueError, match="has no method"):
+        ScrapeJob(reader, "read_lineups")
+    ScrapeJob(reader, "read_stats", name="stats", match_id=[1]).run()
+    with pytest.raises(ValueError, match="A different job named 'stats'"):
+        ScrapeJob(reader, "read_stats", name="stats", scale=2).run()
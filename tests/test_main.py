@@ -0,0 +1,130 @@
+"""Unittests for the soccerdata command line interface."""
+
+import gzip
+import io
+import json
+
+import pandas as pd
+
+import soccerdata
+from soccerdata.__main__ import _warm, main, recent_games
+
+
+def test_compress_cache(tmp_path):
+    (tmp_path / "FBref").mkdir()
+    page = tmp_path / "FBref" / "page.html"
+    page.write_bytes(b"<html></html>" * 100)
+    (tmp_path / "cache.sqlite").write_bytes(b"index")
+
+    assert main(["compress-cache", str(tmp_path), "--method", "gzip"]) == 0
+    assert gzip.decompress(page.read_bytes()) == b"<html></html>" * 100
+    assert (tmp_path / "cache.sqlite").read_bytes() == b"index"
+
+    assert main(["compress-cache", str(tmp_path), "--method", "none"]) == 0
+    assert page.read_bytes() == b"<html></html>" * 100
+
+
+def test_compress_cache_skips_internal_files(tmp_path):
+    internal = [
+        tmp_path / "FBref" / "results" / "FBref.read_schedule.abc.pkl",
+        tmp_path / "FBref" / "results" / "FBref.read_schedule.abc.json",
+        tmp_path / "FBref" / "parsed" / "fbref-table" / "abc.pkl",
+        tmp_path / "FBref" / "jobs" / "read_events_abc" / "manifest.json",
+        tmp_path / "FBref" / "page.tmp",
+        tmp_path / ".ratelimit" / "fbref.com",
+    ]
+    for path in internal:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"{}" * 100)
+
+    assert main(["compress-cache", str(tmp_path), "--method", "gzip"]) == 0
+    assert all(path.read_bytes() == b"{}" * 100 for path in internal)
+
+
+def test_recent_games():
+    schedule = pd.DataFrame(
+        {
+            "date": pd.to_datetime(
+                ["2024-05-01 12:00", "2024-05-02 12:00", "2024-05-02 17:00", "2024-05-02 18:00"]
+            ),
+            "game_id": [1, 2, None, 4],
+        }
+    )
+    now = pd.Timestamp("2024-05-02 19:00", tz="UTC")
+    assert recent_games(schedule, hours=24, now=now) == [2]
+    assert recent_games(schedule, hours=48, now=now) == [1, 2]
+
+
+def test_recent_games_fbref():
+    # FBref has the date and the kick-off time in separate columns
+    schedule = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-05-01", "2024-05-02", "2024-05-02"]),
+            "time": ["20:00", "15:30 (16:30)", None],
+            "game_id": ["a", "b", "c"],
+        }
+    )
+    now = pd.Timestamp("2024-05-02 18:00", tz="UTC")
+    assert recent_games(schedule, hours=24, now=now) == ["a", "b"]
+    assert recent_games(schedule, hours=24, now=now + pd.Timedelta(hours=8)) == ["b", "c"]
+
+
+def test_warm(tmp_path, mocker):
+    reader = soccerdata.ESPN("ITA-Serie A", "20-21", no_store=True, data_dir=tmp_path)
+    mocker.patch.object(
+        reader,
+        "read_schedule",
+        return_value=pd.DataFrame(
+            {
+                "league": "ITA-Serie A",
+                "season": "2021",
+                "game": ["2021-05-23 Home FC-Away FC", "2021-05-30 Away FC-Home FC"],
+                "date": [
+                    pd.Timestamp.now(tz="UTC") - pd.Timedelta(hours=3),
+                    pd.Timestamp.now(tz="UTC") + pd.Timedelta(days=7),
+                ],
+                "game_id": [42, 43],
+                "league_id": "ita.1",
+            }
+        ).set_index(["league", "season", "game"]),
+    )
+    summary = {
+        "boxscore": {
+            "form": [{"team": {"displayName": "Home FC"}}, {"team": {"displayName": "Away FC"}}],
+            "teams": [{}, {}],
+        },
+        "gameInfo": {},
+        "rosters": [{}, {}],
+    }
+    get = mocker.patch.object(
+        reader, "get", side_effect=lambda *args, **kwargs: io.BytesIO(json.dumps(summary).encode())
+    )
+    _warm("ESPN", reader, hours=24)
+    get.assert_called_once()
+    assert get.call_args.args[0].endswith("/ita.1/summary?event=42")
+
+    mocker.patch("soccerdata.ESPN", return_value=reader)
+    assert main(["warm", "ESPN", "--leagues", "ITA-Serie A", "--seasons", "2021"]) == 0
+    assert get.call_count == 2
+
+
+def test_export_import_cache(tmp_path, mocker):
+    mocker.patch("soccerdata.__main__.DATA_DIR", tmp_path)
+    mocker.patch.object(
+        soccerdata.MatchHistory, "_all_leagues", return_value={"ENG-Premier League": "E0"}
+    )
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "ENG-Premier League_2021.csv").write_text("Div\nE0")
+    reader = soccerdata.MatchHistory("ENG-Premier League", "2021", data_dir=source)
+    mocker.patch("soccerdata.MatchHistory", return_value=reader)
+
+    archive = tmp_path / "cache.tar.gz"
+    assert (
+        main(["export-cache", "MatchHistory", str(archive), "--leagues", "ENG-Premier League"])
+        == 0
+    )
+    assert main(["import-cache", str(archive)]) == 0
+    assert (tmp_path / "source" / "ENG-Premier League_2021.csv").exists()
+    assert main(["import-cache", str(archive), "--data-dir", str(tmp_path / "b")]) == 0
+    assert (tmp_path / "b" / "ENG-Premier League_2021.csv").read_text() == "Div\nE0"